@@ -0,0 +1,121 @@
+"""
+게임 텍스처를 하나의 아틀라스 이미지로 묶어 관리하는 모듈입니다.
+
+res/의 원본 이미지들을 TILE_SIZE로 미리 축소/확대하고, 머리 이미지는 head_right.png 하나를 회전시켜
+네 방향을 만든 뒤 가로 한 줄(스트립)로 이어 붙여 res/atlas_<TILE_SIZE>.png로 저장합니다.
+렌더러는 실행 시 이 파일 하나만 읽고 변환(convert_alpha)한 뒤, 스프라이트마다 픽셀을 복사하지 않는
+subsurface 뷰를 사용합니다.
+
+아틀라스 다시 만들기 (res/의 이미지를 수정했을 때):
+    python assets.py            # config.TILE_SIZE 기준
+    python assets.py --tile-size 32
+"""
+import argparse
+import os
+import sys
+from typing import Dict, Optional
+
+import pygame
+
+import config
+
+# 아틀라스에 들어가는 스프라이트의 순서입니다. (i번째 스프라이트는 x = i * tile_size 위치에 놓입니다)
+# 방향 벡터: (row, col)
+ATLAS_SPRITES = ("tile", "apple", "body", (0, 1), (-1, 0), (0, -1), (1, 0))
+# 머리 이미지는 오른쪽을 보는 원본 하나를 회전시켜 만듭니다. (pygame.transform.rotate는 반시계 방향)
+HEAD_ROTATIONS = {(0, 1): 0, (-1, 0): 90, (0, -1): 180, (1, 0): -90}
+SOURCE_FILES = {"tile": "tile.png", "apple": "apple.png", "body": "body.png", "head": "head_right.png"}
+
+# 변환까지 끝난 아틀라스 Surface (타일 크기별로 한 번만 만듭니다)
+_atlas_cache = {}
+
+
+def resource_dir() -> str:
+    """res/ 폴더의 경로를 반환합니다. PyInstaller로 빌드된 실행 파일에서는 압축이 풀린 임시 폴더를 사용합니다."""
+    if hasattr(sys, "_MEIPASS"):
+        # PyInstaller는 임시 폴더에 데이터를 압축 해제하고 그 경로를 _MEIPASS에 저장합니다.
+        return os.path.join(sys._MEIPASS, "res")
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "res")
+
+
+def atlas_path(tile_size: int, base_path: Optional[str] = None) -> str:
+    """타일 크기에 해당하는 아틀라스 파일 경로입니다."""
+    return os.path.join(base_path or resource_dir(), f"atlas_{tile_size}.png")
+
+
+def build_atlas(tile_size: int, base_path: Optional[str] = None) -> pygame.Surface:
+    """
+    res/의 원본 이미지로 아틀라스 Surface를 만듭니다. (디스플레이 초기화 없이도 동작합니다)
+    :param tile_size: 스프라이트 한 칸의 크기 (픽셀)
+    :param base_path: 원본 이미지가 있는 폴더 (None이면 res/)
+    """
+    base_path = base_path or resource_dir()
+    tile_dim = (tile_size, tile_size)
+    sources = {
+        key: pygame.transform.scale(
+            pygame.image.load(os.path.join(base_path, filename)), tile_dim
+        )
+        for key, filename in SOURCE_FILES.items()
+    }
+    atlas = pygame.Surface((tile_size * len(ATLAS_SPRITES), tile_size), pygame.SRCALPHA)
+    for i, key in enumerate(ATLAS_SPRITES):
+        if key in HEAD_ROTATIONS:
+            image = pygame.transform.rotate(sources["head"], HEAD_ROTATIONS[key])
+        else:
+            image = sources[key]
+        atlas.blit(image, (i * tile_size, 0))
+    return atlas
+
+
+def load_atlas(tile_size: int) -> pygame.Surface:
+    """
+    변환된 아틀라스 Surface를 반환합니다. pygame.display.set_mode() 이후에 호출해야 합니다.
+    미리 만든 아틀라스 파일이 있으면 그 파일 하나만 읽고, 없으면 원본 이미지로 메모리에서 만듭니다.
+    결과는 타일 크기별로 캐시되므로 두 번째 호출부터는 파일을 다시 읽지 않습니다.
+    :raises pygame.error, FileNotFoundError: 이미지 파일을 읽을 수 없을 때
+    """
+    atlas = _atlas_cache.get(tile_size)
+    if atlas is not None:
+        return atlas
+
+    path = atlas_path(tile_size)
+    if os.path.exists(path):
+        atlas = pygame.image.load(path)
+    else:
+        atlas = build_atlas(tile_size)
+    atlas = atlas.convert_alpha()
+    _atlas_cache[tile_size] = atlas
+    return atlas
+
+
+def load_textures(tile_size: int) -> Dict:
+    """
+    아틀라스를 잘라 스프라이트 딕셔너리를 만듭니다. 각 항목은 아틀라스의 subsurface이므로 픽셀을 복사하지 않습니다.
+    키는 "tile", "apple", "body"와 머리 방향 벡터 (row, col)입니다.
+    """
+    atlas = load_atlas(tile_size)
+    return {
+        key: atlas.subsurface((i * tile_size, 0, tile_size, tile_size))
+        for i, key in enumerate(ATLAS_SPRITES)
+    }
+
+
+def clear_cache():
+    """캐시된 아틀라스를 버립니다. (디스플레이를 다시 만들었거나 측정할 때 사용)"""
+    _atlas_cache.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="res/의 텍스처를 하나의 아틀라스 이미지로 만듭니다.")
+    parser.add_argument("--tile-size", type=int, default=config.TILE_SIZE, help="스프라이트 한 칸의 크기 (픽셀)")
+    parser.add_argument("--res", default=None, help="원본 이미지 폴더 (기본: res/)")
+    args = parser.parse_args()
+
+    atlas = build_atlas(args.tile_size, args.res)
+    path = atlas_path(args.tile_size, args.res)
+    pygame.image.save(atlas, path)
+    print(f"{path} 저장 완료 ({atlas.get_width()}x{atlas.get_height()}, 스프라이트 {len(ATLAS_SPRITES)}개)")
+
+
+if __name__ == "__main__":
+    main()
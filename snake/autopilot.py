@@ -0,0 +1,368 @@
+"""
+GameState를 읽고 다음 방향을 결정하는 자동 조종(Autopilot) 플래너입니다.
+
+순환 경로 모드 (보드의 한 변이 짝수이고, 몸통이 순환 경로의 순서대로 놓여 있을 때. 시작 상태의 뱀이 그렇습니다)
+    보드의 모든 칸을 지나는 해밀턴 순환 경로를 따라가되, 순환 경로상에서 꼬리를 앞지르지 않는 범위에서
+    목표 사과 쪽으로 지름길을 탑니다. 몸통이 항상 순환 순서를 유지하므로 갇히지 않으며,
+    모든 사과를 먹어 반드시 game_win에 도달합니다. 목표 사과는 사과를 먹었을 때만 다시 고르고,
+    틱마다 머리의 이웃 칸 몇 개만 확인합니다.
+
+BFS 모드 (순환 경로를 쓸 수 없을 때: 홀수 x 홀수 보드, 순서가 어긋난 몸통)
+    1. 가장 가까운 사과까지 BFS로 경로를 찾고, 그 경로를 따라갔을 때 꼬리에 다시 도달할 수 있는지
+       가상으로 확인하여 안전한 경우에만 사과로 향합니다.
+    2. 안전한 사과 경로가 없으면 자신의 꼬리를 쫓아가며(tail-chasing) 시간을 법니다. 사과를 먹은 뒤 처음 한 바퀴는
+       꼬리까지 간 뒤 지금의 몸통 자리를 그대로 따라가는 긴 경로를 쓰고, 그 뒤로는 꼬리까지의 최단 경로로
+       몸통 모양을 바꿔 가며 안전한 사과 경로가 생기기를 기다립니다.
+    3. 꼬리에도 닿을 수 없다면 가장 넓은 빈 공간 쪽으로 이동합니다.
+    찾은 경로는 틱 사이에 캐시하여 사과를 먹었거나 경로가 막혔을 때(또는 경로를 다 따라갔을 때)만 다시 계획합니다.
+    사과를 먹지 못한 채 stall_ticks가 지나면(꼬리만 쫓는 무한 루프) 안전 확인 없이 가장 가까운 사과로 향합니다.
+
+이웃 칸 테이블과 순환 경로는 보드 크기별로 한 번만 계산합니다.
+headless.run_game의 policy와 main.py의 "autopilot" 모드에서 함께 사용합니다.
+
+아레나(여러 마리 뱀) 모드의 AI 뱀은 BFS 대신 ArenaPilot을 사용합니다. 틱마다 뱀 한 마리당
+이웃 칸 몇 개만 확인하므로, 뱀이 수백 마리여도 정책 비용이 보드 크기나 뱀 길이와 상관없이 일정합니다.
+"""
+import random
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from game_logic.arena import ArenaState
+from game_logic.game_state import GameState
+from game_logic.grid import EMPTY, BODY, APPLE
+from game_logic.snake import DIRECTION_VECTORS, Snake
+
+# _bfs의 target 특수값
+NEAREST_APPLE = -1
+NO_TARGET = -2
+# BFS 모드에서 사과를 먹지 못한 채 (보드 칸 수 x 이 값)틱이 지나면 꼬리 쫓기 루프에 갇힌 것으로 봅니다.
+STALL_TICKS_PER_CELL = 2
+# ArenaPilot이 목표 사과를 고를 때 살펴보는 무작위 사과의 수
+ARENA_TARGET_SAMPLES = 4
+
+
+def hamiltonian_cycle(rows: int, cols: int) -> List[Tuple[int, int]]:
+    """
+    보드의 모든 칸을 한 번씩 지나 제자리로 돌아오는 순환 경로를 만듭니다. (rows나 cols 중 하나는 짝수)
+    Autopilot의 순환 경로 모드와 벤치마크(뱀이 이 경로를 따라가면 길이와 상관없이 죽지 않습니다)에서 사용합니다.
+    """
+    if rows % 2:
+        if cols % 2:
+            raise ValueError("rows와 cols 중 하나는 짝수여야 합니다.")
+        return [(r, c) for c, r in hamiltonian_cycle(cols, rows)]
+    # 0행을 오른쪽으로, 1~cols-1열을 지그재그로 내려간 뒤, 0열을 따라 위로 돌아옵니다.
+    cycle = [(0, c) for c in range(cols)]
+    for r in range(1, rows):
+        columns = range(cols - 1, 0, -1) if r % 2 else range(1, cols)
+        cycle.extend((r, c) for c in columns)
+    cycle.extend((r, 0) for r in range(rows - 1, 0, -1))
+    return cycle
+
+
+
+def max_game_ticks(rows: int, cols: int) -> int:
+    """
+    순환 경로 모드의 Autopilot이 보드를 다 채우는 데 걸리는 틱 수의 상한입니다.
+    (사과 하나에 최대 순환 경로 두 바퀴) headless.py가 자동 조종 게임의 기본 max_ticks로 사용합니다.
+    """
+    cells = rows * cols
+    return 2 * cells * cells
+
+
+class Autopilot:
+    """
+    순환 경로 + 지름길, 또는 BFS 경로 탐색 + 꼬리 쫓기 기반의 자동 조종 정책입니다.
+    autopilot(game_state)를 호출하면 다음 틱에 사용할 방향 벡터를 반환합니다.
+    """
+    def __init__(self, rows: int, cols: int, stall_ticks: Optional[int] = None):
+        """
+        :param rows: 게임 그리드의 세로 크기
+        :param cols: 게임 그리드의 가로 크기
+        :param stall_ticks: BFS 모드에서 사과를 먹지 못한 채 이 틱 수가 지나면 안전 확인 없이 사과로 향합니다.
+                            (None이면 보드 칸 수 x STALL_TICKS_PER_CELL)
+        """
+        self.rows = rows
+        self.cols = cols
+        cells = rows * cols
+        self.stall_ticks = stall_ticks if stall_ticks is not None else cells * STALL_TICKS_PER_CELL
+
+        # 칸 인덱스 -> 보드 안에 있는 이웃 칸 인덱스 목록 (한 번만 계산)
+        self.neighbors = []
+        for idx in range(cells):
+            r, c = divmod(idx, cols)
+            self.neighbors.append(
+                tuple(
+                    (r + dr) * cols + (c + dc)
+                    for dr, dc in DIRECTION_VECTORS
+                    if 0 <= r + dr < rows and 0 <= c + dc < cols
+                )
+            )
+        # 머리 -> 다음 칸 인덱스 차이 -> 방향 벡터
+        self._step_direction = {-cols: (-1, 0), cols: (1, 0), -1: (0, -1), 1: (0, 1)}
+
+        # 순환 경로의 두 방향: (칸 인덱스 -> 순환 경로상 위치, 칸 인덱스 -> 다음 칸 인덱스)
+        self._orders = []
+        if min(rows, cols) >= 2 and (rows % 2 == 0 or cols % 2 == 0):
+            cycle = [r * cols + c for r, c in hamiltonian_cycle(rows, cols)]
+            for order in (cycle, cycle[::-1]):
+                position = array("i", bytes(4 * cells))
+                following = array("i", bytes(4 * cells))
+                for i, idx in enumerate(order):
+                    position[idx] = i
+                    following[idx] = order[(i + 1) % cells]
+                self._orders.append((position, following))
+
+        # BFS 작업 버퍼: 세대(generation) 번호로 방문 여부를 표시하여 매번 초기화하지 않습니다.
+        self._seen = array("I", bytes(4 * cells))
+        self._parent = array("i", bytes(4 * cells))
+        self._generation = 0
+        self._queue = array("i", bytes(4 * cells))
+        self._visited = 0
+
+        # 틱 사이에 유지되는 상태
+        self._path = []  # BFS 모드의 경로 캐시 (다음에 갈 칸이 리스트의 맨 뒤)
+        self._order = None  # 순환 경로 모드에서 사용하는 방향 (None이면 BFS 모드)
+        self._target = -1  # 순환 경로 모드의 목표 사과 칸 인덱스
+        self._grid = None
+        self._score = -1
+        self._meal_tick = 0  # 마지막으로 사과를 먹은(또는 게임이 시작된) 틱
+        self.replans = 0  # 통계: 경로(또는 목표 사과)를 다시 계산한 횟수
+        self.gambles = 0  # 통계: 막힌 상태에서 안전 확인 없이 사과로 향한 횟수
+
+    def __call__(self, game_state: GameState) -> Optional[Tuple[int, int]]:
+        grid = game_state.grid
+        snake = game_state.snake
+        # 새 게임이 시작되었거나 사과를 먹었다면 캐시된 경로를 버립니다.
+        if grid is not self._grid:
+            self._grid = grid
+            self._order = self._cycle_order(snake)
+            self._reset_plan(game_state)
+        elif game_state.score != self._score:
+            self._reset_plan(game_state)
+
+        cells = grid.cells
+        head = snake.head_index()
+        tail = snake.tail_index()
+        if self._order is not None:
+            return self._follow_cycle(cells, head, tail, game_state.apples)
+
+        # 캐시된 경로의 다음 칸이 여전히 비어있다면 그대로 따라갑니다.
+        if self._path:
+            nxt = self._path[-1]
+            if cells[nxt] != BODY or nxt == tail:
+                self._path.pop()
+                return self._step_direction[nxt - head]
+            self._path = []
+
+        self.replans += 1
+        self._path = self._plan(cells, snake, head, tail, game_state.tick - self._meal_tick)
+        if self._path:
+            return self._step_direction[self._path.pop() - head]
+        return self._largest_space_direction(cells, head, tail)
+
+    def _reset_plan(self, game_state: GameState):
+        self._score = game_state.score
+        self._meal_tick = game_state.tick
+        self._path = []
+        self._target = -1
+
+    # --- 순환 경로 모드 ---
+    def _cycle_order(self, snake: Snake):
+        """몸통이 꼬리부터 머리까지 순환 경로의 순서대로 놓인 방향을 찾습니다. (없으면 None)"""
+        body = snake.indices()  # 머리부터
+        cells = self.rows * self.cols
+        for position, following in self._orders:
+            base = position[body[-1]]
+            last = -1
+            for idx in reversed(body):
+                offset = (position[idx] - base) % cells
+                if offset <= last:
+                    break
+                last = offset
+            else:
+                return position, following
+        return None
+
+    def _follow_cycle(self, cells: bytearray, head: int, tail: int, apples) -> Optional[Tuple[int, int]]:
+        """
+        순환 경로의 다음 칸으로 가거나, 꼬리를 앞지르지 않는 이웃 칸 중 목표 사과에 순환 경로상 가장 가까운 칸으로 갑니다.
+        머리와 꼬리 사이(순환 경로상 머리 앞쪽)에는 몸통이 없으므로 그 구간 안의 칸으로 가면 순환 순서가 유지됩니다.
+        """
+        position, following = self._order
+        size = len(cells)
+        head_pos = position[head]
+        if self._target < 0 or cells[self._target] != APPLE:
+            # 순환 경로상 머리에서 가장 가까운 사과를 목표로 합니다.
+            self.replans += 1
+            cols = self.cols
+            self._target = min(
+                (r * cols + c for r, c in apples),
+                key=lambda idx: (position[idx] - head_pos) % size,
+                default=-1,
+            )
+        best = following[head]
+        target = self._target
+        if target >= 0:
+            target_pos = position[target]
+            tail_gap = (position[tail] - head_pos) % size
+            best_dist = (target_pos - position[best]) % size
+            for nxt in self.neighbors[head]:
+                if cells[nxt] == BODY:
+                    continue
+                ahead = (position[nxt] - head_pos) % size
+                if ahead >= tail_gap:
+                    continue  # 꼬리를 앞지르면 순환 순서가 깨집니다.
+                dist = (target_pos - position[nxt]) % size
+                if dist < best_dist:
+                    best, best_dist = nxt, dist
+        return self._step_direction[best - head]
+
+    # --- BFS 모드 ---
+    def _plan(self, cells: bytearray, snake: Snake, head: int, tail: int, waited: int) -> List[int]:
+        """
+        안전한 사과 경로, 없으면 꼬리까지의 경로를 반환합니다. (다음 칸이 맨 뒤)
+        :param waited: 마지막으로 사과를 먹은 뒤 지난 틱 수. stall_ticks 이상이면 안전하지 않은 사과 경로라도 반환합니다.
+        """
+        apple = self._bfs(head, cells, tail, target=NEAREST_APPLE)
+        if apple >= 0:
+            path = self._trace(head, apple)
+            if self._is_safe(path, cells, snake):
+                return path
+            if waited >= self.stall_ticks:
+                self.gambles += 1
+                return path
+        if self._bfs(head, cells, tail, target=tail) >= 0:
+            path = self._trace(head, tail)
+            if waited < snake.length:
+                # 꼬리에 도착한 뒤에는 몸통의 각 칸이 비워지는 순서대로 따라갈 수 있으므로,
+                # 지금의 몸통 자리(꼬리 다음 칸 ~ 머리)를 경로 뒤에 이어 붙여 한 바퀴 동안 다시 계획하지 않습니다.
+                return snake.indices().tolist()[:-1] + path
+            return path
+        return []
+
+    def _bfs(self, start: int, cells: bytearray, tail: int, target: int) -> int:
+        """
+        start에서 BFS를 수행합니다. 몸통은 지나갈 수 없지만 꼬리 칸은 곧 비워지므로 지나갈 수 있습니다.
+        :param target: 찾을 칸 인덱스 (NEAREST_APPLE이면 가장 가까운 사과, NO_TARGET이면 전체 탐색)
+        :return: 찾은 칸의 인덱스, 찾지 못하면 -1 (방문한 칸의 수는 self._visited에 남습니다)
+        """
+        self._generation += 1
+        gen = self._generation
+        seen, parent, queue, neighbors = self._seen, self._parent, self._queue, self.neighbors
+        seen[start] = gen
+        queue[0] = start
+        read, write = 0, 1
+        while read < write:
+            cur = queue[read]
+            read += 1
+            for nxt in neighbors[cur]:
+                if seen[nxt] == gen or (cells[nxt] == BODY and nxt != tail):
+                    continue
+                seen[nxt] = gen
+                parent[nxt] = cur
+                if nxt == target or (target == NEAREST_APPLE and cells[nxt] == APPLE):
+                    return nxt
+                queue[write] = nxt
+                write += 1
+        self._visited = write
+        return -1
+
+    def _trace(self, start: int, goal: int) -> List[int]:
+        """마지막 BFS의 부모 정보를 따라 start -> goal 경로를 만듭니다. (start 제외, 다음 칸이 맨 뒤)"""
+        path = []
+        cur = goal
+        parent = self._parent
+        while cur != start:
+            path.append(cur)
+            cur = parent[cur]
+        return path
+
+    def _is_safe(self, path: List[int], cells: bytearray, snake: Snake) -> bool:
+        """경로를 따라가 사과를 먹은 뒤에도 꼬리에 도달할 수 있는지 가상 이동으로 확인합니다."""
+        # 경로를 끝까지 따라가면 (사과를 먹어 한 칸 길어진) 새 몸통은 "경로 + 기존 몸통"의 앞부분이 됩니다.
+        length = snake.length + 1
+        combined = path + snake.indices().tolist()
+        virtual_cells = cells[:]
+        for cell in combined[length:]:
+            virtual_cells[cell] = EMPTY
+        for cell in combined[:length]:
+            virtual_cells[cell] = BODY
+        new_tail = combined[length - 1]
+        return self._bfs(combined[0], virtual_cells, new_tail, target=new_tail) >= 0
+
+    def _largest_space_direction(self, cells: bytearray, head: int, tail: int) -> Optional[Tuple[int, int]]:
+        """꼬리에도 닿을 수 없을 때, 도달 가능한 빈 칸이 가장 많은 이웃으로 이동합니다."""
+        best_dir = None
+        best_area = -1
+        for nxt in self.neighbors[head]:
+            if cells[nxt] == BODY and nxt != tail:
+                continue
+            area = self._flood_size(nxt, cells, tail)
+            if area > best_area:
+                best_area = area
+                best_dir = self._step_direction[nxt - head]
+        return best_dir
+
+    def _flood_size(self, start: int, cells: bytearray, tail: int) -> int:
+        """start에서 도달 가능한 칸의 수를 셉니다."""
+        self._bfs(start, cells, tail, target=NO_TARGET)
+        return self._visited
+
+
+class ArenaPilot:
+    """
+    아레나의 AI 뱀을 위한 탐욕(greedy) 정책입니다. pilot(arena, i)를 호출하면 i번 뱀의 다음 방향을 반환합니다.
+
+    뱀마다 목표 사과를 하나 기억해 두고(사과가 사라졌을 때만 무작위 사과 몇 개 중 가장 가까운 것으로 다시 고릅니다),
+    되돌아가지 않는 세 방향 중 몸통/벽이 아닌 칸을 "막다른 칸이 아닌지 -> 목표까지 거리 -> 직진" 순서로 고릅니다.
+    """
+    def __init__(self, seed: Optional[int] = None):
+        """
+        :param seed: 목표 사과를 고르는 난수의 시드 (게임의 RNG와 섞이지 않도록 별도로 사용합니다)
+        """
+        self._random = random.Random(seed)
+        self._targets: Dict[int, Tuple[int, int]] = {}  # 뱀 번호 -> 목표 사과 위치
+
+    def __call__(self, arena: ArenaState, i: int) -> Optional[Tuple[int, int]]:
+        rows, cols = arena.rows, arena.cols
+        cells = arena.grid.cells
+        snake = arena.snakes[i]
+        hr, hc = divmod(snake.head_index(), cols)
+
+        target = self._targets.get(i)
+        if target is None or cells[target[0] * cols + target[1]] != APPLE:
+            target = self._pick_target(arena.apples, hr, hc)
+            self._targets[i] = target
+
+        current = snake.direction
+        reverse = (-current[0], -current[1]) if snake.length > 1 else None
+        best_dir = None
+        best_key = None
+        for direction in DIRECTION_VECTORS:
+            if direction == reverse:
+                continue
+            r, c = hr + direction[0], hc + direction[1]
+            if not (0 <= r < rows and 0 <= c < cols) or cells[r * cols + c] == BODY:
+                continue
+            # 한 칸 앞을 더 보아 다음 틱에 갈 곳이 없는 칸은 마지막 수단으로만 고릅니다.
+            exits = 0
+            for dr, dc in DIRECTION_VECTORS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and cells[nr * cols + nc] != BODY:
+                    exits += 1
+            distance = abs(r - target[0]) + abs(c - target[1]) if target else 0
+            key = (exits == 0, distance, direction != current)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_dir = direction
+        return best_dir
+
+    def _pick_target(self, apples: List[Tuple[int, int]], hr: int, hc: int) -> Optional[Tuple[int, int]]:
+        """무작위로 고른 사과 몇 개 중 머리에서 가장 가까운 사과를 반환합니다. (사과가 없으면 None)"""
+        if not apples:
+            return None
+        choice = self._random.choice
+        return min(
+            (choice(apples) for _ in range(ARENA_TARGET_SAMPLES)),
+            key=lambda pos: abs(pos[0] - hr) + abs(pos[1] - hc),
+        )
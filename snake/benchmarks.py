@@ -0,0 +1,506 @@
+"""
+게임 로직과 렌더링 핫패스의 성능을 측정하는 벤치마크 모음입니다.
+
+측정 항목:
+- logic.*: MAP_SIZE_OPTIONS 중 창에 들어가는 각 맵 크기와 뱀 길이별 GameState.update 초당 틱 수
+- spawn.*: 보드 점유율 10/50/90/99%에서 _spawn_apple 한 번의 지연 시간 백분위수
+- render.*: SDL dummy 비디오 드라이버에서 draw_frame(텍스처/Fallback), draw_frame_incremental, draw_overlay,
+            draw_pause_overlay의 초당 프레임 수
+- render.draw_frame_viewport.* / render.camera_follow.*: 거대 맵(카메라 모드)에서 뷰포트 전체 다시 그리기와,
+            매 틱 카메라가 머리를 따라가며 그리는 경우의 초당 프레임 수 (맵 크기와 상관없이 일정해야 합니다)
+- logic.arena.*: ARENA_MAP_SIZE 보드에서 AI 뱀(ArenaPilot) N마리를 함께 진행하는 ArenaState.update 초당 틱 수
+- render.draw_arena_frame.*: 같은 아레나를 매 틱 진행하며 화면 전체를 다시 그리는 경우의 초당 프레임 수
+- tick_jitter.*: 프레임마다 렌더 부하(JITTER_RENDER_LOAD_MS)가 있을 때, 렌더 루프 안에서 틱을 진행하는 경우(inline)와
+            LogicThread가 진행하는 경우(logic_thread)의 틱 간격 오차 p99 (밀리초)
+- startup.*: 텍스처 준비 시간 (미리 만든 아틀라스 파일 / 원본 이미지로 메모리에서 생성),
+             폰트 경로 찾기 (캐시 없음 / 디스크 캐시 사용)와 메뉴에 필요한 두 크기의 폰트 로딩 시간
+
+결과는 JSON으로 저장할 수 있으며, --baseline으로 저장된 결과와 비교하여
+허용 범위(--tolerance)를 넘는 성능 저하가 있으면 0이 아닌 코드로 종료합니다.
+
+사용 예:
+    python benchmarks.py --output bench.json
+    python benchmarks.py --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# 렌더링 벤치마크는 실제 창 없이 실행합니다. (pygame import 전에 설정해야 합니다)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import config
+from autopilot import hamiltonian_cycle
+from game_logic.game_state import GameState, STATE_CHANGED
+from game_logic.grid import OccupancyGrid, EMPTY
+from game_logic.snake import Snake
+
+# 측정할 뱀 길이 (보드 칸 수 대비 비율)
+SNAKE_LENGTH_FRACTIONS = (0.0, 0.25, 0.5)
+SPAWN_FILL_LEVELS = (0.10, 0.50, 0.90, 0.99)
+SPAWN_PERCENTILES = (50, 90, 99)
+STARTUP_REPEATS = 20
+# 창에 다 들어가는 맵 크기 (전체 화면 렌더링 벤치마크 대상)
+WINDOWED_MAP_SIZES = [size for size in config.MAP_SIZE_OPTIONS.values() if not config.uses_camera(*size)]
+# 카메라 모드 벤치마크 맵 크기: 설정 옵션의 거대 맵과, 맵 크기에 따른 차이를 보기 위한 더 큰 맵
+CAMERA_MAP_SIZES = [size for size in config.MAP_SIZE_OPTIONS.values() if config.uses_camera(*size)] + [(1000, 1000)]
+# 아레나 벤치마크의 AI 뱀 수 (256x256 보드에서 200마리 이상이 초당 60틱을 넘어야 합니다)
+ARENA_SNAKE_COUNTS = (50, 200, 400)
+# 틱 지터 벤치마크의 틱 간격과 프레임 하나의 렌더 부하 (렌더 부하가 틱 간격보다 길어 인라인 모드는 틱이 몰립니다)
+JITTER_TICK_MS = 10
+JITTER_RENDER_LOAD_MS = 25
+
+
+def make_game(rows: int, cols: int, length: int, max_apples: int, seed: int = 1) -> Tuple[GameState, Dict]:
+    """
+    길이 length의 뱀이 순환 경로 위에 놓인 GameState와, 칸 -> 순환 경로상 다음 칸의 방향 표를 반환합니다.
+    """
+    cycle = hamiltonian_cycle(rows, cols)
+    next_direction = {}
+    for i, (r, c) in enumerate(cycle):
+        nr, nc = cycle[(i + 1) % len(cycle)]
+        next_direction[(r, c)] = (nr - r, nc - c)
+
+    length = max(3, min(length, rows * cols - max_apples - 1))
+    head_index = length - 1
+    body = [cycle[head_index - i] for i in range(length)]
+    (hr, hc), (pr, pc) = body[0], body[1]
+
+    game_state = GameState(rows=rows, cols=cols, max_apples=0, seed=seed)
+    game_state.max_apples = max_apples
+    game_state.grid = OccupancyGrid(rows, cols)
+    game_state.snake = Snake(body, (hr - pr, hc - pc), game_state.grid)
+    for _ in range(max_apples):
+        game_state._spawn_apple()
+    return game_state, next_direction
+
+
+def bench_logic(duration: float) -> Dict[str, Dict]:
+    """맵 크기와 뱀 길이별 GameState.update 초당 틱 수를 측정합니다."""
+    results = {}
+    max_apples = config.APPLE_COUNT_OPTIONS["보통"]
+    for cols, rows in WINDOWED_MAP_SIZES:
+        for fraction in SNAKE_LENGTH_FRACTIONS:
+            length = int(rows * cols * fraction)
+            game_state, next_direction = make_game(rows, cols, length, max_apples)
+            snapshot = game_state.snapshot()
+            ticks = 0
+            start = time.perf_counter()
+            deadline = start + duration
+            while True:
+                for _ in range(1000):
+                    game_state.handle_input(next_direction[game_state.snake.head()])
+                    game_state.update()
+                    if game_state.game_win:
+                        game_state.restore(snapshot)
+                ticks += 1000
+                if time.perf_counter() >= deadline:
+                    break
+            elapsed = time.perf_counter() - start
+            key = f"logic.update.{cols}x{rows}.len{int(fraction * 100)}pct"
+            results[key] = _metric(ticks / elapsed, "ticks/s", "higher")
+    return results
+
+
+def make_arena(num_snakes: int, seed: int = 1):
+    """ARENA_MAP_SIZE 보드에 AI 뱀 num_snakes마리가 있는 아레나를 만들고, 뱀들이 자라도록 몇 틱 진행해 둡니다."""
+    from autopilot import ArenaPilot
+    from game_logic.arena import ArenaState
+
+    cols, rows = config.ARENA_MAP_SIZE
+    arena = ArenaState(
+        rows, cols, config.ARENA_APPLES_PER_SNAKE * num_snakes, num_snakes, seed=seed, policy=ArenaPilot(seed)
+    )
+    for _ in range(200):
+        arena.update()
+    return arena
+
+
+def bench_arena(duration: float) -> Dict[str, Dict]:
+    """아레나의 뱀 수별 ArenaState.update(AI 정책 포함) 초당 틱 수를 측정합니다."""
+    results = {}
+    cols, rows = config.ARENA_MAP_SIZE
+    for num_snakes in ARENA_SNAKE_COUNTS:
+        arena = make_arena(num_snakes)
+        ticks = 0
+        start = time.perf_counter()
+        deadline = start + duration
+        while True:
+            for _ in range(20):
+                arena.update()
+            ticks += 20
+            if time.perf_counter() >= deadline:
+                break
+        elapsed = time.perf_counter() - start
+        results[f"logic.arena.{cols}x{rows}.snakes{num_snakes}"] = _metric(ticks / elapsed, "ticks/s", "higher")
+    return results
+
+
+def bench_spawn(samples: int) -> Dict[str, Dict]:
+    """보드 점유율별 _spawn_apple 지연 시간 백분위수를 측정합니다."""
+    results = {}
+    cols, rows = max(WINDOWED_MAP_SIZES)
+    for fill in SPAWN_FILL_LEVELS:
+        game_state, _ = make_game(rows, cols, int(rows * cols * fill), max_apples=0)
+        grid = game_state.grid
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            game_state._spawn_apple()
+            timings.append(time.perf_counter_ns() - start)
+            # 점유율을 유지하기 위해 방금 만든 사과를 다시 제거합니다.
+            grid.set(game_state.apples.pop(), EMPTY)
+        timings.sort()
+        for p in SPAWN_PERCENTILES:
+            value = timings[min(len(timings) - 1, len(timings) * p // 100)] / 1000.0
+            results[f"spawn.{cols}x{rows}.fill{int(fill * 100)}pct.p{p}"] = _metric(value, "us", "lower")
+    return results
+
+
+def bench_render(duration: float) -> Dict[str, Dict]:
+    """SDL dummy 드라이버에서 렌더링 함수들의 초당 프레임 수를 측정합니다."""
+    import pygame
+    import assets
+    import rendering
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.UI_SCREEN_WIDTH, config.UI_SCREEN_HEIGHT))
+    results = {}
+
+    # 텍스처 준비 시간: 캐시를 비운 상태에서 load_textures() 한 번에 걸리는 시간의 중앙값
+    atlas_file = assets.atlas_path(config.TILE_SIZE)
+    if os.path.exists(atlas_file):
+        results["startup.textures.atlas"] = _metric(
+            _median_ms(lambda: assets.load_textures(config.TILE_SIZE), assets.clear_cache), "ms", "lower"
+        )
+    results["startup.textures.sources"] = _metric(
+        _median_ms(lambda: assets.build_atlas(config.TILE_SIZE).convert_alpha(), assets.clear_cache), "ms", "lower"
+    )
+    results.update(bench_fonts())
+    for cols, rows in WINDOWED_MAP_SIZES:
+        runtime_config = config.RuntimeConfig(
+            game_tick_ms=config.SPEED_OPTIONS["보통"],
+            max_apples=config.APPLE_COUNT_OPTIONS["보통"],
+            grid_cols=cols,
+            grid_rows=rows,
+        )
+        surface = pygame.Surface((runtime_config.screen_width, runtime_config.screen_height))
+        rendering.init_renderer(surface, runtime_config)
+        textures = rendering._textures
+        for path, active_textures in (("textured", textures), ("fallback", {})):
+            rendering._textures = active_textures
+            rendering._sprites = rendering._build_sprites()
+            # 뱀 길이가 늘어나도 프레임 시간이 거의 일정해야 합니다.
+            for fraction in SNAKE_LENGTH_FRACTIONS + (0.9,):
+                length = int(rows * cols * fraction)
+                game_state, _ = make_game(rows, cols, length, config.APPLE_COUNT_OPTIONS["보통"])
+                render_data = game_state.get_render_data()
+                fps = _frames_per_second(lambda: rendering.draw_frame(surface, render_data), duration)
+                key = f"render.draw_frame.{path}.{cols}x{rows}.len{int(fraction * 100)}pct"
+                results[key] = _metric(fps, "fps", "higher")
+        rendering._textures = textures
+        rendering._sprites = rendering._build_sprites()
+
+        # 증분 렌더링: 매 프레임 한 틱씩 진행하며 변경 피드로 바뀐 칸만 다시 그립니다. (로직 비용 포함)
+        game_state, next_direction = make_game(rows, cols, rows * cols // 2, config.APPLE_COUNT_OPTIONS["보통"])
+        game_state.enable_changes()
+        snapshot = game_state.snapshot()
+        rendering.draw_frame(surface, game_state.get_render_data())
+        game_state.clear_changes()
+
+        def draw_incremental():
+            game_state.handle_input(next_direction[game_state.snake.head()])
+            game_state.update()
+            if game_state.game_win:
+                game_state.restore(snapshot)
+            if rendering.draw_frame_incremental(surface, game_state.changes, game_state.grid) is None:
+                rendering.draw_frame(surface, game_state.get_render_data())
+            game_state.clear_changes()
+
+        fps = _frames_per_second(draw_incremental, duration)
+        results[f"render.draw_frame_incremental.{cols}x{rows}"] = _metric(fps, "fps", "higher")
+
+        fps = _frames_per_second(lambda: rendering.draw_overlay(surface, "game_over", 42), duration)
+        results[f"render.draw_overlay.{cols}x{rows}"] = _metric(fps, "fps", "higher")
+
+    noop = lambda: None  # noqa: E731
+    fps = _frames_per_second(lambda: rendering.draw_pause_overlay(screen, noop, noop, noop, []), duration)
+    results["render.draw_pause_overlay"] = _metric(fps, "fps", "higher")
+
+    results.update(bench_camera(duration))
+    results.update(bench_tick_jitter(duration))
+    pygame.quit()
+    return results
+
+
+def bench_camera(duration: float) -> Dict[str, Dict]:
+    """거대 맵(카메라 모드)의 렌더링 초당 프레임 수를 측정합니다. (pygame 디스플레이가 초기화되어 있어야 합니다)"""
+    import pygame
+    import rendering
+
+    results = {}
+    for cols, rows in CAMERA_MAP_SIZES:
+        runtime_config = config.RuntimeConfig(
+            game_tick_ms=config.SPEED_OPTIONS["보통"],
+            max_apples=config.APPLE_COUNT_OPTIONS["보통"],
+            grid_cols=cols,
+            grid_rows=rows,
+        )
+        surface = pygame.Surface((runtime_config.screen_width, runtime_config.screen_height))
+        rendering.init_renderer(surface, runtime_config)
+        game_state, next_direction = make_game(rows, cols, rows * cols // 4, config.APPLE_COUNT_OPTIONS["보통"])
+        game_state.enable_changes()
+        snake = game_state.snake
+
+        def draw_viewport():
+            rendering.draw_frame_viewport(
+                surface, game_state.changes, game_state.grid, snake.head(), snake.direction, game_state.score
+            )
+            game_state.clear_changes()
+
+        # 처음 한 번은 미니맵을 맵 전체로부터 만듭니다. (게임 시작 시 한 번만 드는 비용)
+        game_state.changes.append((STATE_CHANGED, "reset"))
+        draw_viewport()
+        fps = _frames_per_second(draw_viewport, duration)
+        results[f"render.draw_frame_viewport.{cols}x{rows}.len25pct"] = _metric(fps, "fps", "higher")
+
+        # 순환 경로는 한 줄을 따라 길게 이동하므로, 매 틱 카메라가 움직여 뷰포트 전체를 다시 그리게 됩니다.
+        def follow():
+            game_state.handle_input(next_direction[snake.head()])
+            game_state.update()
+            if rendering.draw_frame_incremental(surface, game_state.changes, game_state.grid) is None:
+                rendering.draw_frame_viewport(
+                    surface, game_state.changes, game_state.grid, snake.head(), snake.direction, game_state.score
+                )
+            game_state.clear_changes()
+
+        fps = _frames_per_second(follow, duration)
+        results[f"render.camera_follow.{cols}x{rows}.len25pct"] = _metric(fps, "fps", "higher")
+
+    # 아레나: 매 틱 모든 뱀이 움직이므로 화면 전체를 다시 그립니다. (틱 진행 비용 포함)
+    cols, rows = config.ARENA_MAP_SIZE
+    num_snakes = 200
+    runtime_config = config.RuntimeConfig(
+        game_tick_ms=config.SPEED_OPTIONS["보통"],
+        max_apples=config.ARENA_APPLES_PER_SNAKE * num_snakes,
+        grid_cols=cols,
+        grid_rows=rows,
+        arena_snakes=num_snakes - 1,
+    )
+    surface = pygame.Surface((runtime_config.screen_width, runtime_config.screen_height))
+    rendering.init_renderer(surface, runtime_config)
+    arena = make_arena(num_snakes)
+    arena.enable_changes()
+
+    def arena_frame():
+        arena.update()
+        rendering.draw_arena_frame(surface, arena.changes, arena)
+        arena.clear_changes()
+
+    fps = _frames_per_second(arena_frame, duration)
+    results[f"render.draw_arena_frame.{cols}x{rows}.snakes{num_snakes}"] = _metric(fps, "fps", "higher")
+    return results
+
+
+def bench_fonts() -> Dict[str, Dict]:
+    """폰트 경로 찾기와 로딩 시간을 측정합니다. (사용자의 폰트 캐시 파일은 건드리지 않습니다)"""
+    import tempfile
+    import pygame
+    import fonts
+
+    def cold_reset():
+        fonts.clear_cache()
+        # Pygame이 프로세스 안에 기억하는 시스템 폰트 목록도 비워 첫 실행과 같은 조건을 만듭니다.
+        pygame.sysfont.Sysfonts.clear()
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
+    def load_both():
+        fonts.get_font(config.FONT_SIZE)
+        fonts.get_font(config.TITLE_FONT_SIZE)
+
+    pygame.font.init()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "font_path.json")
+        resolve = lambda: fonts.resolve_font_path(cache_file)  # noqa: E731
+        results["startup.fonts.resolve_cold"] = _metric(_median_ms(resolve, cold_reset), "ms", "lower")
+        resolve()
+        results["startup.fonts.resolve_cached"] = _metric(_median_ms(resolve, fonts.clear_cache), "ms", "lower")
+
+        def reset_fonts():
+            fonts.clear_cache()
+            resolve()
+
+        results["startup.fonts.load"] = _metric(_median_ms(load_both, reset_fonts), "ms", "lower")
+    fonts.clear_cache()
+    return results
+
+
+def bench_tick_jitter(duration: float) -> Dict[str, Dict]:
+    """
+    매 프레임 JITTER_RENDER_LOAD_MS만큼 blit을 하는 렌더 루프에서, 인라인 고정 간격 루프와 LogicThread의
+    틱 간격 오차 p99를 측정합니다. (pygame 디스플레이가 초기화되어 있어야 합니다)
+    """
+    import pygame
+    from logic_thread import LogicThread, TickJitter
+
+    surface = pygame.Surface((config.UI_SCREEN_WIDTH, config.UI_SCREEN_HEIGHT))
+    source = surface.copy()
+    tick_dt = JITTER_TICK_MS / 1000
+
+    def render_frame():
+        start = time.perf_counter()
+        while time.perf_counter() - start < JITTER_RENDER_LOAD_MS / 1000:
+            surface.blit(source, (0, 0))
+
+    def new_game():
+        game_state, next_direction = make_game(20, 30, 150, config.APPLE_COUNT_OPTIONS["보통"])
+        return game_state, (lambda state: next_direction[state.snake.head()])
+
+    results = {}
+    # 인라인: main.py의 accumulator 루프와 같이 프레임 사이에 밀린 틱을 몰아서 진행합니다.
+    game_state, autopilot = new_game()
+    jitter = TickJitter()
+    accumulator = 0.0
+    last_time = time.perf_counter()
+    deadline = last_time + duration
+    while last_time < deadline:
+        now = time.perf_counter()
+        accumulator += now - last_time
+        last_time = now
+        ticks_run = 0
+        while accumulator >= tick_dt and ticks_run < config.MAX_CATCH_UP_TICKS:
+            game_state.handle_input(autopilot(game_state))
+            jitter.record(time.perf_counter(), tick_dt)
+            game_state.update()
+            accumulator -= tick_dt
+            ticks_run += 1
+        accumulator %= tick_dt
+        render_frame()
+    results["tick_jitter.inline.p99"] = _metric(jitter.stats()["p99_ms"], "ms", "lower")
+
+    # 로직 스레드: 같은 렌더 루프는 스냅샷만 읽습니다.
+    game_state, autopilot = new_game()
+    jitter = TickJitter()
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(config.LOGIC_THREAD_SWITCH_INTERVAL)
+    logic = LogicThread(game_state, tick_dt, autopilot=autopilot, jitter=jitter)
+    logic.set_active(True)
+    deadline = time.perf_counter() + duration
+    try:
+        while time.perf_counter() < deadline:
+            logic.latest()
+            render_frame()
+    finally:
+        logic.stop()
+        sys.setswitchinterval(switch_interval)
+    results["tick_jitter.logic_thread.p99"] = _metric(jitter.stats()["p99_ms"], "ms", "lower")
+    return results
+
+
+def _frames_per_second(draw, duration: float) -> float:
+    frames = 0
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        draw()
+        frames += 1
+        if time.perf_counter() >= deadline:
+            break
+    return frames / (time.perf_counter() - start)
+
+
+def _median_ms(run, reset) -> float:
+    timings = []
+    for _ in range(STARTUP_REPEATS):
+        reset()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000.0
+
+
+def _metric(value: float, unit: str, better: str) -> Dict:
+    return {"value": value, "unit": unit, "better": better}
+
+
+def run_all(duration: float, spawn_samples: int, include_render: bool = True) -> Dict:
+    """모든 벤치마크를 실행하고 JSON으로 저장할 수 있는 결과 딕셔너리를 반환합니다."""
+    results = {}
+    results.update(bench_logic(duration))
+    results.update(bench_arena(duration))
+    results.update(bench_spawn(spawn_samples))
+    if include_render:
+        results.update(bench_render(duration))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준 결과와 비교하여 허용 범위보다 나빠진 항목의 설명 목록을 반환합니다.
+    :param tolerance: 허용하는 상대 저하 비율 (0.2 = 20%)
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        cur = current["results"].get(name)
+        if cur is None or base["value"] <= 0:
+            continue
+        ratio = cur["value"] / base["value"]
+        if base["better"] == "higher":
+            worse = ratio < 1.0 - tolerance
+        else:
+            worse = ratio > 1.0 + tolerance
+        if worse:
+            regressions.append(
+                f"{name}: {base['value']:.2f} -> {cur['value']:.2f} {cur['unit']} ({(ratio - 1) * 100:+.1f}%)"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> None:
+    """벤치마크 CLI 진입점입니다."""
+    parser = argparse.ArgumentParser(description="Hebi 벤치마크")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 상대 성능 저하 (기본 0.2)")
+    parser.add_argument("--duration", type=float, default=0.5, help="항목당 측정 시간(초)")
+    parser.add_argument("--spawn-samples", type=int, default=2000)
+    parser.add_argument("--no-render", action="store_true", help="렌더링 벤치마크를 건너뜁니다.")
+    args = parser.parse_args(argv)
+
+    report = run_all(args.duration, args.spawn_samples, include_render=not args.no_render)
+    for name, metric in report["results"].items():
+        print(f"{name:<52} {metric['value']:>14.2f} {metric['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건 (허용 범위 {args.tolerance * 100:.0f}%):", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            raise SystemExit(1)
+        print("\n기준 결과 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
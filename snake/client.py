@@ -0,0 +1,222 @@
+"""
+server.py의 방 하나를 미러링하는 클라이언트입니다.
+
+GameMirror는 서버가 보낸 KEYFRAME/DELTA 메시지를 로컬 점유 그리드와 Snake에 적용하며,
+GameState와 같은 속성(grid, snake, apples, score, changes, get_render_data() 등)을 제공하므로
+렌더러와 Autopilot을 그대로 사용할 수 있습니다. 받은 DELTA 이벤트는 그대로 changes에 쌓이므로
+main.py는 로컬 게임과 똑같이 증분 렌더링을 합니다.
+
+RemoteGame은 GameMirror에 논블로킹 TCP 소켓을 붙인 것으로, main.py --connect에서 매 프레임 poll()을 호출합니다.
+"""
+import socket
+from typing import Dict, Optional, Tuple
+
+import protocol
+from game_logic.game_state import (
+    HEAD_ADDED,
+    TAIL_REMOVED,
+    APPLE_SPAWNED,
+    APPLE_EATEN,
+    SCORE_CHANGED,
+    STATE_CHANGED,
+)
+from game_logic.grid import OccupancyGrid, APPLE
+from game_logic.snake import Snake
+
+
+class GameMirror:
+    """
+    서버의 GameState를 메시지로 따라가는 읽기 전용 사본입니다.
+    KEYFRAME을 받기 전까지는 grid와 snake가 None입니다.
+    """
+    def __init__(self):
+        self.room = 0
+        self.rows = 0
+        self.cols = 0
+        self.max_apples = 0
+        self.tick = 0
+        self.grid = None
+        self.snake = None
+        self.apples = []
+        self.score = 0
+        self.game_over = False
+        self.game_win = False
+        self.changes = []  # 미러의 변경 피드는 항상 켜져 있습니다.
+        self.keyframes = 0  # 통계: 받은 KEYFRAME 수
+        self.deltas = 0  # 통계: 받은 DELTA 수
+        self.desyncs = 0  # 통계: DELTA의 머리 위치가 미러와 달랐던 횟수 (다음 KEYFRAME에서 바로잡힙니다)
+
+    def apply_message(self, payload: bytes) -> int:
+        """
+        서버 메시지 하나를 적용합니다.
+        :return: 이 메시지로 진행된 틱 수
+        """
+        kind = payload[0]
+        if kind == protocol.MSG_KEYFRAME:
+            before = self.tick
+            self._apply_keyframe(protocol.decode_keyframe(payload))
+            return max(0, self.tick - before)
+        if kind == protocol.MSG_DELTA:
+            if self.grid is None:
+                return 0  # 첫 KEYFRAME 전에 온 DELTA는 적용할 수 없습니다.
+            tick, events = protocol.decode_delta(payload, self.cols)
+            self._apply_delta(tick, events)
+            return 1
+        raise protocol.ProtocolError(f"알 수 없는 메시지 종류: {kind}")
+
+    def _apply_keyframe(self, keyframe: Dict):
+        self.room = keyframe["room"]
+        self.rows = keyframe["rows"]
+        self.cols = keyframe["cols"]
+        self.max_apples = keyframe["max_apples"]
+        self.tick = keyframe["tick"]
+        self.score = keyframe["score"]
+        self.game_over = keyframe["game_over"]
+        self.game_win = keyframe["game_win"]
+        self.grid = OccupancyGrid(self.rows, self.cols)
+        self.snake = Snake(keyframe["body"], keyframe["direction"], self.grid)
+        self.snake._next_direction = keyframe["next_direction"]
+        self.apples = keyframe["apples"]
+        for pos in self.apples:
+            self.grid.set(pos, APPLE)
+        self.keyframes += 1
+        # 소비자(렌더러)는 이 이벤트를 받으면 전체를 다시 그립니다.
+        self.changes.append((STATE_CHANGED, "restored"))
+
+    def _apply_delta(self, tick: int, events):
+        snake, grid, changes = self.snake, self.grid, self.changes
+        for event in events:
+            kind, value = event
+            if kind == TAIL_REMOVED:
+                snake.pop_tail()
+            elif kind == HEAD_ADDED:
+                pos, direction = value
+                snake._next_direction = direction
+                if snake.push_head() != pos[0] * self.cols + pos[1]:
+                    self.desyncs += 1
+            elif kind == APPLE_SPAWNED:
+                self.apples.append(value)
+                grid.set(value, APPLE)
+            elif kind == APPLE_EATEN:
+                self.apples.remove(value)  # 칸은 같은 틱의 새 머리가 이미 덮었습니다.
+            elif kind == SCORE_CHANGED:
+                self.score = value
+            changes.append(event)
+        self.tick = tick
+        self.deltas += 1
+
+    def enable_changes(self):
+        """GameState와 같은 인터페이스용입니다. (미러의 변경 피드는 항상 켜져 있습니다)"""
+
+    def clear_changes(self):
+        self.changes.clear()
+
+    def is_win(self) -> bool:
+        return self.game_win
+
+    def is_over(self) -> bool:
+        return self.game_over
+
+    def get_render_data(self) -> dict:
+        """GameState.get_render_data()와 같은 형식의 딕셔너리를 반환합니다."""
+        return {
+            "snake_body": list(self.snake.body),
+            "snake_direction": self.snake.direction,
+            "apples": self.apples,
+            "score": self.score,
+            "game_over": self.game_over,
+            "game_win": self.game_win,
+        }
+
+
+class RemoteGame(GameMirror):
+    """
+    서버에 접속해 방 하나를 미러링합니다. 입력은 서버로 보내고, 화면에 그릴 상태는 서버의 메시지로만 바뀝니다.
+    """
+    def __init__(self, sock: socket.socket):
+        super().__init__()
+        self._sock = sock
+        self._reader = protocol.FrameReader()
+        self.connected = True
+
+    @classmethod
+    def connect(
+        cls,
+        host: str,
+        port: int,
+        rows: int,
+        cols: int,
+        max_apples: int,
+        room: int = 0,
+        timeout: float = 5.0,
+    ) -> "RemoteGame":
+        """
+        서버에 접속해 방에 들어가고, 첫 KEYFRAME을 받을 때까지 기다립니다.
+        :param room: 들어갈 방 번호 (0이면 rows x cols 크기의 새 방을 만듭니다)
+        :raises OSError: 접속할 수 없거나 timeout 안에 KEYFRAME이 오지 않았을 때
+        """
+        sock = socket.create_connection((host, port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        game = cls(sock)
+        sock.sendall(protocol.encode_join(room, rows, cols, max_apples))
+        while game.grid is None:
+            data = sock.recv(65536)
+            if not data:
+                raise ConnectionError("서버가 연결을 닫았습니다.")
+            for payload in game._reader.feed(data):
+                game.apply_message(payload)
+        sock.setblocking(False)
+        return game
+
+    def poll(self) -> int:
+        """
+        소켓에 도착한 메시지를 모두 적용합니다. 기다리지 않습니다.
+        :return: 진행된 틱 수
+        """
+        if not self.connected:
+            return 0
+        ticks = 0
+        while True:
+            try:
+                data = self._sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                data = b""
+            if not data:
+                self._disconnect()
+                break
+            for payload in self._reader.feed(data):
+                ticks += self.apply_message(payload)
+        return ticks
+
+    def handle_input(self, next_dir: Optional[Tuple[int, int]]):
+        """방향 입력을 서버로 보냅니다. (서버의 방은 첫 입력을 받은 뒤부터 진행됩니다)"""
+        if next_dir:
+            self._send(protocol.encode_input(next_dir))
+
+    def restart(self):
+        """방의 게임을 새로 시작하도록 요청합니다. 새 상태는 서버의 KEYFRAME으로 도착합니다."""
+        self._send(protocol.encode_restart())
+
+    def close(self):
+        if self.connected:
+            self.connected = False
+            self._sock.close()
+
+    def _send(self, data: bytes):
+        if not self.connected:
+            return
+        try:
+            self._sock.sendall(data)
+        except BlockingIOError:
+            pass  # 송신 버퍼가 가득 찬 경우의 입력 하나는 버립니다.
+        except OSError:
+            self._disconnect()
+
+    def _disconnect(self):
+        """서버와의 연결이 끊기면 게임 오버로 처리합니다."""
+        self.close()
+        if not self.game_over and not self.game_win:
+            self.game_over = True
+            self.changes.append((STATE_CHANGED, "game_over"))
@@ -2,12 +2,51 @@
 게임의 주요 설정을 담는 파일입니다.
 색상, 크기, 속도 등 상수를 정의합니다.
 """
+import os
+from types import MappingProxyType
+from typing import Callable, List
 
 # --- SEED 값 (None일 경우 System Time 사용) ---
 # 테스트 시 동일한 사과 위치를 보장하기 위해 고정된 SEED 값을 사용합니다.
 # SEED = 10
 SEED = None
 
+# --- 리플레이 설정 ---
+# True로 설정하면 게임이 끝날 때마다 입력 기록을 REPLAY_DIR에 저장합니다. (replay.py로 재생/검증)
+RECORD_REPLAYS = False
+REPLAY_DIR = "replays"
+
+# --- 네트워크 설정 (server.py / main.py --connect / loadtest.py) ---
+NET_HOST = "127.0.0.1"
+NET_PORT = 7777
+# 진행 중인 방에 전체 상태(KEYFRAME)를 보내는 간격 (틱). 그 사이에는 틱마다 바뀐 칸(DELTA)만 보냅니다.
+NET_KEYFRAME_INTERVAL = 100
+# 클라이언트 송신 버퍼가 이 크기(바이트)를 넘으면 DELTA를 버리고, 버퍼가 비면 KEYFRAME으로 다시 맞춥니다.
+NET_MAX_CLIENT_BUFFER = 64 * 1024
+
+# --- 메인 루프 설정 ---
+# 메뉴/일시정지/게임 오버처럼 화면이 바뀌지 않는 상태에서는 입력이 올 때까지 최대 이 시간(ms)만큼 대기합니다.
+IDLE_WAIT_MS = 500
+# True로 설정하면 게임 종료 시 대기(idle) 시간과 절약된 CPU 시간 추정치를 출력합니다.
+PRINT_LOOP_STATS = False
+
+# 프레임 페이싱 방식
+#   "vsync": 모니터 주사율에 맞춰 그립니다. (지원하지 않으면 "cap"으로 동작)
+#   "cap":   최대 FPS_CAP 프레임으로 제한합니다.
+#   "tick":  게임 플레이 중에는 로직 틱이 진행될 때만 그리고, 그 사이에는 입력을 기다리며 쉽니다.
+FRAME_PACING = "cap"
+FPS_CAP = 60
+# True로 설정하면 틱 사이에 머리와 꼬리를 칸 사이의 위치에 보간하여 그립니다. ("vsync"/"cap"에서 사용)
+INTERPOLATE_MOVEMENT = False
+# 한 프레임에서 따라잡을 수 있는 최대 틱 수. 렉 이후 update()가 연달아 폭주하지 않도록 남은 시간은 버립니다.
+MAX_CATCH_UP_TICKS = 5
+# True로 설정하면 게임 로직을 별도 스레드(logic_thread.py)에서 진행하고, 메인 스레드는 입력과 렌더링만 합니다.
+# (main.py --threaded와 같습니다. 아레나와 클라이언트 모드에서는 사용하지 않습니다)
+THREADED_LOGIC = False
+# 스레드 모드에서 사용할 인터프리터 스레드 전환 간격(초). 렌더링이 GIL을 잡고 있는 동안
+# 로직 스레드가 기다리는 최대 시간이므로, 기본값(5ms)보다 짧게 하여 틱 지터를 줄입니다.
+LOGIC_THREAD_SWITCH_INTERVAL = 0.001
+
 # --- 화면 기본 설정 ---
 # 이 값들은 UI 화면의 최대 크기를 결정하며, 게임 화면은 이보다 작거나 같을 수 있습니다.
 MAX_GRID_COLS = 40
@@ -18,6 +57,13 @@ TILE_SIZE = 20
 UI_SCREEN_WIDTH = MAX_GRID_COLS * TILE_SIZE
 UI_SCREEN_HEIGHT = MAX_GRID_ROWS * TILE_SIZE
 
+# --- 카메라(거대 맵) 설정 ---
+# 창(MAX_GRID_COLS x MAX_GRID_ROWS)보다 큰 맵은 머리를 따라가는 카메라로 화면에 보이는 칸만 그립니다.
+# 머리가 화면 가장자리에서 CAMERA_MARGIN칸 안쪽으로 들어오면 카메라가 그만큼 움직입니다.
+CAMERA_MARGIN = 8
+# 미니맵의 최대 한 변 크기(픽셀). 맵은 이 크기에 맞도록 정사각형 블록 단위로 축소됩니다.
+MINIMAP_MAX_SIZE = 150
+
 
 # --- 색상 정의 (RGB) ---
 BG_COLOR = (20, 20, 20)
@@ -25,6 +71,8 @@ APPLE_COLOR = (255, 50, 50)
 SNAKE_HEAD_COLOR = (0, 200, 0)
 SNAKE_BODY_COLOR = (0, 150, 0)
 GRID_COLOR = (40, 40, 40)
+MINIMAP_BG_COLOR = (10, 10, 10)
+MINIMAP_VIEW_COLOR = (200, 200, 200)
 # UI 관련 색상 추가
 UI_TEXT_COLOR = (220, 220, 220)
 UI_BUTTON_COLOR = (80, 80, 80)
@@ -33,7 +81,11 @@ UI_TITLE_COLOR = (100, 220, 100)
 
 
 # --- 폰트 설정 ---
-FONT_PATH = None  # None으로 설정 시 Pygame 기본 폰트 사용
+# 폰트 파일은 FONT_PATH -> res/의 폰트 파일 -> FONT_CACHE_FILE에 저장된 경로 -> 시스템 폰트(FONT_FAMILIES) 순서로 찾습니다.
+# 어디에서도 찾지 못하면 Pygame 기본 폰트를 사용합니다. (fonts.py 참고)
+FONT_PATH = None
+FONT_FAMILIES = ("malgungothic",)
+FONT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "hebi", "font_path.json")
 FONT_SIZE = 24
 TITLE_FONT_SIZE = 48
 
@@ -50,6 +102,7 @@ MAP_SIZE_OPTIONS = {
     "작게": (20, 15),  # (가로 타일 수, 세로 타일 수)
     "보통": (30, 20),
     "크게": (40, 30),
+    "거대": (500, 500),  # 창보다 크므로 카메라로 일부만 보여줍니다.
 }
 
 APPLE_COUNT_OPTIONS = {
@@ -58,6 +111,17 @@ APPLE_COUNT_OPTIONS = {
     "많게": 10,
 }
 
+# 아레나 모드: 플레이어와 함께 보드를 쓰는 AI 뱀의 수 (0이면 혼자 하는 일반 게임)
+ARENA_SNAKE_OPTIONS = {
+    "없음": 0,
+    "50마리": 50,
+    "200마리": 200,
+}
+# 아레나 모드에서는 맵 크기 설정 대신 이 크기의 보드를 사용합니다. (가로, 세로)
+ARENA_MAP_SIZE = (256, 256)
+# 아레나 모드에서는 사과 개수 설정 대신 뱀 한 마리당 이 개수만큼 사과를 놓습니다.
+ARENA_APPLES_PER_SNAKE = 2
+
 # --- 현재 게임 설정 (딕셔너리) ---
 # 프로그램 실행 중에 UI를 통해 이 딕셔너리의 값이 변경됩니다.
 # 기본값으로 '보통' 난이도를 설정합니다.
@@ -65,10 +129,139 @@ current_settings = {
     "speed": "보통",
     "map_size": "보통",
     "apple_count": "보통",
+    "arena_snakes": "없음",
 }
 
-# 게임 플레이 도중 설정이 변경되었는지 추적하는 플래그
-settings_have_changed = False
+# 설정 변경 알림을 받을 함수 목록 (set_setting에서 호출합니다)
+_settings_listeners: List[Callable[[str, str], None]] = []
+
+
+def add_settings_listener(listener: Callable[[str, str], None]) -> None:
+    """설정 값이 바뀔 때마다 listener(key, value)를 호출하도록 등록합니다."""
+    _settings_listeners.append(listener)
+
+
+def remove_settings_listener(listener: Callable[[str, str], None]) -> None:
+    """add_settings_listener로 등록한 함수를 해제합니다."""
+    if listener in _settings_listeners:
+        _settings_listeners.remove(listener)
+
+
+def set_setting(key: str, value: str) -> None:
+    """
+    current_settings[key]를 value로 바꾸고, 실제로 값이 바뀐 경우에만 등록된 함수들에게 알립니다.
+    """
+    if current_settings[key] == value:
+        return
+    current_settings[key] = value
+    for listener in list(_settings_listeners):
+        listener(key, value)
+
+
+def uses_camera(grid_cols: int, grid_rows: int) -> bool:
+    """맵이 창에 다 들어가지 않아 카메라로 일부만 그려야 하는지 확인합니다."""
+    return grid_cols > MAX_GRID_COLS or grid_rows > MAX_GRID_ROWS
+
+
+class RuntimeConfig:
+    """
+    게임 한 판 동안 사용할 실제 설정 값을 미리 계산해 둔 불변 객체입니다.
+    reset_game()마다 build_runtime_config()로 한 번 만들어 GameState와 렌더러에 전달하므로,
+    매 프레임 get_current_config()처럼 딕셔너리를 새로 만들 필요가 없습니다.
+    """
+    __slots__ = (
+        "game_tick_ms",
+        "tick_dt",
+        "max_apples",
+        "grid_cols",
+        "grid_rows",
+        "tile_size",
+        "camera",
+        "view_cols",
+        "view_rows",
+        "screen_width",
+        "screen_height",
+        "cell_origin",
+        "arena_snakes",
+    )
+
+    def __init__(
+        self,
+        game_tick_ms: int,
+        max_apples: int,
+        grid_cols: int,
+        grid_rows: int,
+        tile_size: int = TILE_SIZE,
+        arena_snakes: int = 0,
+    ):
+        """
+        :param game_tick_ms: 게임 틱 간격 (ms)
+        :param max_apples: 화면에 나타날 최대 사과 개수
+        :param grid_cols: 그리드 가로 타일 수
+        :param grid_rows: 그리드 세로 타일 수
+        :param tile_size: 타일 한 변의 픽셀 크기
+        :param arena_snakes: 플레이어와 함께 보드를 쓰는 AI 뱀의 수 (0이면 일반 게임)
+        """
+        # 카메라 모드에서는 게임 화면이 맵 전체가 아니라 창 크기의 뷰포트입니다.
+        camera = uses_camera(grid_cols, grid_rows)
+        view_cols = min(grid_cols, MAX_GRID_COLS) if camera else grid_cols
+        view_rows = min(grid_rows, MAX_GRID_ROWS) if camera else grid_rows
+        values = {
+            "game_tick_ms": game_tick_ms,
+            "tick_dt": game_tick_ms / 1000.0,
+            "max_apples": max_apples,
+            "grid_cols": grid_cols,
+            "grid_rows": grid_rows,
+            "tile_size": tile_size,
+            "camera": camera,
+            "view_cols": view_cols,
+            "view_rows": view_rows,
+            "screen_width": view_cols * tile_size,
+            "screen_height": view_rows * tile_size,
+            # (row, col) -> 게임 화면 왼쪽 위 기준 칸의 픽셀 좌표
+            # 카메라 모드에서는 뷰포트 안의 상대 좌표이므로, 맵 크기와 상관없이 뷰포트 칸 수만큼만 만듭니다.
+            "cell_origin": MappingProxyType(
+                {(r, c): (c * tile_size, r * tile_size) for r in range(view_rows) for c in range(view_cols)}
+            ),
+            "arena_snakes": arena_snakes,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RuntimeConfig는 변경할 수 없습니다.")
+
+    def __delattr__(self, name):
+        raise AttributeError("RuntimeConfig는 변경할 수 없습니다.")
+
+    def as_dict(self) -> dict:
+        """get_current_config()와 같은 형식의 딕셔너리를 반환합니다. (리플레이 기록용)"""
+        return {
+            "GAME_TICK_MS": self.game_tick_ms,
+            "MAX_APPLES": self.max_apples,
+            "GRID_COLS": self.grid_cols,
+            "GRID_ROWS": self.grid_rows,
+            "SCREEN_WIDTH": self.grid_cols * self.tile_size,
+            "SCREEN_HEIGHT": self.grid_rows * self.tile_size,
+        }
+
+
+def build_runtime_config() -> RuntimeConfig:
+    """현재 UI 설정(current_settings)으로 RuntimeConfig를 만듭니다."""
+    arena_snakes = ARENA_SNAKE_OPTIONS[current_settings["arena_snakes"]]
+    if arena_snakes:
+        map_cols, map_rows = ARENA_MAP_SIZE
+        max_apples = ARENA_APPLES_PER_SNAKE * (arena_snakes + 1)
+    else:
+        map_cols, map_rows = MAP_SIZE_OPTIONS[current_settings["map_size"]]
+        max_apples = APPLE_COUNT_OPTIONS[current_settings["apple_count"]]
+    return RuntimeConfig(
+        game_tick_ms=SPEED_OPTIONS[current_settings["speed"]],
+        max_apples=max_apples,
+        grid_cols=map_cols,
+        grid_rows=map_rows,
+        arena_snakes=arena_snakes,
+    )
 
 
 def get_current_config() -> dict:
@@ -0,0 +1,260 @@
+"""
+강화학습 에이전트를 위한 reset/step 형태의 환경 래퍼입니다.
+
+관측값은 미리 할당된 NumPy 배열 두 개로 구성되며, 매 step마다 같은 버퍼를 재사용합니다.
+- grid: (3, rows, cols) uint8 텐서. 채널 0은 머리, 1은 몸통(머리 포함), 2는 사과입니다.
+- features: (NUM_FEATURES,) float32 벡터. 방향, 머리 위치, 길이, 가장 가까운 사과, 주변 위험 여부.
+
+SubprocVecEnv는 K개의 환경을 서브프로세스에서 실행하며, 관측값/보상/행동을 공유 메모리로
+주고받아 매 step마다 피클링 비용이 들지 않습니다.
+"""
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from game_logic.batch import APPLE_REWARD, DEATH_REWARD, DIRECTION_VECTORS, NO_INPUT
+from game_logic.game_state import GameState
+from game_logic.grid import BODY, APPLE
+from game_logic.rng import derive_seed
+
+HEAD_CHANNEL, BODY_CHANNEL, APPLE_CHANNEL = 0, 1, 2
+NUM_CHANNELS = 3
+# 방향 원-핫(4) + 머리 위치(2) + 길이 비율(1) + 가장 가까운 사과까지의 거리(2) + 4방향 위험 여부(4)
+NUM_FEATURES = 13
+
+
+class SnakeEnv:
+    """
+    GameState를 감싸는 단일 환경입니다.
+    행동은 game_logic.batch의 방향 인덱스(UP/DOWN/LEFT/RIGHT)이며, -1은 입력 없음입니다.
+    """
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        max_apples: int,
+        seed: Optional[int] = None,
+        grid_out: Optional[np.ndarray] = None,
+        features_out: Optional[np.ndarray] = None,
+    ):
+        """
+        :param seed: 사과 생성에 사용할 시드 (이후 reset()은 같은 RNG를 이어서 사용합니다)
+        :param grid_out: 관측 그리드를 기록할 (3, rows, cols) uint8 배열 (공유 메모리 등)
+        :param features_out: 특징 벡터를 기록할 (NUM_FEATURES,) float32 배열
+        """
+        self.rows = rows
+        self.cols = cols
+        self.max_apples = max_apples
+        self._seed = seed
+        self.game_state = None
+
+        self.grid_obs = grid_out if grid_out is not None else np.zeros((NUM_CHANNELS, rows, cols), np.uint8)
+        self.features = features_out if features_out is not None else np.zeros(NUM_FEATURES, np.float32)
+        # 채널별 평탄화된 뷰 (복사 없음)
+        self._head_flat = self.grid_obs[HEAD_CHANNEL].reshape(-1)
+        self._body_flat = self.grid_obs[BODY_CHANNEL].reshape(-1)
+        self._apple_flat = self.grid_obs[APPLE_CHANNEL].reshape(-1)
+        self._cells = None  # GameState 점유 그리드(bytearray)에 대한 NumPy 뷰
+        self._head_idx = 0
+        self._info = {"score": 0, "game_win": False}
+
+    def reset(self) -> Tuple[np.ndarray, np.ndarray]:
+        """새 게임을 시작하고 (grid, features) 관측값을 반환합니다."""
+        if self.game_state is None:
+            self.game_state = GameState(
+                rows=self.rows, cols=self.cols, max_apples=self.max_apples, seed=self._seed
+            )
+        else:
+            self.game_state.reset()
+        # reset()마다 점유 그리드가 새로 만들어지므로 뷰도 다시 연결합니다.
+        self._cells = np.frombuffer(self.game_state.grid.cells, dtype=np.uint8)
+        self._head_flat[self._head_idx] = 0
+        self._write_observation()
+        return self.grid_obs, self.features
+
+    def step(self, action: int) -> Tuple[Tuple[np.ndarray, np.ndarray], float, bool, Dict]:
+        """
+        한 틱 진행합니다.
+        :return: ((grid, features), 보상, 종료 여부, info). 관측 배열과 info는 매번 같은 객체입니다.
+        """
+        game_state = self.game_state
+        score = game_state.score
+        if action != NO_INPUT:
+            game_state.handle_input(DIRECTION_VECTORS[action])
+        game_state.update()
+
+        done = game_state.game_over or game_state.game_win
+        if game_state.game_over:
+            reward = DEATH_REWARD
+        elif game_state.score > score:
+            reward = APPLE_REWARD
+        else:
+            reward = 0.0
+
+        self._write_observation()
+        self._info["score"] = game_state.score
+        self._info["game_win"] = game_state.game_win
+        return (self.grid_obs, self.features), reward, done, self._info
+
+    def _write_observation(self):
+        """현재 게임 상태를 관측 버퍼에 기록합니다. (새 배열을 할당하지 않습니다)"""
+        game_state = self.game_state
+        np.equal(self._cells, BODY, out=self._body_flat, casting="unsafe")
+        np.equal(self._cells, APPLE, out=self._apple_flat, casting="unsafe")
+
+        head_r, head_c = game_state.snake.head()
+        self._head_flat[self._head_idx] = 0
+        self._head_idx = head_r * self.cols + head_c
+        self._head_flat[self._head_idx] = 1
+
+        f = self.features
+        f[0:4] = 0.0
+        f[DIRECTION_VECTORS.index(game_state.snake.direction)] = 1.0
+        f[4] = head_r / self.rows
+        f[5] = head_c / self.cols
+        f[6] = game_state.snake.length / (self.rows * self.cols)
+
+        f[7] = f[8] = 0.0
+        best = None
+        for apple_r, apple_c in game_state.apples:
+            dist = abs(apple_r - head_r) + abs(apple_c - head_c)
+            if best is None or dist < best:
+                best = dist
+                f[7] = (apple_r - head_r) / self.rows
+                f[8] = (apple_c - head_c) / self.cols
+
+        cells = game_state.grid.cells
+        for i, (dr, dc) in enumerate(DIRECTION_VECTORS):
+            r, c = head_r + dr, head_c + dc
+            blocked = not (0 <= r < self.rows and 0 <= c < self.cols) or cells[r * self.cols + c] == BODY
+            f[9 + i] = 1.0 if blocked else 0.0
+
+
+def _worker(index: int, conn, shm_names: Dict[str, str], num_envs: int, rows: int, cols: int,
+            max_apples: int, seed: Optional[int]):
+    """SubprocVecEnv의 서브프로세스 본체. 공유 메모리의 자기 슬롯에 직접 관측값을 기록합니다."""
+    blocks = {name: shared_memory.SharedMemory(name=shm) for name, shm in shm_names.items()}
+    arrays = _shared_arrays(blocks, num_envs, rows, cols)
+    env = SnakeEnv(
+        rows,
+        cols,
+        max_apples,
+        seed=None if seed is None else derive_seed(seed, index),
+        grid_out=arrays["grid"][index],
+        features_out=arrays["features"][index],
+    )
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                _, reward, done, info = env.step(int(arrays["actions"][index]))
+                arrays["rewards"][index] = reward
+                arrays["dones"][index] = done
+                arrays["scores"][index] = info["score"]
+                if done:
+                    env.reset()  # 끝난 환경은 자동으로 리셋합니다.
+                conn.send(None)
+            elif command == "reset":
+                env.reset()
+                conn.send(None)
+            elif command == "close":
+                break
+    finally:
+        del arrays, env
+        for block in blocks.values():
+            block.close()
+        conn.close()
+
+
+def _shared_arrays(blocks: Dict, num_envs: int, rows: int, cols: int) -> Dict[str, np.ndarray]:
+    """공유 메모리 블록들을 NumPy 배열로 감쌉니다."""
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+        for name, (shape, dtype) in _shared_layout(num_envs, rows, cols).items()
+    }
+
+
+def _shared_layout(num_envs: int, rows: int, cols: int) -> Dict[str, Tuple[tuple, type]]:
+    """공유 메모리에 올라가는 배열들의 (shape, dtype) 정의입니다."""
+    return {
+        "grid": ((num_envs, NUM_CHANNELS, rows, cols), np.uint8),
+        "features": ((num_envs, NUM_FEATURES), np.float32),
+        "actions": ((num_envs,), np.int64),
+        "rewards": ((num_envs,), np.float32),
+        "dones": ((num_envs,), np.bool_),
+        "scores": ((num_envs,), np.int64),
+    }
+
+
+class SubprocVecEnv:
+    """
+    K개의 SnakeEnv를 서브프로세스에서 병렬로 실행하는 벡터화 환경입니다.
+    파이프로는 짧은 명령만 주고받고, 관측값/보상/행동은 모두 공유 메모리를 통해 전달합니다.
+    반환되는 배열들은 공유 메모리 위의 뷰이며 다음 step()에서 덮어쓰여집니다.
+    """
+    def __init__(self, num_envs: int, rows: int, cols: int, max_apples: int, seed: Optional[int] = None):
+        self.num_envs = num_envs
+        layout = _shared_layout(num_envs, rows, cols)
+        self._blocks = {
+            name: shared_memory.SharedMemory(
+                create=True, size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            )
+            for name, (shape, dtype) in layout.items()
+        }
+        self._arrays = _shared_arrays(self._blocks, num_envs, rows, cols)
+        shm_names = {name: block.name for name, block in self._blocks.items()}
+
+        self._conns = []
+        self._processes = []
+        for index in range(num_envs):
+            parent_conn, child_conn = mp.Pipe()
+            process = mp.Process(
+                target=_worker,
+                args=(index, child_conn, shm_names, num_envs, rows, cols, max_apples, seed),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def reset(self) -> Tuple[np.ndarray, np.ndarray]:
+        """모든 환경을 리셋하고 (K, 3, rows, cols) 그리드와 (K, NUM_FEATURES) 특징을 반환합니다."""
+        self._broadcast("reset")
+        return self._arrays["grid"], self._arrays["features"]
+
+    def step(self, actions) -> Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray, np.ndarray]:
+        """
+        모든 환경을 한 틱 진행합니다. 끝난 환경은 자동으로 리셋되며,
+        그 환경의 관측값은 새 게임의 첫 관측값입니다.
+        """
+        self._arrays["actions"][:] = actions
+        self._broadcast("step")
+        return (self._arrays["grid"], self._arrays["features"]), self._arrays["rewards"], self._arrays["dones"]
+
+    @property
+    def scores(self) -> np.ndarray:
+        """마지막 step()이 끝난 시점의 환경별 점수 (리셋 전 점수)"""
+        return self._arrays["scores"]
+
+    def _broadcast(self, command: str):
+        for conn in self._conns:
+            conn.send(command)
+        for conn in self._conns:
+            conn.recv()
+
+    def close(self):
+        """서브프로세스를 종료하고 공유 메모리를 해제합니다."""
+        for conn in self._conns:
+            conn.send("close")
+        for process in self._processes:
+            process.join()
+        for conn in self._conns:
+            conn.close()
+        self._arrays = None
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks = {}
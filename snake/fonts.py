@@ -0,0 +1,123 @@
+"""
+게임에서 사용할 폰트 파일을 찾고, 크기별 Font 객체를 필요할 때 한 번만 만드는 모듈입니다.
+
+pygame.font.SysFont()는 처음 호출될 때 시스템의 모든 폰트를 나열합니다. (Linux에서는 fc-list 실행)
+이는 실행 시간 중 가장 느린 부분이므로, 폰트 파일은 다음 순서로 찾습니다.
+    1. config.FONT_PATH (직접 지정한 파일)
+    2. res/ 폴더에 함께 배포된 폰트 파일 (.ttf/.otf/.ttc)
+    3. 이전 실행에서 찾아 둔 경로 (config.FONT_CACHE_FILE)
+    4. 시스템 폰트 나열 (config.FONT_FAMILIES 순서) — 결과는 3번의 캐시 파일에 저장합니다.
+어디에서도 찾지 못하면 Pygame 기본 폰트를 사용합니다. 폰트를 새로 설치했다면 캐시 파일을 지우면 됩니다.
+"""
+import json
+import os
+from typing import Dict, Optional
+
+import pygame
+
+import assets
+import config
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# 찾은 폰트 경로 (None이면 기본 폰트) — 한 프로세스에서는 한 번만 찾습니다.
+_resolved = False
+_font_path = None
+# 크기별로 만든 Font 객체
+_fonts: Dict[int, pygame.font.Font] = {}
+
+
+def resolve_font_path(cache_file: Optional[str] = None) -> Optional[str]:
+    """
+    사용할 폰트 파일 경로를 반환합니다. (None이면 Pygame 기본 폰트)
+    :param cache_file: 시스템 폰트 검색 결과를 저장할 파일 (None이면 config.FONT_CACHE_FILE)
+    """
+    global _resolved, _font_path
+    if _resolved:
+        return _font_path
+
+    cache_file = cache_file or config.FONT_CACHE_FILE
+    _font_path = (
+        _configured_font()
+        or _bundled_font()
+        or _cached_font(cache_file)
+    )
+    if _font_path is None and not _has_cache_entry(cache_file):
+        _font_path = pygame.font.match_font(config.FONT_FAMILIES)
+        _save_cache(cache_file, _font_path)
+    _resolved = True
+    return _font_path
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """size 크기의 Font 객체를 반환합니다. 처음 요청된 크기만 파일에서 읽습니다."""
+    font = _fonts.get(size)
+    if font is None:
+        path = resolve_font_path()
+        try:
+            font = pygame.font.Font(path, size)
+        except (pygame.error, OSError):
+            print(f"폰트 '{path}'를 읽을 수 없어 기본 폰트를 사용합니다.")
+            font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+
+def clear_cache():
+    """메모리에 기억한 폰트 경로와 Font 객체를 버립니다. (디스크 캐시는 유지합니다)"""
+    global _resolved, _font_path
+    _resolved = False
+    _font_path = None
+    _fonts.clear()
+
+
+def _configured_font() -> Optional[str]:
+    if config.FONT_PATH and os.path.isfile(config.FONT_PATH):
+        return config.FONT_PATH
+    return None
+
+
+def _bundled_font() -> Optional[str]:
+    base_path = assets.resource_dir()
+    try:
+        names = sorted(os.listdir(base_path))
+    except OSError:
+        return None
+    for name in names:
+        if name.lower().endswith(FONT_EXTENSIONS):
+            return os.path.join(base_path, name)
+    return None
+
+
+def _load_cache(cache_file: str) -> Optional[Dict]:
+    """캐시 파일을 읽습니다. 폰트 목록(FONT_FAMILIES)이 바뀌었거나 파일이 없으면 None입니다."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("families") != list(config.FONT_FAMILIES):
+        return None
+    return data
+
+
+def _cached_font(cache_file: str) -> Optional[str]:
+    data = _load_cache(cache_file)
+    if data and data.get("path") and os.path.isfile(data["path"]):
+        return data["path"]
+    return None
+
+
+def _has_cache_entry(cache_file: str) -> bool:
+    """캐시에 "찾지 못함(기본 폰트)" 결과가 저장되어 있어도 다시 나열하지 않기 위한 확인입니다."""
+    data = _load_cache(cache_file)
+    return data is not None and data.get("path") is None
+
+
+def _save_cache(cache_file: str, path: Optional[str]):
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"families": list(config.FONT_FAMILIES), "path": path}, f, ensure_ascii=False)
+    except OSError:
+        pass  # 캐시를 저장하지 못해도 다음 실행에서 다시 찾으면 되므로 무시합니다.
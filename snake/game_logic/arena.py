@@ -0,0 +1,314 @@
+"""
+여러 마리의 뱀이 한 보드를 함께 쓰는 아레나(multi-snake) 모드의 게임 상태입니다.
+
+모든 뱀은 하나의 OccupancyGrid를 공유하므로, 어떤 뱀과 부딪혔는지와 상관없이 충돌 검사는 칸 하나를 읽는 O(1)입니다.
+한 틱은 다음 순서로 처리합니다.
+    1. [정책] AI 뱀마다 policy(arena, i)로 다음 방향을 정합니다.
+    2. [예측] 살아있는 뱀마다 다음 머리 칸을 계산하고, 칸 -> 뱀 번호 딕셔너리 한 번의 순회로
+       같은 칸에 들어가려는 뱀들(머리끼리 충돌)을 찾습니다. 사과를 먹지 않는 뱀의 꼬리 칸은 비워질 칸으로 모아 둡니다.
+    3. [충돌 검사] 벽, 머리끼리 충돌, 비워지지 않는 몸통 칸에 들어가는 뱀은 죽습니다.
+    4. [실행] 죽은 뱀의 몸통을 지우고, 살아남은 뱀의 꼬리를 모두 비운 다음 머리를 추가합니다.
+       (다른 뱀이 방금 비운 꼬리 칸으로 들어가는 경우를 순서와 상관없이 같게 처리하기 위해서입니다)
+    5. 먹은 사과만큼 공유 사과를 다시 생성하고, 죽은 AI 뱀은 빈 칸에서 다시 태어납니다.
+
+뱀마다 링 버퍼(Snake)에서 머리와 꼬리만 바뀌므로 틱 비용은 뱀의 수에 비례하고, 몸통 길이의 합과는 무관합니다.
+(죽은 뱀의 몸통을 지우는 비용만 그 뱀의 길이에 비례합니다)
+"""
+from typing import Callable, List, Optional, Tuple
+
+import config
+from game_logic.game_state import (
+    HEAD_ADDED,
+    TAIL_REMOVED,
+    APPLE_SPAWNED,
+    APPLE_EATEN,
+    SCORE_CHANGED,
+    STATE_CHANGED,
+)
+from game_logic.grid import OccupancyGrid, EMPTY, BODY, APPLE
+from game_logic.rng import SpawnRng
+from game_logic.snake import Snake, DIRECTION_VECTORS
+
+# 아레나 뱀의 링 버퍼 초기 크기. (뱀마다 보드 칸 수만큼 할당하면 256x256 보드의 뱀 200마리에 50MB가 필요합니다)
+SNAKE_START_CAPACITY = 64
+
+# policy(arena, i)는 i번 뱀의 다음 방향 벡터 또는 입력이 없을 경우 None을 반환합니다.
+ArenaPolicy = Callable[["ArenaState", int], Optional[Tuple[int, int]]]
+
+
+class ArenaState:
+    """
+    N마리의 뱀, 공유 사과, 뱀별 점수를 관리하는 클래스입니다.
+    player=True이면 0번 뱀은 handle_input()으로 조종하는 플레이어이며, 나머지는 policy가 조종합니다.
+    플레이어 뱀에 대해서는 GameState와 같은 인터페이스(snake, score, is_over() 등)를 제공하므로
+    main.py의 게임 루프를 그대로 사용할 수 있습니다.
+    """
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        max_apples: int,
+        num_snakes: int,
+        seed: int = None,
+        policy: Optional[ArenaPolicy] = None,
+        player: bool = False,
+        respawn: bool = True,
+    ):
+        """
+        :param rows: 게임 그리드의 세로 크기
+        :param cols: 게임 그리드의 가로 크기
+        :param max_apples: 보드에 동시에 존재할 수 있는 최대 사과 개수 (모든 뱀이 함께 사용)
+        :param num_snakes: 뱀의 수 (플레이어 포함)
+        :param seed: 뱀/사과 생성에 사용할 시드 (None이면 config.SEED, 그것도 None이면 무작위)
+        :param policy: AI 뱀들의 방향을 정하는 함수 (None이면 handle_input()으로만 조종합니다)
+        :param player: True이면 0번 뱀은 플레이어이며, 플레이어가 죽으면 게임이 끝납니다.
+        :param respawn: True이면 죽은 AI 뱀이 다음 틱에 빈 칸에서 다시 태어납니다.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.max_apples = max_apples
+        self.num_snakes = num_snakes
+        self.seed = config.SEED if seed is None else seed
+        self.policy = policy
+        self.player = player
+        self.respawn = respawn
+        self.rng = SpawnRng()
+        self.tick = 0
+        self.grid = None
+        self.snakes: List[Snake] = []
+        self.alive = bytearray(num_snakes)  # 뱀 번호 -> 살아있으면 1
+        self.scores = [0] * num_snakes
+        self.apples = []
+        self.deaths = 0  # 통계: 지금까지 죽은 뱀의 수
+        self.game_over = False
+        self.game_win = False  # 아레나에는 승리 조건이 없습니다. (GameState와 같은 인터페이스용)
+        # 변경 피드 버퍼 (enable_changes()를 호출해야 기록됩니다)
+        self.changes = None
+        self.reset(self.seed)
+
+    @classmethod
+    def from_config(
+        cls, runtime_config: config.RuntimeConfig, seed: int = None, policy: Optional[ArenaPolicy] = None
+    ) -> "ArenaState":
+        """RuntimeConfig의 그리드 크기와 AI 뱀 수로 플레이어가 있는 아레나를 만듭니다."""
+        num_snakes = runtime_config.arena_snakes + 1
+        return cls(
+            rows=runtime_config.grid_rows,
+            cols=runtime_config.grid_cols,
+            max_apples=runtime_config.max_apples,
+            num_snakes=num_snakes,
+            seed=seed,
+            policy=policy,
+            player=True,
+        )
+
+    @property
+    def snake(self) -> Snake:
+        """0번(플레이어) 뱀"""
+        return self.snakes[0]
+
+    @property
+    def score(self) -> int:
+        """0번(플레이어) 뱀의 점수"""
+        return self.scores[0]
+
+    def reset(self, seed: int = None):
+        """
+        아레나를 초기 상태로 리셋합니다. 모든 뱀은 무작위 빈 칸에서 길이 1로 시작합니다.
+        :param seed: 주어지면 RNG를 이 값으로 다시 시드합니다.
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+
+        self.grid = OccupancyGrid(self.rows, self.cols)
+        self.snakes = []
+        self.alive = bytearray(self.num_snakes)
+        self.scores = [0] * self.num_snakes
+        self.apples = []
+        self.deaths = 0
+        self.game_over = False
+        self.tick = 0
+        if self.changes is not None:
+            self.changes.clear()
+            self.changes.append((STATE_CHANGED, "reset"))
+
+        for i in range(self.num_snakes):
+            # 빈 몸통으로 만든 뒤 _spawn_snake가 위치를 정합니다.
+            self.snakes.append(Snake([], (0, 1), self.grid, capacity=SNAKE_START_CAPACITY))
+            self._spawn_snake(i)
+        for _ in range(self.max_apples):
+            self._spawn_apple()
+
+    def _spawn_snake(self, i: int) -> bool:
+        """
+        i번 뱀을 무작위 빈 칸에서 길이 1로 다시 태어나게 합니다. 가능하면 앞 칸이 비어있는 방향을 봅니다.
+        :return: 빈 칸이 없어 태어나지 못했다면 False
+        """
+        grid = self.grid
+        free_count = grid.free_count()
+        if free_count == 0:
+            return False
+        idx = grid.free[self.rng.index(free_count)]
+        r, c = divmod(idx, self.cols)
+        first = self.rng.index(4)
+        direction = DIRECTION_VECTORS[first]
+        for k in range(4):
+            dr, dc = DIRECTION_VECTORS[(first + k) % 4]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and grid.cells[nr * self.cols + nc] == EMPTY:
+                direction = (dr, dc)
+                break
+
+        snake = self.snakes[i]
+        snake.set_body([(r, c)])
+        snake.direction = direction
+        snake._next_direction = direction
+        grid.set_index(idx, BODY)
+        self.alive[i] = 1
+        self.scores[i] = 0
+        if self.changes is not None:
+            self.changes.append((HEAD_ADDED, ((r, c), direction)))
+        return True
+
+    def _spawn_apple(self):
+        """빈 칸 중 하나를 균등하게 골라 사과를 놓습니다. 빈 칸이 없으면 아무것도 하지 않습니다."""
+        free_count = self.grid.free_count()
+        if free_count == 0:
+            return
+        new_pos = self.grid.free_cell_at(self.rng.index(free_count))
+        self.apples.append(new_pos)
+        self.grid.set(new_pos, APPLE)
+        if self.changes is not None:
+            self.changes.append((APPLE_SPAWNED, new_pos))
+
+    def enable_changes(self):
+        """변경 피드를 켭니다. 이벤트 형식은 GameState.changes와 같으며, 머리/꼬리 이벤트는 모든 뱀의 것이 섞여 있습니다."""
+        if self.changes is None:
+            self.changes = []
+
+    def clear_changes(self):
+        """처리한 변경 이벤트를 비웁니다. 리스트 객체는 재사용합니다."""
+        if self.changes is not None:
+            self.changes.clear()
+
+    def handle_input(self, next_dir: tuple, i: int = 0):
+        """i번 뱀(기본값: 플레이어)의 다음 방향을 설정합니다."""
+        if next_dir and self.alive[i]:
+            self.snakes[i].set_direction(next_dir)
+
+    def update(self):
+        """모든 뱀을 한 틱 동시에 움직입니다. 처리 순서는 모듈 설명을 참고하세요."""
+        if self.game_over:
+            return
+        self.tick += 1
+        snakes, alive = self.snakes, self.alive
+        rows, cols = self.rows, self.cols
+        cells = self.grid.cells
+        changes = self.changes
+
+        # 1. [정책] AI 뱀의 방향을 정합니다.
+        policy = self.policy
+        if policy is not None:
+            for i in range(1 if self.player else 0, self.num_snakes):
+                if alive[i]:
+                    direction = policy(self, i)
+                    if direction:
+                        snakes[i].set_direction(direction)
+
+        # 2. [예측] 다음 머리 칸과, 같은 칸을 노리는 뱀(머리끼리 충돌)을 한 번의 순회로 찾습니다.
+        claims = {}  # 다음 머리 칸 -> 그 칸에 먼저 들어가려는 뱀 번호
+        crashed = set()
+        vacated = set()  # 이번 틱에 비워지는 꼬리 칸
+        dying = []
+        moves = []
+        for i in range(self.num_snakes):
+            if not alive[i]:
+                continue
+            snake = snakes[i]
+            dr, dc = snake._next_direction
+            r, c = divmod(snake.ring[snake.head_slot], cols)
+            r += dr
+            c += dc
+            tail = snake.ring[snake.head_slot - snake.length + 1]
+            if not (0 <= r < rows and 0 <= c < cols):
+                dying.append(i)  # 벽 충돌
+                vacated.add(tail)
+                continue
+            nxt = r * cols + c
+            other = claims.get(nxt)
+            if other is None:
+                claims[nxt] = i
+            else:
+                crashed.add(i)
+                crashed.add(other)
+            grow = cells[nxt] == APPLE
+            if not grow:
+                vacated.add(tail)
+            moves.append((i, nxt, grow))
+
+        # 3. [충돌 검사] 머리끼리 부딪혔거나, 이번 틱에 비워지지 않는 몸통 칸으로 들어가는 뱀은 죽습니다.
+        survivors = []
+        for move in moves:
+            i, nxt = move[0], move[1]
+            if i in crashed or (cells[nxt] == BODY and nxt not in vacated):
+                dying.append(i)
+            else:
+                survivors.append(move)
+
+        # 4. [실행] 죽은 뱀을 지우고, 살아남은 뱀의 꼬리를 모두 비운 뒤 머리를 추가합니다.
+        for i in dying:
+            self._kill(i)
+        for i, nxt, grow in survivors:
+            if not grow:
+                idx = snakes[i].pop_tail()
+                if changes is not None:
+                    changes.append((TAIL_REMOVED, divmod(idx, cols)))
+        eaten = 0
+        for i, nxt, grow in survivors:
+            snake = snakes[i]
+            snake.push_head()
+            pos = divmod(nxt, cols)
+            if changes is not None:
+                changes.append((HEAD_ADDED, (pos, snake.direction)))
+            if grow:
+                eaten += 1
+                self.scores[i] += 1
+                self.apples.remove(pos)
+                if changes is not None:
+                    changes.append((APPLE_EATEN, pos))
+                    if i == 0 and self.player:
+                        changes.append((SCORE_CHANGED, self.scores[0]))
+
+        # 5. 먹은 만큼 사과를 다시 놓고, 죽은 AI 뱀을 다시 태어나게 합니다.
+        for _ in range(eaten):
+            self._spawn_apple()
+        if self.player and not alive[0]:
+            self.game_over = True
+            if changes is not None:
+                changes.append((STATE_CHANGED, "game_over"))
+        if self.respawn:
+            for i in dying:
+                if i != 0 or not self.player:
+                    self._spawn_snake(i)
+
+    def _kill(self, i: int):
+        """i번 뱀을 죽이고 몸통을 보드에서 지웁니다. (이 뱀의 길이에 비례하는 비용)"""
+        snake = self.snakes[i]
+        snake.set_direction_if_collision()
+        self.alive[i] = 0
+        self.deaths += 1
+        grid, changes, cols = self.grid, self.changes, self.cols
+        for idx in snake.iter_indices():
+            grid.set_index(idx, EMPTY)
+            if changes is not None:
+                changes.append((TAIL_REMOVED, divmod(idx, cols)))
+
+    def alive_count(self) -> int:
+        """살아있는 뱀의 수"""
+        return self.alive.count(1)
+
+    def is_win(self) -> bool:
+        return self.game_win
+
+    def is_over(self) -> bool:
+        return self.game_over
@@ -0,0 +1,225 @@
+"""
+N개의 게임을 NumPy 배열로 저장하고 한 번의 벡터화된 호출로 동시에 진행시키는 배치 게임 상태입니다.
+에이전트 학습이나 설정 옵션(속도/맵 크기/사과 개수)의 통계적 밸런싱처럼
+수천만 틱이 필요한 경우에 사용합니다.
+
+규칙은 GameState.update / Snake.move와 동일하며, 같은 시드를 사용하면 (GameState(seed=s)와 비교)
+각 게임의 진행(빈 칸 인덱스의 순서와 사과 생성 위치까지)이 스칼라 GameState와 정확히 일치합니다.
+사과 생성 난수도 SpawnRng와 같은 블록 단위로 미리 만들어 두므로 생성과 리셋까지 모두 벡터화됩니다.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from game_logic.grid import OccupancyGrid, EMPTY, BODY, APPLE
+from game_logic.rng import BLOCK_SIZE, SpawnRng, derive_seed
+from game_logic.snake import Snake, UP, DOWN, LEFT, RIGHT, DIRECTION_VECTORS, DIRECTION_INDEX
+
+# step()의 actions 배열은 방향 인덱스(UP/DOWN/LEFT/RIGHT)를 사용하며, -1은 입력 없음을 의미합니다.
+NO_INPUT = -1
+
+_DR = np.array([v[0] for v in DIRECTION_VECTORS], dtype=np.int64)
+_DC = np.array([v[1] for v in DIRECTION_VECTORS], dtype=np.int64)
+_OPPOSITE = np.array([DOWN, UP, RIGHT, LEFT], dtype=np.int64)
+
+# --- 보상 ---
+APPLE_REWARD = 1.0
+DEATH_REWARD = -1.0
+
+
+class BatchGameState:
+    """
+    N개의 게임을 배열 형태로 관리하는 클래스입니다.
+    - grid: (N, rows * cols) 점유 그리드 (EMPTY/BODY/APPLE)
+    - body: (N, rows * cols) 링 버퍼. head_ptr 위치가 머리, 그로부터 length - 1칸 앞이 꼬리입니다.
+    - free / free_pos / free_count: 게임별 빈 칸 인덱스 (OccupancyGrid와 동일한 swap-remove 방식)
+    - rand_block / rand_pos: 게임별로 미리 생성된 사과 생성용 32비트 난수 블록과 읽기 위치
+    끝난 게임은 step() 안에서 자동으로 리셋됩니다.
+    """
+    def __init__(self, num_games: int, rows: int, cols: int, max_apples: int, seed: Optional[int] = None):
+        """
+        :param num_games: 동시에 진행할 게임 수
+        :param rows: 게임 그리드의 세로 크기
+        :param cols: 게임 그리드의 가로 크기
+        :param max_apples: 게임마다 동시에 존재할 수 있는 최대 사과 개수
+        :param seed: 마스터 시드. i번째 게임은 derive_seed(seed, i)로 시드됩니다. (None이면 무작위)
+        """
+        self.num_games = num_games
+        self.rows = rows
+        self.cols = cols
+        self.max_apples = max_apples
+        n, cells = num_games, rows * cols
+        self._cells = cells
+
+        self.rngs = [SpawnRng(None if seed is None else derive_seed(seed, i)) for i in range(n)]
+        self.rand_block = np.zeros((n, BLOCK_SIZE), dtype=np.uint64)
+        self.rand_pos = np.full(n, BLOCK_SIZE, dtype=np.int64)  # 첫 생성 시 블록을 채웁니다.
+
+        self.grid = np.zeros((n, cells), dtype=np.uint8)
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.direction = np.zeros(n, dtype=np.int64)
+        self.next_direction = np.zeros(n, dtype=np.int64)
+        self.free = np.zeros((n, cells), dtype=np.int32)
+        self.free_pos = np.zeros((n, cells), dtype=np.int32)
+        self.free_count = np.zeros(n, dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.int64)
+
+        # 이번 step()에서 끝난 게임들의 최종 점수와 승리 여부 (자동 리셋 전에 기록됩니다)
+        self.final_scores = np.zeros(n, dtype=np.int64)
+        self.wins = np.zeros(n, dtype=bool)
+
+        # 평탄화된 뷰와 게임별 시작 오프셋: 2차원 fancy indexing 대신 1차원 인덱싱을 사용합니다.
+        self._grid_flat = self.grid.reshape(-1)
+        self._body_flat = self.body.reshape(-1)
+        self._free_flat = self.free.reshape(-1)
+        self._free_pos_flat = self.free_pos.reshape(-1)
+        self._base = np.arange(n, dtype=np.int64) * cells
+
+        self._build_reset_template()
+        self.reset_games(np.arange(n))
+
+    def _build_reset_template(self):
+        """
+        스칼라 GameState.reset()과 동일한 초기 상태(사과 생성 전)를 한 번 만들어 두고,
+        게임을 리셋할 때마다 복사해서 사용합니다.
+        """
+        grid = OccupancyGrid(self.rows, self.cols)
+        r, c = self.rows // 2, self.cols // 2
+        snake = Snake([(r, c), (r, c - 1), (r, c - 2)], (0, 1), grid)
+
+        self._template_grid = np.frombuffer(bytes(grid.cells), dtype=np.uint8)
+        self._template_free = np.zeros(self._cells, dtype=np.int32)
+        self._template_free[: len(grid.free)] = grid.free
+        self._template_free_pos = np.array(grid.free_pos, dtype=np.int32)
+        self._template_free_count = len(grid.free)
+        # 링 버퍼에는 꼬리부터 머리 순서로 저장합니다.
+        self._template_body = snake.indices().tolist()[::-1]
+        self._template_direction = DIRECTION_INDEX[snake.direction]
+
+    def reset_games(self, games: np.ndarray):
+        """주어진 게임들을 초기 상태로 리셋하고 사과를 생성합니다."""
+        self.grid[games] = self._template_grid
+        self.free[games] = self._template_free
+        self.free_pos[games] = self._template_free_pos
+        self.free_count[games] = self._template_free_count
+        length = len(self._template_body)
+        self.body[games, :length] = self._template_body
+        self.head_ptr[games] = length - 1
+        self.length[games] = length
+        self.direction[games] = self._template_direction
+        self.next_direction[games] = self._template_direction
+        self.scores[games] = 0
+        for _ in range(self.max_apples):
+            self._spawn_apples(games)
+
+    def _spawn_apples(self, games: np.ndarray):
+        """
+        주어진 게임들에 각각 사과를 하나씩 생성합니다. (게임마다 빈 칸 중 하나를 균등하게 선택)
+        빈 칸이 없는 게임은 건너뜁니다.
+        """
+        games = games[self.free_count[games] > 0]
+        if not games.size:
+            return
+        # 난수 블록을 다 쓴 게임만 새 블록을 채웁니다. (BLOCK_SIZE번 생성마다 한 번)
+        for g in games[self.rand_pos[games] == BLOCK_SIZE].tolist():
+            self.rand_block[g] = np.frombuffer(self.rngs[g].next_block_bytes(), dtype="<u4")
+            self.rand_pos[g] = 0
+        values = self.rand_block[games, self.rand_pos[games]]
+        self.rand_pos[games] += 1
+
+        base = self._base[games]
+        free_count = self.free_count[games]
+        i = ((values * free_count.astype(np.uint64)) >> np.uint64(32)).astype(np.int64)
+        cell = self._free_flat[base + i]
+        self._grid_flat[base + cell] = APPLE
+        # swap-remove (OccupancyGrid._remove_free와 동일)
+        last = self._free_flat[base + free_count - 1]
+        self._free_flat[base + i] = last
+        self._free_pos_flat[base + last] = i
+        self._free_pos_flat[base + cell] = -1
+        self.free_count[games] = free_count - 1
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        모든 게임을 한 틱 진행합니다. (GameState.handle_input + update와 동일)
+        :param actions: (N,) 방향 인덱스 배열 (UP/DOWN/LEFT/RIGHT, 입력이 없으면 -1)
+        :return: (보상, 종료 여부) 배열. 종료된 게임은 반환 전에 자동으로 리셋됩니다.
+        """
+        cells = self._cells
+        base = self._base
+        actions = np.asarray(actions, dtype=np.int64)
+
+        # 1. 입력 처리: 현재 방향의 정반대가 아닌 입력만 다음 방향으로 예약합니다.
+        valid = (actions >= 0) & (actions != _OPPOSITE[self.direction])
+        self.next_direction[valid] = actions[valid]
+        next_dir = self.next_direction
+
+        # 2. [예측] 다음 머리 위치
+        head = self._body_flat[base + self.head_ptr]
+        next_r = head // self.cols + _DR[next_dir]
+        next_c = head % self.cols + _DC[next_dir]
+
+        # 3. [충돌 검사] 벽 -> 자기 몸 (꼬리는 성장하지 않으면 비워지므로 제외)
+        wall = (next_r < 0) | (next_r >= self.rows) | (next_c < 0) | (next_c >= self.cols)
+        next_idx = np.where(wall, 0, next_r * self.cols + next_c)
+        cell = self._grid_flat[base + next_idx]
+        tail = self._body_flat[base + (self.head_ptr - self.length + 1) % cells]
+        dead = wall | ((cell == BODY) & (next_idx != tail))
+        grow = (cell == APPLE) & ~dead
+        # 충돌한 게임도 머리 방향은 갱신합니다. (set_direction_if_collision)
+        self.direction[:] = next_dir
+
+        # 4. [실행] 성장하지 않는 게임은 꼬리를 먼저 비웁니다.
+        g = np.flatnonzero(~dead & ~grow)
+        if g.size:
+            flat_tail = base[g] + tail[g]
+            self._grid_flat[flat_tail] = EMPTY
+            self._free_pos_flat[flat_tail] = self.free_count[g]
+            self._free_flat[base[g] + self.free_count[g]] = tail[g]
+            self.free_count[g] += 1
+
+            # 머리가 들어갈 빈 칸을 빈 칸 인덱스에서 swap-remove 합니다.
+            flat_head = base[g] + next_idx[g]
+            i = self._free_pos_flat[flat_head]
+            last = self._free_flat[base[g] + self.free_count[g] - 1]
+            self._free_flat[base[g] + i] = last
+            self._free_pos_flat[base[g] + last] = i
+            self._free_pos_flat[flat_head] = -1
+            self.free_count[g] -= 1
+
+        # 머리를 몸통의 맨 앞에 추가합니다. (사과 칸은 빈 칸 인덱스에 없으므로 태그만 바꿉니다)
+        g = np.flatnonzero(~dead)
+        self._grid_flat[base[g] + next_idx[g]] = BODY
+        self.head_ptr[g] = (self.head_ptr[g] + 1) % cells
+        self._body_flat[base[g] + self.head_ptr[g]] = next_idx[g]
+        self.length += grow
+        self.scores += grow
+
+        # 5. 사과를 먹은 게임에만 새 사과를 생성합니다.
+        self._spawn_apples(np.flatnonzero(grow))
+
+        rewards = np.where(grow, APPLE_REWARD, 0.0).astype(np.float32)
+        rewards[dead] = DEATH_REWARD
+
+        # 6. 승리/패배한 게임은 결과를 기록하고 자동으로 리셋합니다.
+        won = self.length == cells
+        dones = dead | won
+        self.final_scores[:] = 0
+        self.wins[:] = False
+        done_games = np.flatnonzero(dones)
+        if done_games.size:
+            self.final_scores[done_games] = self.scores[done_games]
+            self.wins[done_games] = won[done_games]
+            self.reset_games(done_games)
+        return rewards, dones
+
+    def apple_mask(self) -> np.ndarray:
+        """(N, rows, cols) 형태의 사과 위치 마스크를 반환합니다."""
+        return (self.grid == APPLE).reshape(self.num_games, self.rows, self.cols)
+
+    def snake_body(self, g: int) -> list:
+        """g번째 게임의 뱀 몸통을 머리부터 꼬리 순서의 (row, col) 목록으로 반환합니다."""
+        ptrs = (self.head_ptr[g] - np.arange(self.length[g])) % self._cells
+        return [divmod(int(idx), self.cols) for idx in self.body[g, ptrs]]
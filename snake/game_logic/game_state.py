@@ -1,7 +1,19 @@
-from collections import deque
 from game_logic.snake import Snake
+from game_logic.grid import OccupancyGrid, APPLE
+from game_logic.rng import SpawnRng
 import config
-import random
+import hashlib
+
+# --- 변경 피드 이벤트 종류 ---
+# GameState.changes에는 (종류, 값) 튜플이 발생 순서대로 쌓입니다.
+HEAD_ADDED = "head_added"        # 값: (새 머리 위치, 방향)
+TAIL_REMOVED = "tail_removed"    # 값: 비워진 꼬리 위치
+APPLE_SPAWNED = "apple_spawned"  # 값: 새 사과 위치
+APPLE_EATEN = "apple_eaten"      # 값: 먹은 사과 위치
+SCORE_CHANGED = "score_changed"  # 값: 새 점수
+STATE_CHANGED = "state_changed"  # 값: "reset" / "restored" / "game_over" / "game_win"
+# 이 값의 STATE_CHANGED를 받으면 소비자는 get_render_data()로 전체 상태를 다시 받아야 합니다.
+RESYNC_STATES = ("reset", "restored")
 
 
 class GameState:
@@ -10,41 +22,66 @@ class GameState:
     뱀, 사과, 점수, 게임 오버 여부 등 게임의 모든 데이터를 포함하며,
     게임의 규칙에 따라 이 데이터들을 업데이트하는 역할을 합니다.
     """
-    def __init__(self, rows: int, cols: int, max_apples: int):
+    def __init__(self, rows: int, cols: int, max_apples: int, seed: int = None):
         """
         GameState 객체를 초기화합니다.
         :param rows: 게임 그리드의 세로 크기
         :param cols: 게임 그리드의 가로 크기
         :param max_apples: 화면에 동시에 존재할 수 있는 최대 사과 개수
+        :param seed: 사과 생성에 사용할 시드 (None이면 config.SEED, 그것도 None이면 무작위)
+                     여러 게임을 함께 돌릴 때는 rng.derive_seed(master_seed, i)로 만든 하위 시드를 전달합니다.
         """
         self.rows = rows
         self.cols = cols
         self.max_apples = max_apples
+        self.seed = config.SEED if seed is None else seed
+        # 게임마다 자신만의 RNG를 사용하여, 한 프로세스 안의 여러 게임이 서로 간섭하지 않도록 합니다.
+        self.rng = SpawnRng()
+        self.tick = 0  # 지금까지 실행된 update() 횟수 (리플레이 입력의 기준 시각)
+        self.grid = None  # 보드의 점유 상태 (빈 칸/몸통/사과)
         self.snake = None
         self.apples = []
         self.score = 0
         self.game_over = False
         self.game_win = False
-        self.reset()
+        # 변경 피드 버퍼 (enable_changes()를 호출해야 기록됩니다)
+        self.changes = None
+        self.reset(self.seed)
+
+    @classmethod
+    def from_config(cls, runtime_config: config.RuntimeConfig, seed: int = None) -> "GameState":
+        """RuntimeConfig의 그리드 크기와 사과 개수로 GameState를 만듭니다."""
+        return cls(
+            rows=runtime_config.grid_rows,
+            cols=runtime_config.grid_cols,
+            max_apples=runtime_config.max_apples,
+            seed=seed,
+        )
 
-    def reset(self):
+    def reset(self, seed: int = None):
         """
         게임 상태를 초기 상태로 리셋합니다.
         게임 시작 또는 재시작 시 호출됩니다.
+        :param seed: 주어지면 RNG를 이 값으로 다시 시드합니다. (None이면 이전 RNG 상태를 이어서 사용)
         """
-        if config.SEED is not None:
-            random.seed(config.SEED)
+        if seed is not None:
+            self.rng.seed(seed)
 
         # 화면 중앙에서 뱀 생성
         r, c = self.rows // 2, self.cols // 2
-        start_body = deque([(r, c), (r, c - 1), (r, c - 2)])
+        start_body = [(r, c), (r, c - 1), (r, c - 2)]
         initial_direction = (0, 1)  # 오른쪽으로 시작
 
-        self.snake = Snake(start_body, initial_direction)
+        self.grid = OccupancyGrid(self.rows, self.cols)
+        self.snake = Snake(start_body, initial_direction, self.grid)
         self.apples = []
         self.score = 0
         self.game_over = False
         self.game_win = False
+        self.tick = 0
+        if self.changes is not None:
+            self.changes.clear()
+            self.changes.append((STATE_CHANGED, "reset"))
 
         # 설정된 개수만큼 사과를 생성합니다.
         for _ in range(self.max_apples):
@@ -55,18 +92,30 @@ class GameState:
         맵의 빈 공간(뱀이나 다른 사과가 없는 위치)에 새로운 사과를 하나 생성합니다.
         만약 빈 공간이 없다면 아무것도 하지 않습니다.
         """
-        total_cells = self.rows * self.cols
-        occupied_cells = len(self.snake.body) + len(self.apples)
-        if occupied_cells >= total_cells:
+        free_count = self.grid.free_count()
+        if free_count == 0:
             return  # 빈 공간이 없으면 함수 종료
 
-        # 뱀의 몸통과 현재 사과들의 위치를 제외한 곳에 새 사과를 생성합니다.
-        occupied_positions = set(self.snake.body) | set(self.apples)
-        while True:
-            new_pos = (random.randint(0, self.rows - 1), random.randint(0, self.cols - 1))
-            if new_pos not in occupied_positions:
-                self.apples.append(new_pos)
-                break
+        # 점유 그리드가 관리하는 빈 칸 목록에서 한 번에 균등하게 뽑습니다.
+        # (재시도 루프가 없으므로 뱀이 맵을 거의 채운 상황에서도 O(1)입니다.)
+        new_pos = self.grid.free_cell_at(self.rng.index(free_count))
+        self.apples.append(new_pos)
+        self.grid.set(new_pos, APPLE)
+        if self.changes is not None:
+            self.changes.append((APPLE_SPAWNED, new_pos))
+
+    def enable_changes(self):
+        """
+        변경 피드를 켭니다. 이후 update()마다 머리/꼬리/사과/점수/상태 변화가 self.changes에 쌓이며,
+        소비자(렌더러, 네트워크 전송 등)는 처리한 뒤 clear_changes()로 버퍼를 비워야 합니다.
+        """
+        if self.changes is None:
+            self.changes = []
+
+    def clear_changes(self):
+        """처리한 변경 이벤트를 비웁니다. 리스트 객체는 재사용합니다."""
+        if self.changes is not None:
+            self.changes.clear()
 
     def handle_input(self, next_dir: tuple):
         """
@@ -82,46 +131,152 @@ class GameState:
         """
         if self.game_over or self.game_win:
             return
+        self.tick += 1
 
         # 1. [예측] 뱀이 다음 틱에 어디로 갈지 예측합니다.
         next_head_pos = self.snake.get_next_head_pos()
-        grow = next_head_pos in self.apples  # 사과를 먹는지 여부
 
         # 2. [충돌 검사] 예측된 위치가 유효한지 검사합니다.
         # 2-1. 벽 충돌 검사
         if not (0 <= next_head_pos[0] < self.rows and 0 <= next_head_pos[1] < self.cols):
-            self.game_over = True
-            self.snake.set_direction_if_collision()
+            self._end_game("game_over")
             return
+
+        # 사과를 먹는지 여부는 점유 그리드에서 O(1)로 확인합니다.
+        grow = self.grid.get(next_head_pos) == APPLE
         # 2-2. 자기 몸 충돌 검사
         if self.snake.is_self_collision(next_head_pos, grow):
-            self.game_over = True
-            self.snake.set_direction_if_collision()
+            self._end_game("game_over")
             return
 
         # 3. [실행] 충돌이 없다면, 예측된 상태를 실제 게임 상태에 반영합니다.
-        self.snake.move(grow)
+        changes = self.changes
+        if changes is not None and not grow:
+            changes.append((TAIL_REMOVED, self.snake.body[-1]))
+        self.snake.move(grow)  # 머리가 사과 칸을 몸통으로 덮어씁니다.
+        if changes is not None:
+            changes.append((HEAD_ADDED, (next_head_pos, self.snake.direction)))
 
         if grow:
             self.score += 1
-            self.apples.remove(next_head_pos)  # 먹은 사과 제거
+            self.apples.remove(next_head_pos)  # 먹은 사과 제거 (최대 max_apples개의 짧은 리스트)
+            if changes is not None:
+                changes.append((APPLE_EATEN, next_head_pos))
+                changes.append((SCORE_CHANGED, self.score))
             self._spawn_apple()  # 새 사과 추가
 
         # 승리 조건: 뱀의 몸통이 전체 그리드를 가득 채웠을 때
-        if len(self.snake.body) == self.rows * self.cols:
+        if self.snake.length == self.rows * self.cols:
             self.game_win = True
+            if changes is not None:
+                changes.append((STATE_CHANGED, "game_win"))
             return
 
+    def _end_game(self, outcome: str):
+        """충돌로 게임을 끝냅니다."""
+        self.game_over = True
+        self.snake.set_direction_if_collision()
+        if self.changes is not None:
+            self.changes.append((STATE_CHANGED, outcome))
+
     def is_win(self) -> bool:
         return self.game_win
 
     def is_over(self) -> bool:
         return self.game_over
 
+    def snapshot(self) -> tuple:
+        """
+        현재 게임 상태를 평탄한 버퍼와 튜플로 이루어진 스냅샷으로 저장합니다.
+        탐색/롤아웃에서 restore()로 같은 객체를 여러 번 되돌릴 때 사용합니다.
+        """
+        grid = self.grid
+        snake = self.snake
+        return (
+            grid.cells[:],
+            grid.free[:],
+            grid.free_pos[:],
+            snake.ring[:],
+            snake.head_slot,
+            snake.length,
+            snake.direction,
+            snake._next_direction,
+            tuple(self.apples),
+            self.score,
+            self.game_over,
+            self.game_win,
+            self.tick,
+            self.rng.getstate(),
+        )
+
+    def restore(self, snapshot: tuple):
+        """
+        snapshot()으로 저장한 상태로 되돌립니다.
+        점유 그리드 버퍼는 제자리에서 덮어쓰므로, 그리드를 참조하는 외부 뷰(예: NumPy 관측값)도 유지됩니다.
+        """
+        (cells, free, free_pos, ring, head_slot, length, direction, next_direction,
+         apples, score, game_over, game_win, tick, rng_state) = snapshot
+        grid = self.grid
+        grid.cells[:] = cells
+        grid.free[:] = free
+        grid.free_pos[:] = free_pos
+        snake = self.snake
+        snake.ring[:] = ring
+        snake.head_slot = head_slot
+        snake.length = length
+        snake.direction = direction
+        snake._next_direction = next_direction
+        self.apples[:] = apples
+        self.score = score
+        self.game_over = game_over
+        self.game_win = game_win
+        self.tick = tick
+        self.rng.setstate(rng_state)
+        if self.changes is not None:
+            self.changes.append((STATE_CHANGED, "restored"))
+
+    def clone(self) -> "GameState":
+        """
+        독립적으로 진행시킬 수 있는 게임 상태의 복사본을 만듭니다.
+        copy.deepcopy와 달리 객체 그래프를 순회하지 않고 평탄한 버퍼만 복사합니다.
+        """
+        other = GameState.__new__(GameState)
+        other.rows = self.rows
+        other.cols = self.cols
+        other.max_apples = self.max_apples
+        other.seed = self.seed
+        other.rng = SpawnRng()
+        other.rng.setstate(self.rng.getstate())
+        other.tick = self.tick
+        other.grid = self.grid.copy()
+        other.snake = self.snake.copy(other.grid)
+        other.apples = list(self.apples)
+        other.score = self.score
+        other.game_over = self.game_over
+        other.game_win = self.game_win
+        other.changes = None  # 복사본은 변경 피드를 기록하지 않습니다.
+        return other
+
+    def state_hash(self) -> str:
+        """
+        현재 게임 상태(보드, 몸통 순서, 방향, 점수, 종료 여부)의 해시를 반환합니다.
+        리플레이 재생 결과가 녹화 당시와 같은지 검증할 때 사용합니다.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(
+            repr(
+                (self.rows, self.cols, self.tick, self.score, self.game_over, self.game_win, self.snake.direction)
+            ).encode()
+        )
+        h.update(self.grid.cells)
+        h.update(self.snake.indices().tobytes())  # 머리부터 꼬리까지의 칸 인덱스 (4바이트 정수)
+        return h.hexdigest()
+
     def get_render_data(self) -> dict:
         """
         현재 게임 상태 데이터를 렌더링 모듈에 전달하기 위한 딕셔너리를 반환합니다.
         이를 통해 게임 로직과 렌더링 로직을 분리할 수 있습니다.
+        몸통 전체를 복사하므로, 매 프레임에는 변경 피드(changes)를 사용하고 이 함수는 전체 동기화가 필요할 때만 호출합니다.
         """
         return {
             "snake_body": list(self.snake.body),
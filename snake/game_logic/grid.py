@@ -0,0 +1,99 @@
+"""
+게임 보드의 각 칸이 무엇으로 채워져 있는지 기록하는 점유 그리드(Occupancy Grid)입니다.
+칸 (row, col)은 row * cols + col 위치의 1바이트 값으로 표현되며,
+벽/몸통/사과 충돌 검사를 매 틱 O(1)로, 추가 메모리 할당 없이 수행할 수 있게 해줍니다.
+
+또한 빈 칸들의 인덱스를 밀집 배열(free)로 함께 관리하여,
+빈 칸 중 하나를 균등하게 뽑는 작업(사과 생성)을 O(1)로 처리합니다.
+"""
+from array import array
+
+# --- 칸 상태 태그 ---
+EMPTY = 0
+BODY = 1
+APPLE = 2
+
+
+class OccupancyGrid:
+    """
+    rows * cols 크기의 평탄화된 bytearray로 보드의 점유 상태를 관리하는 클래스입니다.
+    Snake와 GameState가 뱀의 이동, 사과 생성/제거 시 이 그리드를 점진적으로 갱신합니다.
+    """
+    def __init__(self, rows: int, cols: int):
+        """
+        모든 칸이 비어있는 그리드를 생성합니다.
+        :param rows: 그리드의 세로 크기
+        :param cols: 그리드의 가로 크기
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cells = bytearray(rows * cols)
+
+        # --- 빈 칸 인덱스 ---
+        # free: 빈 칸 인덱스들을 빈틈없이 담은 배열 (순서는 의미 없음)
+        # free_pos: 칸 인덱스 -> free 배열 내 위치 (비어있지 않은 칸은 -1)
+        self.free = array("i", range(rows * cols))
+        self.free_pos = array("i", range(rows * cols))
+
+    def copy(self) -> "OccupancyGrid":
+        """그리드를 복사합니다. 평탄한 버퍼 세 개만 복사하므로 매우 빠릅니다."""
+        other = OccupancyGrid.__new__(OccupancyGrid)
+        other.rows = self.rows
+        other.cols = self.cols
+        other.cells = self.cells[:]
+        other.free = self.free[:]
+        other.free_pos = self.free_pos[:]
+        return other
+
+    def index(self, pos: tuple) -> int:
+        """(row, col) 좌표를 평탄화된 칸 인덱스로 변환합니다."""
+        return pos[0] * self.cols + pos[1]
+
+    def in_bounds(self, pos: tuple) -> bool:
+        """좌표가 그리드 안에 있는지 확인합니다. (벽 충돌 검사)"""
+        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+
+    def get(self, pos: tuple) -> int:
+        """해당 좌표의 칸 상태 태그를 반환합니다."""
+        return self.cells[pos[0] * self.cols + pos[1]]
+
+    def set(self, pos: tuple, tag: int):
+        """
+        해당 좌표의 칸 상태 태그를 변경합니다.
+        빈 칸이 채워지거나 채워진 칸이 비워지면 빈 칸 인덱스도 함께 갱신합니다.
+        """
+        self.set_index(pos[0] * self.cols + pos[1], tag)
+
+    def set_index(self, idx: int, tag: int):
+        """set()과 같지만 평탄화된 칸 인덱스를 받습니다. (좌표 튜플을 만들지 않는 경로에서 사용)"""
+        old_tag = self.cells[idx]
+        self.cells[idx] = tag
+        if old_tag == EMPTY and tag != EMPTY:
+            self._remove_free(idx)
+        elif old_tag != EMPTY and tag == EMPTY:
+            self._add_free(idx)
+
+    def free_count(self) -> int:
+        """현재 비어있는 칸의 개수를 반환합니다."""
+        return len(self.free)
+
+    def free_cell_at(self, i: int) -> tuple:
+        """빈 칸 인덱스 배열의 i번째 칸을 (row, col) 좌표로 반환합니다."""
+        return divmod(self.free[i], self.cols)
+
+    def _add_free(self, idx: int):
+        """칸을 빈 칸 배열의 맨 뒤에 추가합니다."""
+        self.free_pos[idx] = len(self.free)
+        self.free.append(idx)
+
+    def _remove_free(self, idx: int):
+        """
+        칸을 빈 칸 배열에서 제거합니다.
+        배열의 마지막 원소를 제거할 자리로 옮기는 방식(swap-remove)으로 O(1)에 처리합니다.
+        """
+        i = self.free_pos[idx]
+        last = self.free.pop()
+        if last != idx:
+            self.free[i] = last
+            self.free_pos[last] = i
+        self.free_pos[idx] = -1
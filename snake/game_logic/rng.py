@@ -0,0 +1,76 @@
+"""
+게임별 난수 스트림입니다.
+
+각 GameState는 자신만의 SpawnRng를 가지므로 같은 프로세스 안의 여러 게임이
+서로의 난수 상태에 간섭하지 않습니다. 여러 게임을 병렬로 돌릴 때는 하나의 마스터 시드에서
+derive_seed(master_seed, i)로 서로 독립적인 하위 스트림의 시드를 만들어 사용합니다.
+
+사과 생성에 쓰이는 난수는 BLOCK_SIZE개의 32비트 정수를 한 번의 randbytes() 호출로 미리 만들어 두고
+하나씩 꺼내 쓰므로, 뽑을 때마다 Python 수준의 randrange() 호출 비용이 들지 않습니다.
+"""
+import hashlib
+import random
+import sys
+from array import array
+from typing import Union
+
+# 한 번에 미리 생성하는 32비트 난수의 개수
+BLOCK_SIZE = 256
+
+
+def derive_seed(master_seed: int, stream: Union[int, str]) -> int:
+    """마스터 시드와 스트림 번호(또는 이름)로부터 독립적인 64비트 하위 시드를 만듭니다."""
+    digest = hashlib.blake2b(f"{master_seed}:{stream}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def unpack_block(data: bytes) -> array:
+    """randbytes()로 만든 바이트열을 플랫폼과 무관하게 리틀 엔디언 32비트 정수 배열로 변환합니다."""
+    block = array("I", data)
+    if sys.byteorder == "big":
+        block.byteswap()
+    return block
+
+
+class SpawnRng:
+    """
+    random.Random을 감싸 균등한 인덱스 추출을 블록 단위로 처리하는 난수 생성기입니다.
+    index(n)은 미리 생성된 32비트 값 v에 대해 (v * n) >> 32를 반환하며,
+    n이 2^32보다 충분히 작으므로 치우침은 무시할 수 있는 수준입니다.
+    """
+    __slots__ = ("_random", "_block", "_pos")
+
+    def __init__(self, seed: int = None):
+        self._random = random.Random(seed)
+        self._block = array("I")
+        self._pos = 0
+
+    def seed(self, seed: int):
+        """스트림을 주어진 시드로 다시 시작합니다. 미리 만들어 둔 블록도 버립니다."""
+        self._random.seed(seed)
+        self._block = array("I")
+        self._pos = 0
+
+    def next_block_bytes(self) -> bytes:
+        """다음 난수 블록의 원본 바이트를 생성합니다. (BatchGameState가 NumPy 블록을 만들 때 사용)"""
+        return self._random.randbytes(4 * BLOCK_SIZE)
+
+    def index(self, n: int) -> int:
+        """0 이상 n 미만의 정수를 균등하게 하나 뽑습니다."""
+        if self._pos == len(self._block):
+            self._block = unpack_block(self.next_block_bytes())
+            self._pos = 0
+        value = self._block[self._pos]
+        self._pos += 1
+        return (value * n) >> 32
+
+    def getstate(self) -> tuple:
+        """현재 난수 상태를 반환합니다. (스냅샷/복원용)"""
+        return self._random.getstate(), self._block, self._pos
+
+    def setstate(self, state: tuple):
+        """getstate()로 얻은 상태로 되돌립니다."""
+        random_state, block, pos = state
+        self._random.setstate(random_state)
+        self._block = block
+        self._pos = pos
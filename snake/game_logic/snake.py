@@ -1,24 +1,114 @@
-from collections import deque
+from array import array
+from typing import Iterable, Iterator, Optional, Tuple
+from game_logic.grid import OccupancyGrid, EMPTY, BODY
+
+# --- 방향 인덱스 ---
+# 리플레이, 배치 시뮬레이션 등 방향을 정수로 다뤄야 하는 곳에서 공통으로 사용합니다.
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DIRECTION_VECTORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIRECTION_INDEX = {vec: i for i, vec in enumerate(DIRECTION_VECTORS)}
 
 
 class Snake:
     """
     뱀의 데이터와 동작을 관리하는 클래스입니다.
     뱀의 몸통 위치, 현재 이동 방향, 다음 이동 방향 등을 관리합니다.
+
+    몸통은 칸 인덱스(row * cols + col)를 담은 array('I') 링 버퍼에 꼬리부터 머리 순서로 저장합니다.
+    버퍼는 기본적으로 보드 칸 수만큼 미리 할당되므로, 이동할 때 마디마다 튜플을 만들거나 버퍼를 다시 할당하지 않습니다.
+    (row, col) 튜플이 필요한 곳은 body 뷰를 사용합니다.
     """
-    def __init__(self, start_body: deque, direction: tuple):
+    def __init__(
+        self,
+        start_body: Iterable[Tuple[int, int]],
+        direction: tuple,
+        grid: OccupancyGrid,
+        capacity: Optional[int] = None,
+    ):
         """
         Snake 객체를 초기화합니다.
-        :param start_body: 뱀의 초기 몸통 위치를 담은 deque
+        :param start_body: 뱀의 초기 몸통 위치 (머리부터 꼬리 순서)
         :param direction: 뱀의 초기 이동 방향 (예: (0, 1)은 오른쪽)
+        :param grid: 뱀의 몸통 위치를 기록할 점유 그리드
+        :param capacity: 링 버퍼의 초기 크기 (None이면 보드 칸 수)
+                         한 보드에 뱀이 많은 아레나에서는 작게 시작하고, 가득 차면 두 배씩 늘립니다.
         """
-        self.body = start_body  # 뱀의 몸통. deque의 왼쪽 끝(index 0)이 머리입니다.
         self.direction = direction  # 현재 뱀이 움직이는 방향
         self._next_direction = direction  # 다음 틱에 적용될 방향 (입력 버퍼 역할)
+        self.grid = grid
+        self.cols = grid.cols
+        # 뱀은 보드를 가득 채울 때까지만 길어질 수 있습니다.
+        self.capacity = min(capacity, grid.rows * grid.cols) if capacity else grid.rows * grid.cols
+        self.ring = array("I", bytes(4 * self.capacity))
+        self.head_slot = -1  # 머리가 저장된 링 버퍼 위치
+        self.length = 0
+        self.body = SnakeBody(self)  # 머리부터 꼬리까지의 (row, col) 읽기 전용 뷰
+        self.set_body(start_body)
+
+        # 초기 몸통 위치를 점유 그리드에 기록합니다.
+        for idx in self.iter_indices():
+            self.grid.set_index(idx, BODY)
+
+    def set_body(self, parts: Iterable[Tuple[int, int]]):
+        """
+        몸통을 주어진 좌표들(머리부터 꼬리 순서)로 바꿉니다. 점유 그리드는 갱신하지 않습니다.
+        (생성자와 GameState.restore에서 사용합니다)
+        """
+        indices = [r * self.cols + c for r, c in parts]
+        indices.reverse()  # 링 버퍼에는 꼬리부터 저장합니다.
+        if len(indices) > self.capacity:
+            self._resize_ring(len(indices))
+        self.ring[:len(indices)] = array("I", indices)
+        self.head_slot = len(indices) - 1
+        self.length = len(indices)
+
+    def copy(self, grid: OccupancyGrid) -> "Snake":
+        """
+        뱀을 복사합니다. 새 뱀은 주어진 (이미 복사된) 점유 그리드를 사용하며,
+        몸통이 이미 기록되어 있으므로 그리드를 다시 갱신하지 않습니다.
+        """
+        other = Snake.__new__(Snake)
+        other.direction = self.direction
+        other._next_direction = self._next_direction
+        other.grid = grid
+        other.cols = self.cols
+        other.capacity = self.capacity
+        other.ring = self.ring[:]
+        other.head_slot = self.head_slot
+        other.length = self.length
+        other.body = SnakeBody(other)
+        return other
 
     def head(self) -> tuple:
         """뱀의 머리 좌표를 반환합니다."""
-        return self.body[0]
+        return divmod(self.ring[self.head_slot], self.cols)
+
+    def head_index(self) -> int:
+        """뱀 머리의 칸 인덱스를 반환합니다."""
+        return self.ring[self.head_slot]
+
+    def tail_index(self) -> int:
+        """뱀 꼬리의 칸 인덱스를 반환합니다."""
+        return self.ring[self.head_slot - self.length + 1]  # 음수 인덱스는 링의 끝에서부터 셉니다.
+
+    def iter_indices(self) -> Iterator[int]:
+        """머리부터 꼬리까지의 칸 인덱스를 하나씩 반환합니다. (버퍼를 복사하지 않습니다)"""
+        ring = self.ring
+        slot = self.head_slot
+        for _ in range(self.length):
+            yield ring[slot]  # 음수 위치는 링의 끝에서부터 셉니다.
+            slot -= 1
+
+    def indices(self) -> array:
+        """머리부터 꼬리까지의 칸 인덱스를 새 array('I')로 반환합니다. (해시, 스냅샷 등 드문 경로용)"""
+        head, length = self.head_slot, self.length
+        start = head - length + 1
+        if start >= 0:
+            out = self.ring[start:head + 1]
+        else:
+            out = self.ring[start:] + self.ring[:head + 1]
+        out.reverse()
+        return out
 
     def set_direction(self, new_dir: tuple):
         """
@@ -41,31 +131,74 @@ class Snake:
         GameState에서 충돌 검사를 위해 사용됩니다.
         """
         # 실제 이동 로직과 동일하게, 예약된 다음 방향(_next_direction)을 기준으로 계산합니다.
-        return (
-            self.head()[0] + self._next_direction[0],
-            self.head()[1] + self._next_direction[1],
-        )
+        r, c = divmod(self.ring[self.head_slot], self.cols)
+        return r + self._next_direction[0], c + self._next_direction[1]
 
     def move(self, grow: bool):
         """
-        뱀을 한 칸 이동시킵니다.
+        뱀을 한 칸 이동시킵니다. 다음 머리 칸은 보드 안이어야 합니다. (GameState가 벽 충돌을 먼저 검사합니다)
         :param grow: True이면 꼬리를 제거하지 않아 몸이 길어집니다.
         """
         # 1. 예약된 다음 방향을 현재 방향으로 업데이트합니다.
         #    이를 통해 사용자가 한 틱에 여러 번 키를 눌러도 마지막 유효한 입력만 반영됩니다.
-        self.direction = self._next_direction
+        self.direction = dr, dc = self._next_direction
 
-        # 2. 새로운 머리 위치를 계산합니다.
-        new_head = (
-            self.head()[0] + self.direction[0],
-            self.head()[1] + self.direction[1],
-        )
-        # 3. 새로운 머리를 몸통의 맨 앞에 추가합니다.
-        self.body.appendleft(new_head)
+        # 2. 새로운 머리 칸 인덱스를 계산합니다.
+        ring = self.ring
+        new_head = ring[self.head_slot] + dr * self.cols + dc
+
+        # 3. 성장(grow)하지 않는 경우, 꼬리를 한 칸 제거합니다.
+        #    머리가 방금 비워진 꼬리 칸으로 들어올 수 있으므로 머리 추가보다 먼저 처리합니다.
+        if grow:
+            if self.length == self.capacity:
+                self._resize_ring(self.capacity * 2)
+                ring = self.ring
+            self.length += 1
+        else:
+            self.grid.set_index(ring[self.head_slot - self.length + 1], EMPTY)
 
-        # 4. 성장(grow)하지 않는 경우, 꼬리를 한 칸 제거합니다.
-        if not grow:
-            self.body.pop()
+        # 4. 새로운 머리를 링 버퍼의 다음 칸에 기록합니다.
+        slot = self.head_slot + 1
+        if slot == self.capacity:
+            slot = 0
+        ring[slot] = new_head
+        self.head_slot = slot
+        self.grid.set_index(new_head, BODY)
+
+    def pop_tail(self) -> int:
+        """
+        꼬리 한 칸을 비우고 그 칸 인덱스를 반환합니다.
+        pop_tail() 뒤에 push_head()를 호출하면 move(grow=False)와 같습니다.
+        (ArenaState가 모든 뱀의 꼬리를 먼저 비운 뒤 머리를 추가할 때 사용합니다)
+        """
+        idx = self.ring[self.head_slot - self.length + 1]
+        self.length -= 1
+        self.grid.set_index(idx, EMPTY)
+        return idx
+
+    def push_head(self) -> int:
+        """예약된 방향으로 꼬리를 남긴 채 머리를 한 칸 추가하고, 새 머리 칸 인덱스를 반환합니다."""
+        self.direction = dr, dc = self._next_direction
+        new_head = self.ring[self.head_slot] + dr * self.cols + dc
+        if self.length == self.capacity:
+            self._resize_ring(self.capacity * 2)
+        slot = self.head_slot + 1
+        if slot == self.capacity:
+            slot = 0
+        self.ring[slot] = new_head
+        self.head_slot = slot
+        self.length += 1
+        self.grid.set_index(new_head, BODY)
+        return new_head
+
+    def _resize_ring(self, capacity: int):
+        """링 버퍼를 capacity 크기(최대 보드 칸 수)로 다시 할당하고, 몸통을 꼬리부터 0번 위치에 다시 놓습니다."""
+        ordered = self.indices()
+        ordered.reverse()
+        self.capacity = min(max(capacity, 1), self.grid.rows * self.cols)
+        self.ring = array("I", bytes(4 * self.capacity))
+        self.ring[:len(ordered)] = ordered
+        self.head_slot = len(ordered) - 1
 
     def is_self_collision(self, next_head_pos: tuple, is_growing: bool) -> bool:
         """
@@ -73,11 +206,47 @@ class Snake:
         :param next_head_pos: 검사할 다음 머리의 위치
         :param is_growing: 뱀이 다음 틱에 성장하는지 여부
         """
-        if is_growing:
-            # 성장할 때는 꼬리가 그대로 남아있으므로, 몸 전체와 충돌하는지 확인합니다.
-            return next_head_pos in self.body
-        else:
-            # 성장하지 않을 때는 꼬리가 한 칸 앞으로 움직일 예정이므로,
-            # 현재의 꼬리 위치는 다음 틱에 비어있게 됩니다. 따라서 꼬리를 제외하고 충돌을 검사합니다.
-            body_without_tail = list(self.body)[:-1]
-            return next_head_pos in body_without_tail
+        # 점유 그리드를 이용해 O(1)로 몸통 여부를 확인합니다.
+        idx = next_head_pos[0] * self.cols + next_head_pos[1]
+        if self.grid.cells[idx] != BODY:
+            return False
+        # 성장하지 않을 때는 꼬리가 한 칸 앞으로 움직일 예정이므로,
+        # 현재의 꼬리 위치는 다음 틱에 비어있게 됩니다. 따라서 꼬리 칸은 충돌이 아닙니다.
+        return is_growing or idx != self.tail_index()
+
+
+class SnakeBody:
+    """
+    Snake 링 버퍼를 머리부터 꼬리 순서의 (row, col) 튜플 시퀀스처럼 읽기 위한 뷰입니다.
+    body[0](머리), body[-1](꼬리), len(body), 반복, list(body)/tuple(body)를 지원하며,
+    튜플은 요청할 때만 만들어집니다.
+    """
+    __slots__ = ("_snake",)
+
+    def __init__(self, snake: Snake):
+        self._snake = snake
+
+    def __len__(self) -> int:
+        return self._snake.length
+
+    def __getitem__(self, i):
+        snake = self._snake
+        length = snake.length
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(length))]
+        if i < 0:
+            i += length
+        if 0 <= i < length:
+            return divmod(snake.ring[snake.head_slot - i], snake.cols)  # 음수 위치는 링의 끝에서부터 셉니다.
+        raise IndexError("snake body index out of range")
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        cols = self._snake.cols
+        for idx in self._snake.iter_indices():
+            yield divmod(idx, cols)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self)!r})"
@@ -0,0 +1,292 @@
+"""
+Pygame이나 디스플레이 없이 GameState를 CPU가 허용하는 최대 속도로 실행하는 헤드리스 실행기입니다.
+밸런스 조정과 테스트를 위해 수많은 틱을 시뮬레이션할 때 사용합니다.
+
+사용 예:
+    python headless.py --rows 30 --cols 40 --apples 5 --policy random --games 100 --seed 1
+    python headless.py --batch 10000 --max-ticks 1000 --seed 1   # NumPy 배치 모드
+    python headless.py --arena 200 --rows 256 --cols 256 --max-ticks 3000 --seed 1   # 아레나 모드
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import config
+from game_logic.game_state import GameState
+from game_logic.rng import derive_seed
+
+# 입력 스크립트와 CLI에서 사용하는 방향 문자 -> 방향 벡터
+DIRECTIONS = {
+    "U": (-1, 0),
+    "D": (1, 0),
+    "L": (0, -1),
+    "R": (0, 1),
+}
+
+# policy(game_state)는 다음 방향 벡터 또는 입력이 없을 경우 None을 반환합니다.
+Policy = Callable[[GameState], Optional[Tuple[int, int]]]
+
+
+def random_policy(seed: Optional[int] = None, turn_chance: float = 0.2) -> Policy:
+    """
+    일정 확률로 무작위 방향을 고르는 간단한 정책을 생성합니다.
+    게임의 RNG(사과 생성)와 섞이지 않도록 별도의 random.Random 인스턴스를 사용합니다.
+    """
+    rng = random.Random(seed)
+    directions = list(DIRECTIONS.values())
+
+    def policy(game_state: GameState) -> Optional[Tuple[int, int]]:
+        if rng.random() < turn_chance:
+            return rng.choice(directions)
+        return None
+
+    return policy
+
+
+def load_input_script(path: str) -> List[Tuple[int, Tuple[int, int]]]:
+    """
+    입력 스크립트 파일을 읽어 (틱, 방향) 목록으로 반환합니다.
+    각 줄은 "틱 방향" 형식이며(예: "12 U"), 빈 줄과 '#'으로 시작하는 줄은 무시합니다.
+    """
+    inputs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            tick, direction = line.split()
+            inputs.append((int(tick), DIRECTIONS[direction.upper()]))
+    return inputs
+
+
+def run_game(
+    rows: int,
+    cols: int,
+    max_apples: int,
+    policy: Optional[Policy] = None,
+    inputs: Optional[Iterable[Tuple[int, Tuple[int, int]]]] = None,
+    max_ticks: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    게임 한 판을 헤드리스로 끝까지(또는 max_ticks까지) 실행하고 결과를 반환합니다.
+    :param policy: 매 틱 호출되어 다음 방향을 결정하는 함수
+    :param inputs: (틱, 방향) 형태의 입력 스크립트. 해당 틱의 update() 직전에 적용됩니다.
+    :param max_ticks: 최대 틱 수 (None이면 게임이 끝날 때까지)
+    :param seed: 사과 생성에 사용할 시드
+    :return: ticks, elapsed, ticks_per_sec, score, outcome을 담은 딕셔너리
+    """
+    game_state = GameState(rows=rows, cols=cols, max_apples=max_apples, seed=seed)
+    script = sorted(inputs, key=lambda item: item[0]) if inputs else []
+    script_pos = 0
+
+    tick = 0
+    start = time.perf_counter()
+    while not game_state.game_over and not game_state.game_win:
+        if max_ticks is not None and tick >= max_ticks:
+            break
+        # 이번 틱에 예약된 스크립트 입력을 순서대로 적용합니다.
+        while script_pos < len(script) and script[script_pos][0] <= tick:
+            game_state.handle_input(script[script_pos][1])
+            script_pos += 1
+        if policy:
+            game_state.handle_input(policy(game_state))
+        game_state.update()
+        tick += 1
+    elapsed = time.perf_counter() - start
+
+    if game_state.game_win:
+        outcome = "game_win"
+    elif game_state.game_over:
+        outcome = "game_over"
+    else:
+        outcome = "timeout"
+
+    return {
+        "ticks": tick,
+        "elapsed": elapsed,
+        "ticks_per_sec": tick / elapsed if elapsed > 0 else float("inf"),
+        "score": game_state.score,
+        "outcome": outcome,
+    }
+
+
+def run_batch(
+    num_games: int,
+    rows: int,
+    cols: int,
+    max_apples: int,
+    steps: int,
+    seed: Optional[int] = None,
+    turn_chance: float = 0.2,
+) -> Dict:
+    """
+    BatchGameState로 num_games개의 게임을 무작위 정책으로 steps 틱 동안 동시에 진행합니다.
+    끝난 게임은 자동으로 리셋되며, 그 동안 끝난 게임들의 통계를 반환합니다.
+    """
+    import numpy as np
+    from game_logic.batch import BatchGameState, NO_INPUT
+
+    batch = BatchGameState(num_games, rows, cols, max_apples, seed=seed)
+    action_rng = np.random.default_rng(seed)
+
+    finished_games = 0
+    wins = 0
+    score_sum = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        actions = action_rng.integers(0, 4, size=num_games)
+        actions[action_rng.random(num_games) >= turn_chance] = NO_INPUT
+        _, dones = batch.step(actions)
+        finished_games += int(dones.sum())
+        wins += int(batch.wins.sum())
+        score_sum += int(batch.final_scores.sum())
+    elapsed = time.perf_counter() - start
+
+    ticks = num_games * steps
+    return {
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+        "finished_games": finished_games,
+        "wins": wins,
+        "mean_score": score_sum / finished_games if finished_games else 0.0,
+    }
+
+
+def run_arena(
+    num_snakes: int,
+    rows: int,
+    cols: int,
+    max_apples: int,
+    steps: int,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    ArenaState에서 num_snakes마리의 AI 뱀(ArenaPilot)을 steps 틱 동안 진행합니다.
+    죽은 뱀은 다시 태어나며, 진행 속도와 뱀들의 통계를 반환합니다.
+    """
+    from autopilot import ArenaPilot
+    from game_logic.arena import ArenaState
+
+    policy_seed = None if seed is None else derive_seed(seed, "policy")
+    arena = ArenaState(rows, cols, max_apples, num_snakes, seed=seed, policy=ArenaPilot(policy_seed))
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        arena.update()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": steps,
+        "elapsed": elapsed,
+        "ticks_per_sec": steps / elapsed if elapsed > 0 else float("inf"),
+        "snake_ticks_per_sec": steps * num_snakes / elapsed if elapsed > 0 else float("inf"),
+        "deaths": arena.deaths,
+        "alive": arena.alive_count(),
+        "max_length": max(snake.length for snake in arena.snakes),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """헤드리스 실행기의 CLI 진입점입니다."""
+    defaults = config.get_current_config()
+    parser = argparse.ArgumentParser(description="Hebi 헤드리스 시뮬레이터")
+    parser.add_argument("--rows", type=int, default=defaults["GRID_ROWS"])
+    parser.add_argument("--cols", type=int, default=defaults["GRID_COLS"])
+    parser.add_argument("--apples", type=int, default=defaults["MAX_APPLES"])
+    parser.add_argument("--games", type=int, default=1, help="실행할 게임 수")
+    parser.add_argument(
+        "--max-ticks", type=int, default=None, help="게임당 최대 틱 수 (자동 조종은 기본값 autopilot.max_game_ticks)"
+    )
+    parser.add_argument("--seed", type=int, default=config.SEED, help="마스터 시드 (게임별 시드는 여기서 파생)")
+    parser.add_argument("--policy", choices=["none", "random", "autopilot"], default="random")
+    parser.add_argument("--script", help="'틱 방향' 형식의 입력 스크립트 파일")
+    parser.add_argument(
+        "--batch", type=int, default=0, help="N개 게임을 NumPy 배치로 동시에 진행 (--max-ticks 필요)"
+    )
+    parser.add_argument(
+        "--arena", type=int, default=0, help="N마리 AI 뱀이 한 보드를 함께 쓰는 아레나 모드 (--max-ticks 필요)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.arena:
+        if args.max_ticks is None:
+            parser.error("--arena 모드에서는 --max-ticks를 지정해야 합니다.")
+        result = run_arena(
+            args.arena, args.rows, args.cols, args.apples, args.max_ticks, seed=args.seed
+        )
+        print(
+            f"snakes={args.arena} ticks={result['ticks']} ticks/sec={result['ticks_per_sec']:.0f} "
+            f"snake_ticks/sec={result['snake_ticks_per_sec']:.0f} deaths={result['deaths']} "
+            f"alive={result['alive']} max_length={result['max_length']}"
+        )
+        return
+
+    if args.batch:
+        if args.max_ticks is None:
+            parser.error("--batch 모드에서는 --max-ticks를 지정해야 합니다.")
+        result = run_batch(
+            args.batch, args.rows, args.cols, args.apples, args.max_ticks, seed=args.seed
+        )
+        print(
+            f"games={args.batch} ticks={result['ticks']} ticks/sec={result['ticks_per_sec']:.0f} "
+            f"finished={result['finished_games']} wins={result['wins']} "
+            f"mean_score={result['mean_score']:.2f}"
+        )
+        return
+
+    inputs = load_input_script(args.script) if args.script else None
+    max_ticks = args.max_ticks
+    if max_ticks is None and args.policy == "autopilot":
+        # 자동 조종 게임도 반드시 끝나도록 보드를 다 채우는 데 걸리는 틱 수의 상한을 기본값으로 씁니다.
+        from autopilot import max_game_ticks
+
+        max_ticks = max_game_ticks(args.rows, args.cols)
+
+    total_ticks = 0
+    total_elapsed = 0.0
+    outcomes = {}
+    scores = []
+    for i in range(args.games):
+        game_seed = None if args.seed is None else derive_seed(args.seed, i)
+        policy_seed = None if game_seed is None else derive_seed(game_seed, "policy")
+        if args.policy == "random":
+            policy = random_policy(policy_seed)
+        elif args.policy == "autopilot":
+            from autopilot import Autopilot
+
+            policy = Autopilot(args.rows, args.cols)
+        else:
+            policy = None
+        result = run_game(
+            args.rows,
+            args.cols,
+            args.apples,
+            policy=policy,
+            inputs=inputs,
+            max_ticks=max_ticks,
+            seed=game_seed,
+        )
+        total_ticks += result["ticks"]
+        total_elapsed += result["elapsed"]
+        outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+        scores.append(result["score"])
+        if args.games == 1:
+            print(
+                f"outcome={result['outcome']} score={result['score']} "
+                f"ticks={result['ticks']} ticks/sec={result['ticks_per_sec']:.0f}"
+            )
+
+    if args.games > 1:
+        ticks_per_sec = total_ticks / total_elapsed if total_elapsed > 0 else float("inf")
+        print(
+            f"games={args.games} ticks={total_ticks} ticks/sec={ticks_per_sec:.0f} "
+            f"mean_score={sum(scores) / len(scores):.2f} max_score={max(scores)} "
+            f"outcomes={outcomes}"
+        )
+
+
+if __name__ == "__main__":
+    main()
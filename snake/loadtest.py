@@ -0,0 +1,189 @@
+"""
+server.py의 부하 테스트 클라이언트입니다.
+
+한 프로세스에서 --rooms개의 연결을 열어 각각 새 방을 만들고, 무작위 방향 입력을 보내며
+서버가 보내는 KEYFRAME/DELTA를 GameMirror에 적용합니다. (미러의 머리 위치가 서버와 다르면 desync로 셉니다)
+게임이 끝난 방은 RESTART로 다시 시작합니다.
+
+사용 예:
+    python server.py --stats 5 &
+    python loadtest.py --rooms 2000 --duration 30
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+import config
+import protocol
+from client import GameMirror
+from headless import DIRECTIONS
+from game_logic.rng import derive_seed
+
+
+class LoadStats:
+    """모든 부하 테스트 연결이 함께 쓰는 통계입니다."""
+    def __init__(self):
+        self.connected = 0
+        self.failed = 0
+        self.messages = 0
+        self.bytes = 0
+        self.keyframes = 0
+        self.deltas = 0
+        self.delta_bytes = 0
+        self.desyncs = 0
+        self.restarts = 0
+        self.inputs = 0
+        self.intervals: List[float] = []  # 같은 방의 연속된 DELTA 사이의 간격 (초)
+
+
+async def run_client(
+    host: str,
+    port: int,
+    rows: int,
+    cols: int,
+    max_apples: int,
+    deadline: float,
+    stats: LoadStats,
+    seed: Optional[int],
+    turn_chance: float,
+):
+    """연결 하나를 열어 deadline(time.perf_counter 기준)까지 한 방을 플레이합니다."""
+    rng = random.Random(seed)
+    directions = list(DIRECTIONS.values())
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        stats.failed += 1
+        return
+    stats.connected += 1
+    mirror = GameMirror()
+    writer.write(protocol.encode_join(0, rows, cols, max_apples))
+    writer.write(protocol.encode_input(rng.choice(directions)))  # 방은 첫 입력부터 진행됩니다.
+    last_delta = None
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                payload = await asyncio.wait_for(protocol.read_frame(reader), remaining)
+            except asyncio.TimeoutError:
+                break
+            stats.messages += 1
+            stats.bytes += len(payload)
+            desyncs = mirror.desyncs
+            mirror.apply_message(payload)
+            mirror.clear_changes()
+            stats.desyncs += mirror.desyncs - desyncs
+
+            now = time.perf_counter()
+            if payload[0] == protocol.MSG_KEYFRAME:
+                stats.keyframes += 1
+                last_delta = None
+                if mirror.game_over or mirror.game_win:
+                    writer.write(protocol.encode_restart())
+                    writer.write(protocol.encode_input(rng.choice(directions)))
+                    stats.restarts += 1
+                    continue
+            else:
+                stats.deltas += 1
+                stats.delta_bytes += len(payload)
+                if last_delta is not None:
+                    stats.intervals.append(now - last_delta)
+                last_delta = now
+            if rng.random() < turn_chance:
+                writer.write(protocol.encode_input(rng.choice(directions)))
+                stats.inputs += 1
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def run_load_test(
+    host: str,
+    port: int,
+    rooms: int,
+    duration: float,
+    rows: int,
+    cols: int,
+    max_apples: int,
+    seed: Optional[int] = None,
+    turn_chance: float = 0.2,
+) -> Dict:
+    """rooms개의 연결로 duration초 동안 부하를 주고 결과를 반환합니다."""
+    stats = LoadStats()
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(
+        *(
+            run_client(
+                host,
+                port,
+                rows,
+                cols,
+                max_apples,
+                deadline,
+                stats,
+                None if seed is None else derive_seed(seed, i),
+                turn_chance,
+            )
+            for i in range(rooms)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "rooms": rooms,
+        "connected": stats.connected,
+        "failed": stats.failed,
+        "elapsed": elapsed,
+        "messages_per_sec": stats.messages / elapsed,
+        "kib_per_sec": stats.bytes / elapsed / 1024,
+        "keyframes": stats.keyframes,
+        "deltas": stats.deltas,
+        "mean_delta_bytes": stats.delta_bytes / stats.deltas if stats.deltas else 0.0,
+        "desyncs": stats.desyncs,
+        "restarts": stats.restarts,
+        "interval_p50_ms": _percentile(stats.intervals, 50) * 1000,
+        "interval_p99_ms": _percentile(stats.intervals, 99) * 1000,
+    }
+
+
+def main(argv=None) -> None:
+    """부하 테스트 CLI 진입점입니다."""
+    parser = argparse.ArgumentParser(description="Hebi 서버 부하 테스트")
+    parser.add_argument("--host", default=config.NET_HOST)
+    parser.add_argument("--port", type=int, default=config.NET_PORT)
+    parser.add_argument("--rooms", type=int, default=1000, help="동시에 열 연결(방) 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=30)
+    parser.add_argument("--apples", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=config.SEED)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(
+        run_load_test(
+            args.host, args.port, args.rooms, args.duration, args.rows, args.cols, args.apples, seed=args.seed
+        )
+    )
+    print(
+        f"rooms={result['rooms']} connected={result['connected']} failed={result['failed']} "
+        f"msgs/sec={result['messages_per_sec']:.0f} KiB/sec={result['kib_per_sec']:.1f} "
+        f"keyframes={result['keyframes']} deltas={result['deltas']} "
+        f"delta_bytes={result['mean_delta_bytes']:.1f} desyncs={result['desyncs']} restarts={result['restarts']} "
+        f"interval_p50={result['interval_p50_ms']:.1f}ms p99={result['interval_p99_ms']:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
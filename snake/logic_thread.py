@@ -0,0 +1,242 @@
+"""
+게임 로직을 렌더링과 분리된 스레드에서 진행하는 모드입니다. (main.py --threaded 또는 config.THREADED_LOGIC)
+
+렌더 루프 안에서 GameState.update()를 호출하면 느린 프레임(폰트 렌더링, 오버레이 생성, display.flip)이
+틱을 늦추고, 밀린 틱은 다음 프레임에 몰아서 진행됩니다. LogicThread는 고정 간격 틱 루프를 별도 스레드에서 돌리고,
+틱이 진행될 때마다 화면에 필요한 상태를 불변 스냅샷(RenderSnapshot)으로 만들어 게시합니다.
+
+- 스냅샷 교환: 로직 스레드는 새 스냅샷을 만든 뒤 참조 하나만 바꿔 끼웁니다. 로직 스레드가 만들고 있는 스냅샷,
+  게시된 최신 스냅샷, 메인 스레드가 그리고 있는 스냅샷이 서로 다른 객체이므로 삼중 버퍼처럼 동작하며,
+  어느 쪽도 상대를 기다리지 않습니다. 메인 스레드가 스냅샷을 건너뛰었다면 seq로 알 수 있습니다.
+- 입력: 메인 스레드가 collections.deque에 append하고 로직 스레드가 틱 직전에 popleft로 모두 꺼냅니다.
+  (두 연산 모두 원자적이므로 락이 필요 없습니다)
+- 틱 지터: TickJitter가 실제 틱 간격이 목표 간격에서 벗어난 정도를 모읍니다. (인라인 모드와 비교할 수 있습니다)
+
+메인 스레드는 스레드가 실행 중인 동안 GameState를 직접 건드리지 않고 스냅샷만 읽습니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import config
+from game_logic.game_state import GameState
+
+# TickJitter가 보관하는 최근 틱 간격의 수
+JITTER_WINDOW = 4096
+
+
+class TickJitter:
+    """틱이 실제로 진행된 시각을 받아, 간격이 목표 간격(tick_dt)에서 벗어난 정도를 모읍니다."""
+    def __init__(self, window: int = JITTER_WINDOW):
+        self.deviations: Deque[float] = deque(maxlen=window)  # (실제 간격 - 목표 간격) (초)
+        self._last = None
+
+    def restart(self):
+        """리셋이나 일시정지 뒤의 첫 틱은 간격으로 세지 않습니다."""
+        self._last = None
+
+    def record(self, now: float, tick_dt: float):
+        """
+        틱 하나가 진행된 시각을 기록합니다.
+        :param now: time.perf_counter() 값
+        :param tick_dt: 목표 틱 간격 (초)
+        """
+        if self._last is not None:
+            self.deviations.append(now - self._last - tick_dt)
+        self._last = now
+
+    def stats(self) -> Dict:
+        """지터 통계(밀리초)를 딕셔너리로 반환합니다. 기록된 간격이 없으면 0으로 채웁니다."""
+        values = sorted(abs(d) for d in self.deviations)
+        if not values:
+            return {"ticks": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "ticks": len(values),
+            "mean_ms": sum(values) / len(values) * 1000,
+            "p50_ms": values[len(values) // 2] * 1000,
+            "p99_ms": values[min(len(values) - 1, int(len(values) * 0.99))] * 1000,
+            "max_ms": values[-1] * 1000,
+        }
+
+
+class RenderSnapshot:
+    """
+    한 시점의 게임 화면을 그리는 데 필요한 상태의 불변 사본입니다.
+    GameState와 같은 속성(grid, snake, apples, score, tick, is_over() 등)을 제공하므로 렌더러에 그대로 넘길 수 있습니다.
+    grid와 snake는 이 스냅샷만 가지는 복사본이며, 읽기 전용으로만 사용합니다.
+    """
+    __slots__ = (
+        "seq",
+        "tick",
+        "rows",
+        "cols",
+        "grid",
+        "snake",
+        "apples",
+        "score",
+        "game_over",
+        "game_win",
+        "changes",
+        "published_at",
+    )
+
+    def __init__(self, seq: int, game_state: GameState, changes: Tuple, published_at: float):
+        """
+        :param seq: 게시 순서 (1씩 증가합니다)
+        :param changes: 이전 스냅샷 이후 GameState.changes에 쌓인 이벤트
+        :param published_at: 게시 시각 (time.perf_counter 기준, 보간에 사용합니다)
+        """
+        self.seq = seq
+        self.tick = game_state.tick
+        self.rows = game_state.rows
+        self.cols = game_state.cols
+        self.grid = game_state.grid.copy()
+        self.snake = game_state.snake.copy(self.grid)
+        self.apples = tuple(game_state.apples)
+        self.score = game_state.score
+        self.game_over = game_state.game_over
+        self.game_win = game_state.game_win
+        self.changes = changes
+        self.published_at = published_at
+
+    def is_over(self) -> bool:
+        return self.game_over
+
+    def is_win(self) -> bool:
+        return self.game_win
+
+    def get_render_data(self) -> dict:
+        """GameState.get_render_data()와 같은 형식의 딕셔너리를 반환합니다."""
+        return {
+            "snake_body": list(self.snake.body),
+            "snake_direction": self.snake.direction,
+            "apples": self.apples,
+            "score": self.score,
+            "game_over": self.game_over,
+            "game_win": self.game_win,
+        }
+
+
+class LogicThread:
+    """
+    GameState 하나를 고정 간격으로 진행하는 스레드입니다. 만들어진 직후에는 멈춰 있으며, set_active(True)로 진행합니다.
+    게임이 끝나면 마지막 스냅샷을 게시하고 스레드가 종료됩니다.
+    """
+    def __init__(
+        self,
+        game_state: GameState,
+        tick_dt: float,
+        autopilot: Optional[Callable[[GameState], Tuple[int, int]]] = None,
+        recorder=None,
+        jitter: Optional[TickJitter] = None,
+        on_publish: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param autopilot: 매 틱 다음 방향을 정하는 플래너 (자동 조종 모드)
+        :param recorder: 입력을 적용한 틱과 함께 기록할 replay.ReplayRecorder
+        :param jitter: 틱 시각을 기록할 TickJitter
+        :param on_publish: 스냅샷을 게시한 뒤 로직 스레드에서 호출할 함수 (예: 메인 스레드를 깨우는 이벤트 전송)
+        """
+        self.game_state = game_state
+        self.tick_dt = tick_dt
+        self.autopilot = autopilot
+        self.recorder = recorder
+        self.jitter = jitter if jitter is not None else TickJitter()
+        self.on_publish = on_publish
+        self.inputs: Deque[Tuple[int, int]] = deque()
+        self.late_ticks = 0  # 통계: 한 번에 따라잡느라 예정보다 늦게 진행된 틱 수
+        self.dropped_ticks = 0  # 통계: MAX_CATCH_UP_TICKS를 넘어 버린 틱 수
+        self._active = threading.Event()
+        self._stopping = threading.Event()
+        self._seq = 0
+        game_state.enable_changes()
+        self._latest = self._build_snapshot()
+        self._thread = threading.Thread(target=self._run, name="hebi-logic", daemon=True)
+        self._thread.start()
+
+    def latest(self) -> RenderSnapshot:
+        """가장 최근에 게시된 스냅샷을 반환합니다. 기다리지 않습니다."""
+        return self._latest
+
+    def push_input(self, direction: Optional[Tuple[int, int]]):
+        """방향 입력을 큐에 넣습니다. 다음 틱 직전에 로직 스레드가 적용합니다."""
+        if direction:
+            self.inputs.append(direction)
+
+    def set_active(self, active: bool):
+        """틱 진행 여부를 바꿉니다. 다시 진행할 때는 멈춰 있던 시간을 따라잡지 않습니다."""
+        if active:
+            self._active.set()
+        else:
+            self._active.clear()
+
+    def stop(self):
+        """스레드를 멈추고 종료될 때까지 기다립니다. 이후에는 GameState를 메인 스레드에서 다룰 수 있습니다."""
+        self._stopping.set()
+        self._active.set()  # 멈춰 있던 스레드를 깨웁니다.
+        self._thread.join()
+
+    def _run(self):
+        game_state = self.game_state
+        tick_dt = self.tick_dt
+        clock = time.perf_counter
+        next_tick = None
+        while not self._stopping.is_set():
+            if not self._active.is_set():
+                self._active.wait()
+                next_tick = None
+                continue
+            now = clock()
+            if next_tick is None:
+                # 시작/재개 직후: 다음 틱은 한 간격 뒤에 진행합니다.
+                self.jitter.restart()
+                next_tick = now + tick_dt
+            if now < next_tick:
+                self._stopping.wait(next_tick - now)
+                continue
+
+            ticks_run = 0
+            while now >= next_tick and ticks_run < config.MAX_CATCH_UP_TICKS:
+                self._step()
+                next_tick += tick_dt
+                ticks_run += 1
+            self.late_ticks += ticks_run - 1
+            if now >= next_tick:
+                # 밀린 시간이 너무 많다면 따라잡지 않고 버립니다.
+                skipped = int((now - next_tick) / tick_dt) + 1
+                self.dropped_ticks += skipped
+                next_tick += skipped * tick_dt
+            self._publish()
+            if game_state.is_over() or game_state.is_win():
+                break
+
+    def _step(self):
+        game_state = self.game_state
+        if game_state.is_over() or game_state.is_win():
+            return
+        inputs = self.inputs
+        while inputs:
+            self._apply_input(inputs.popleft())
+        if self.autopilot:
+            self._apply_input(self.autopilot(game_state))
+        self.jitter.record(time.perf_counter(), self.tick_dt)
+        game_state.update()
+
+    def _apply_input(self, direction: Optional[Tuple[int, int]]):
+        self.game_state.handle_input(direction)
+        if self.recorder:
+            self.recorder.record(self.game_state.tick, direction)
+
+    def _build_snapshot(self) -> RenderSnapshot:
+        game_state = self.game_state
+        self._seq += 1
+        snapshot = RenderSnapshot(self._seq, game_state, tuple(game_state.changes), time.perf_counter())
+        game_state.clear_changes()
+        return snapshot
+
+    def _publish(self):
+        # 참조 하나를 바꾸는 것은 원자적이므로, 메인 스레드는 이전 스냅샷이나 새 스냅샷 중 하나를 온전히 봅니다.
+        self._latest = self._build_snapshot()
+        if self.on_publish:
+            self.on_publish()
@@ -1,11 +1,23 @@
 import pygame
+import argparse
+import os
+import random
 import sys
 import time
 import config
-from game_logic.game_state import GameState
+import replay
+from autopilot import Autopilot, ArenaPilot
+from client import RemoteGame
+from game_logic.arena import ArenaState
+from game_logic.game_state import GameState, STATE_CHANGED
+from logic_thread import LogicThread, TickJitter
 from rendering import (
     init_renderer,
+    draw_arena_frame,
     draw_frame,
+    draw_frame_incremental,
+    draw_frame_interpolated,
+    draw_frame_viewport,
     draw_overlay,
     draw_main_menu,
     draw_settings_screen,
@@ -15,26 +27,84 @@ from rendering import (
 )
 
 
-def main():
+def main(argv=None):
     """
     메인 게임 함수. Pygame을 초기화하고 메인 게임 루프를 실행합니다.
+    --connect HOST:PORT로 실행하면 게임 로직은 서버(server.py)가 진행하고, 이 프로세스는 서버가 보내는 변화를 그립니다.
+    --threaded로 실행하면 게임 로직은 별도 스레드(logic_thread.py)가 진행하고, 이 루프는 그 스냅샷을 그립니다.
     """
+    parser = argparse.ArgumentParser(description="Hebi")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="서버에 접속해 클라이언트 모드로 실행합니다.")
+    parser.add_argument("--room", type=int, default=0, help="들어갈 방 번호 (0이면 새 방)")
+    parser.add_argument("--threaded", action="store_true", help="게임 로직을 별도 스레드에서 진행합니다.")
+    args = parser.parse_args(argv)
+    # 스레드 모드는 로컬 한 마리 게임에서만 사용합니다. (클라이언트 모드의 로직은 서버가 진행합니다)
+    threaded = (args.threaded or config.THREADED_LOGIC) and not args.connect
+    if threaded:
+        sys.setswitchinterval(config.LOGIC_THREAD_SWITCH_INTERVAL)
+
+    # 클라이언트 모드: 서버의 방 하나를 미러링합니다. (맵 크기와 사과 개수는 접속할 때의 설정으로 새 방을 만듭니다)
+    remote = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        settings = config.build_runtime_config()
+        try:
+            remote = RemoteGame.connect(
+                host or config.NET_HOST,
+                int(port or config.NET_PORT),
+                settings.grid_rows,
+                settings.grid_cols,
+                settings.max_apples,
+                room=args.room,
+            )
+        except (OSError, ValueError) as e:
+            print(f"서버({args.connect})에 접속할 수 없습니다: {e}")
+            sys.exit(1)
+        print(f"서버에 접속했습니다. 방 번호: {remote.room}")
+
     pygame.init()
 
     # UI를 기준으로 초기 화면을 설정합니다. 게임 화면은 이보다 작을 수 있습니다.
-    screen = pygame.display.set_mode((config.UI_SCREEN_WIDTH, config.UI_SCREEN_HEIGHT))
+    screen_size = (config.UI_SCREEN_WIDTH, config.UI_SCREEN_HEIGHT)
+    frame_pacing = config.FRAME_PACING
+    if frame_pacing == "vsync":
+        try:
+            # Pygame 2에서 vsync는 SCALED(또는 OPENGL) 모드에서만 요청할 수 있습니다.
+            screen = pygame.display.set_mode(screen_size, pygame.SCALED, vsync=1)
+        except pygame.error:
+            print("vsync를 사용할 수 없어 FPS 제한 방식으로 동작합니다.")
+            frame_pacing = "cap"
+    if frame_pacing != "vsync":
+        screen = pygame.display.set_mode(screen_size)
     pygame.display.set_caption("Hebi")
     clock = pygame.time.Clock()
+    # 틱 단위 렌더링에서 로직 스레드가 새 스냅샷을 게시하면 입력 대기 중인 메인 루프를 깨우는 이벤트
+    snapshot_event = pygame.event.custom_type()
 
     # --- 게임 상태 및 데이터 변수 ---
     game_state = None  # 실제 게임 로직과 데이터를 관리하는 객체
     game_surface = None  # 실제 게임이 그려질 별도의 Surface. UI와 분리됩니다.
+    recorder = None  # 리플레이 기록기 (config.RECORD_REPLAYS가 True일 때만 사용)
+    autopilot = None  # 자동 조종 플래너 ("autopilot" 모드에서만 사용)
+    autopilot_tick = -1  # 클라이언트 모드에서 자동 조종이 마지막으로 입력한 서버 틱
+    logic = None  # 스레드 모드에서 게임 로직을 진행하는 LogicThread
+    rendered_seq = 0  # 스레드 모드에서 마지막으로 그린 스냅샷의 번호
 
     # --- 게임 상태(모드) 관리 ---
     # game_mode는 현재 게임이 어떤 상태인지를 나타냅니다 (예: 메인 메뉴, 게임 중).
     game_mode = "main_menu"
     # 설정 화면 등에서 이전 화면으로 돌아가기 위해 이전 상태를 저장합니다.
     previous_game_mode = None
+    # 일시정지 후 돌아갈 플레이 모드 ("gameplay" 또는 "autopilot")
+    play_mode = "gameplay"
+    # 지난 프레임에 그린 모드. 모드가 바뀌거나 게임이 리셋되면 화면 전체를 다시 그립니다.
+    last_drawn_mode = None
+    full_redraw = True
+
+    # 대기(idle) 모드 통계: 입력을 기다리며 쉰 시간과, 실제로 그린 프레임의 CPU 비용
+    loop_stats = {"idle_seconds": 0.0, "drawn_frames": 0, "frame_cpu_seconds": 0.0}
+    # 틱이 목표 간격에서 벗어난 정도 (인라인/스레드 모드 모두 기록합니다)
+    tick_jitter = TickJitter()
 
     # 방향 키 입력을 실제 방향 벡터로 변환하기 위한 딕셔너리
     dir_map = {
@@ -47,15 +117,33 @@ def main():
     # 고정된 시간 간격(Fixed Timestep)으로 게임 로직을 업데이트하기 위한 변수들
     last_time = time.perf_counter()
     accumulator = 0.0
+    tick_dt = 0.0  # 로직 틱 간격(초). reset_game에서 현재 속도 설정으로 정해집니다.
+    runtime_config = None  # 현재 게임의 불변 설정 (reset_game에서 만들어집니다)
+
+    # 게임이 시작된 뒤 설정 화면에서 설정이 바뀌었는지 여부 (config의 변경 알림으로 갱신합니다)
+    settings_changed = False
+
+    def on_settings_changed(key, value):
+        nonlocal settings_changed
+        settings_changed = True
+
+    config.add_settings_listener(on_settings_changed)
 
     # --- UI 버튼 콜백(Callback) 함수들 ---
     # UI 버튼이 클릭되었을 때 실행될 함수들을 미리 정의합니다.
     # nonlocal 키워드를 사용하여 함수 외부의 변수(game_mode 등)를 수정합니다.
     def start_game():
-        nonlocal game_mode
+        nonlocal game_mode, play_mode
+        play_mode = "gameplay"
         reset_game()
         game_mode = "ready" # 게임 플레이 대신 준비 상태로 시작
 
+    def start_autopilot():
+        nonlocal game_mode, play_mode
+        play_mode = "autopilot"
+        reset_game()
+        game_mode = "autopilot"  # 자동 조종은 준비 상태 없이 바로 시작
+
     def open_settings():
         nonlocal game_mode, previous_game_mode
         previous_game_mode = game_mode  # 현재 상태를 저장
@@ -71,59 +159,170 @@ def main():
 
     def resume_game():
         nonlocal game_mode, last_time
-        game_mode = "gameplay"
+        game_mode = play_mode
         # 일시정지 동안의 시간을 "따라잡지" 않도록 타이머를 리셋합니다.
         last_time = time.perf_counter()
+        tick_jitter.restart()
 
     def back_from_settings():
         nonlocal game_mode, previous_game_mode
         # 설정 메뉴에 진입하기 전의 상태로 돌아갑니다.
         # 만약 게임 플레이 중에 설정을 변경했다면, 재시작 안내 상태로 전환합니다.
-        if previous_game_mode == "paused" and config.settings_have_changed:
+        if previous_game_mode == "paused" and settings_changed:
             game_mode = "paused_restart_required"
         elif previous_game_mode:
             game_mode = previous_game_mode
         else:
             game_mode = "main_menu"  # 비상시 메인 메뉴로 이동
 
+    # --- 입력 전달 및 리플레이 기록 ---
+    def send_input(direction):
+        # 방향 입력을 게임에 전달하고, 리플레이 기록 중이라면 현재 틱과 함께 기록합니다.
+        if logic:
+            logic.push_input(direction)  # 스레드 모드: 로직 스레드가 다음 틱 직전에 적용하고 기록합니다.
+            return
+        game_state.handle_input(direction)
+        if recorder:
+            recorder.record(game_state.tick, direction)
+
+    def save_replay():
+        nonlocal recorder
+        # 게임이 끝났을 때 한 번만 저장합니다.
+        if not recorder:
+            return
+        if logic:
+            logic.stop()  # 로직 스레드가 끝난 뒤에 최종 상태를 읽습니다.
+        os.makedirs(config.REPLAY_DIR, exist_ok=True)
+        file_name = time.strftime("%Y%m%d-%H%M%S") + f"-{recorder.seed}.hebi"
+        replay.save(recorder.finish(game_state), os.path.join(config.REPLAY_DIR, file_name))
+        recorder = None
+
     # --- 게임 초기화/재시작 함수 ---
     def reset_game():
-        nonlocal game_state, game_surface, last_time, accumulator
-        
-        # config 파일에서 현재 UI에서 설정된 값들을 가져옵니다.
-        game_config = config.get_current_config()
+        nonlocal game_state, game_surface, last_time, accumulator, recorder, autopilot, full_redraw, tick_dt
+        nonlocal runtime_config, settings_changed, autopilot_tick, logic, rendered_seq
+
+        if logic:
+            logic.stop()  # 이전 게임의 로직 스레드를 멈춥니다.
+            logic = None
+        # 현재 UI에서 설정된 값들로 이번 게임 동안 사용할 불변 설정을 한 번만 만듭니다.
+        runtime_config = config.build_runtime_config()
+        if remote:
+            # 클라이언트 모드: 맵 크기는 서버의 방을 따릅니다.
+            runtime_config = config.RuntimeConfig(
+                game_tick_ms=runtime_config.game_tick_ms,
+                max_apples=remote.max_apples,
+                grid_cols=remote.cols,
+                grid_rows=remote.rows,
+            )
+
+        # 리플레이로 재현할 수 있도록 게임마다 시드를 명시적으로 정합니다.
+        seed = config.SEED if config.SEED is not None else random.getrandbits(32)
         
         # 현재 설정에 맞는 크기로 게임 화면용 Surface를 생성합니다.
-        game_surface = pygame.Surface((game_config["SCREEN_WIDTH"], game_config["SCREEN_HEIGHT"]))
+        game_surface = pygame.Surface((runtime_config.screen_width, runtime_config.screen_height))
         
-        # 설정 값을 전달하여 GameState 객체를 생성합니다.
-        game_state = GameState(
-            rows=game_config["GRID_ROWS"],
-            cols=game_config["GRID_COLS"],
-            max_apples=game_config["MAX_APPLES"],
-        )
+        if remote:
+            # 게임 상태는 서버가 가지고 있으므로, 이미 플레이한 방이라면 새 판을 요청합니다. (KEYFRAME으로 도착합니다)
+            if game_state is remote:
+                remote.restart()
+            game_state = remote
+            recorder = None
+            autopilot = Autopilot(remote.rows, remote.cols) if play_mode == "autopilot" else None
+            autopilot_tick = -1
+        elif runtime_config.arena_snakes:
+            # 아레나 모드: AI 뱀들과 한 보드를 씁니다. (리플레이는 한 마리 게임만 지원하므로 기록하지 않습니다)
+            pilot = ArenaPilot(seed)
+            game_state = ArenaState.from_config(runtime_config, seed=seed, policy=pilot)
+            recorder = None
+            # 자동 조종 모드에서는 플레이어 뱀도 AI 뱀과 같은 정책으로 움직입니다.
+            autopilot = (lambda state: pilot(state, 0)) if play_mode == "autopilot" else None
+        else:
+            # 설정 값을 전달하여 GameState 객체를 생성합니다.
+            game_state = GameState.from_config(runtime_config, seed=seed)
+            if config.RECORD_REPLAYS:
+                recorder = replay.ReplayRecorder(seed, runtime_config.as_dict())
+            else:
+                recorder = None
+            # 자동 조종 모드라면 현재 맵 크기에 맞는 플래너를 새로 만듭니다.
+            autopilot = Autopilot(game_state.rows, game_state.cols) if play_mode == "autopilot" else None
+        game_state.enable_changes()  # 렌더러가 매 프레임 바뀐 칸만 그릴 수 있도록 변경 피드를 켭니다.
+        if threaded and not remote and not runtime_config.arena_snakes:
+            # 스레드 모드: 이후 이 게임의 GameState는 로직 스레드만 다루고, 렌더링은 스냅샷으로 합니다.
+            logic = LogicThread(
+                game_state,
+                runtime_config.tick_dt,
+                autopilot=autopilot,
+                recorder=recorder,
+                jitter=tick_jitter,
+                on_publish=(lambda: pygame.event.post(pygame.event.Event(snapshot_event)))
+                if frame_pacing == "tick"
+                else None,
+            )
+            rendered_seq = 0
         # 렌더러를 초기화합니다.
-        init_renderer(game_surface, game_config["GRID_COLS"], game_config["GRID_ROWS"])
+        init_renderer(game_surface, runtime_config)
         
         # 시간 변수들을 리셋하여 로직 업데이트가 처음부터 시작되도록 합니다.
         last_time = time.perf_counter()
         accumulator = 0.0
+        tick_dt = runtime_config.tick_dt
+        tick_jitter.restart()
         
-        # 설정 변경 플래그를 리셋합니다.
-        config.settings_have_changed = False
+        # 설정 변경 여부를 리셋합니다.
+        settings_changed = False
+        full_redraw = True
+
+    def is_static_mode():
+        # 게임 로직이 진행되지 않아 입력 없이는 화면이 바뀌지 않는 상태인지 확인합니다.
+        if game_mode in ("main_menu", "settings", "paused", "paused_restart_required", "ready"):
+            return True
+        # 스레드 모드에서는 게시된 스냅샷을 기준으로 합니다. (마지막 스냅샷을 그리기 전에 대기하지 않도록)
+        view = logic.latest() if logic else game_state
+        return view is not None and (view.is_over() or view.is_win())
 
     # --- 메인 게임 루프 ---
     running = True
     while running:
         # --- 1. 이벤트 처리 ---
-        # 매 프레임마다 발생하는 모든 이벤트를 가져옵니다 (키보드, 마우스 등).
-        events = pygame.event.get()
+        # 화면이 바뀌지 않는 상태에서 이미 그려 둔 화면이 있다면, 입력이 올 때까지 CPU를 쓰지 않고 기다립니다.
+        if is_static_mode() and not full_redraw and game_mode == last_drawn_mode:
+            wait_start = time.perf_counter()
+            event = pygame.event.wait(config.IDLE_WAIT_MS)
+            loop_stats["idle_seconds"] += time.perf_counter() - wait_start
+            if event.type == pygame.NOEVENT:
+                continue  # 아무 일도 없었으므로 다시 그리지 않습니다.
+            events = [event] + pygame.event.get()
+        elif (
+            frame_pacing == "tick"
+            and game_mode in ("gameplay", "autopilot")
+            and not full_redraw
+            and game_mode == last_drawn_mode
+        ):
+            # 틱 단위 렌더링: 다음 틱까지 남은 시간 동안 입력을 기다리며 쉽니다.
+            # (스레드 모드에서는 로직 스레드가 스냅샷을 게시하며 보내는 이벤트가 대기를 끝냅니다)
+            if logic:
+                remaining = config.IDLE_WAIT_MS / 1000
+            else:
+                remaining = tick_dt - accumulator - (time.perf_counter() - last_time)
+            wait_start = time.perf_counter()
+            event = pygame.event.wait(max(1, int(remaining * 1000)))
+            loop_stats["idle_seconds"] += time.perf_counter() - wait_start
+            events = ([event] if event.type != pygame.NOEVENT else []) + pygame.event.get()
+        else:
+            # 게임 플레이 중에는 매 프레임마다 발생하는 모든 이벤트를 가져옵니다 (키보드, 마우스 등).
+            events = pygame.event.get()
+        frame_cpu_start = time.process_time()
+
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            # 창이 다시 보이게 되면 화면 전체를 다시 그려야 합니다.
+            if event.type == pygame.WINDOWEXPOSED:
+                full_redraw = True
             # ESC 키는 현재 게임 모드에 따라 다르게 동작합니다.
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if game_mode == "gameplay":
+                if game_mode == "gameplay" or game_mode == "autopilot":
                     game_mode = "paused"
                 elif game_mode == "paused":
                     resume_game()
@@ -132,59 +331,143 @@ def main():
                 else: # main_menu
                     running = False
 
-        # 매 프레임 시작 시 화면을 단색으로 채웁니다.
-        screen.fill(config.BG_COLOR)
+        if logic:
+            # 로직 스레드는 게임 플레이/자동 조종 중에만 틱을 진행합니다.
+            logic.set_active(game_mode in ("gameplay", "autopilot"))
+
+        # 게임 플레이/자동 조종 중 같은 모드가 이어진다면 바뀐 칸만 다시 그립니다. (증분 렌더링)
+        drawn_mode = game_mode
+        incremental = (
+            not full_redraw
+            and game_mode == last_drawn_mode
+            and game_mode in ("gameplay", "autopilot")
+        )
+        full_redraw = False
+        dirty_rects = []
 
         # --- 2. 모드별 로직 및 렌더링 ---
         # 현재 game_mode에 따라 적절한 함수를 호출하여 화면을 그립니다.
         if game_mode == "main_menu":
-            draw_main_menu(screen, start_game, open_settings, exit_game, events)
+            draw_main_menu(screen, start_game, start_autopilot, open_settings, exit_game, events)
 
         elif game_mode == "settings":
             draw_settings_screen(screen, back_from_settings, events)
 
-        elif game_mode == "gameplay" or game_mode == "paused" or game_mode == "paused_restart_required" or game_mode == "ready":
+        elif game_mode in ("gameplay", "autopilot", "paused", "paused_restart_required", "ready"):
             # 게임 플레이/일시정지/준비 상태일 때의 로직
             if not game_state:
                 reset_game()  # 첫 프레임일 경우 게임 초기화
 
-            # 2-1. 게임 로직 업데이트 (게임 플레이 상태일 때만)
-            if game_mode == "gameplay":
-                # 사용자 입력 처리
+            if remote:
+                # 클라이언트 모드: 서버가 보낸 변화를 미러에 적용합니다. (일시정지 중에도 서버의 방은 계속 진행됩니다)
+                remote.poll()
+
+            # 2-1. 게임 로직 업데이트 (게임 플레이/자동 조종 상태일 때만)
+            if remote and game_mode in ("gameplay", "autopilot"):
                 for event in events:
-                    if event.type == pygame.KEYDOWN and event.key in dir_map:
-                        game_state.handle_input(dir_map[event.key])
-                
-                # 시간 기반 로직 업데이트 (고정된 시간 간격)
-                game_config = config.get_current_config()
-                tick_dt = 1.0 / (1000.0 / game_config["GAME_TICK_MS"])
+                    if game_mode == "gameplay" and event.type == pygame.KEYDOWN and event.key in dir_map:
+                        send_input(dir_map[event.key])
+                # 자동 조종은 서버의 틱이 진행될 때마다 한 번 입력합니다. (첫 입력이 방을 시작시킵니다)
+                if autopilot and remote.tick != autopilot_tick and not remote.is_over() and not remote.is_win():
+                    autopilot_tick = remote.tick
+                    send_input(autopilot(remote))
+            elif game_mode == "gameplay" or game_mode == "autopilot":
+                # 사용자 입력 처리 (자동 조종 중에는 방향키를 무시합니다)
+                if game_mode == "gameplay":
+                    for event in events:
+                        if event.type == pygame.KEYDOWN and event.key in dir_map:
+                            send_input(dir_map[event.key])
                 
+                # 시간 기반 로직 업데이트 (고정된 시간 간격). 스레드 모드에서는 로직 스레드가 진행합니다.
                 now = time.perf_counter()
                 frame_time = now - last_time
                 last_time = now
                 accumulator += frame_time
 
-                while accumulator >= tick_dt:
+                ticks_run = 0
+                while not logic and accumulator >= tick_dt and ticks_run < config.MAX_CATCH_UP_TICKS:
                     if not game_state.is_over() and not game_state.is_win():
+                        if autopilot:
+                            send_input(autopilot(game_state))  # 매 틱 플래너가 다음 방향을 결정
+                        tick_jitter.record(time.perf_counter(), tick_dt)
                         game_state.update()
                     accumulator -= tick_dt
+                    ticks_run += 1
+                if accumulator >= tick_dt:
+                    # 렉 등으로 밀린 시간이 너무 많다면 따라잡지 않고 버립니다.
+                    accumulator %= tick_dt
             
             # 2-2. 렌더링 (게임 플레이, 일시정지, 준비 상태 모두)
+            # 스레드 모드에서는 로직 스레드가 마지막으로 게시한 불변 스냅샷을 GameState 대신 그립니다.
+            if logic:
+                view = logic.latest()
+                if view.seq == rendered_seq:
+                    changes = ()  # 지난 프레임 이후 진행된 틱이 없습니다.
+                elif view.seq == rendered_seq + 1:
+                    changes = view.changes
+                else:
+                    # 건너뛴 스냅샷의 변경 피드는 없으므로 복원된 상태처럼 전체를 다시 맞춥니다.
+                    changes = ((STATE_CHANGED, "restored"),)
+                rendered_seq = view.seq
+                alpha = min(1.0, (time.perf_counter() - view.published_at) / tick_dt)
+            else:
+                view, changes = game_state, game_state.changes
+                alpha = min(1.0, accumulator / tick_dt)
+
             # 1단계: 게임 월드(뱀, 사과 등)를 별도의 game_surface에 그립니다.
-            render_data = game_state.get_render_data()
-            draw_frame(game_surface, render_data)
+            game_active = not view.is_over() and not view.is_win()
+            if not game_active:
+                # 게임 오버/승리 오버레이는 game_surface 전체에 그려지므로 화면 전체를 다시 그리고 flip합니다.
+                incremental = False
+            if runtime_config.arena_snakes:
+                # 아레나: 카메라가 플레이어를 따라가며 뷰포트 안의 모든 뱀을 다시 그립니다.
+                incremental = False
+                draw_arena_frame(game_surface, game_state.changes, game_state)
+            elif (
+                config.INTERPOLATE_MOVEMENT
+                and not remote
+                and not runtime_config.camera
+                and game_active
+                and game_mode in ("gameplay", "autopilot", "paused")
+            ):
+                # 남은 accumulator 비율만큼 머리와 꼬리를 칸 사이에 그립니다. (매 프레임 전체 다시 그리기)
+                incremental = False
+                draw_frame_interpolated(game_surface, view.get_render_data(), alpha)
+            else:
+                if incremental:
+                    # 지난 프레임 이후의 변경 피드만으로 바뀐 칸을 그립니다.
+                    dirty_rects = draw_frame_incremental(game_surface, changes, view.grid)
+                    incremental = dirty_rects is not None
+                if not incremental and runtime_config.camera:
+                    # 거대 맵: 카메라가 따라가는 뷰포트 안의 칸만 점유 그리드에서 찾아 그립니다.
+                    snake = view.snake
+                    draw_frame_viewport(
+                        game_surface,
+                        changes,
+                        view.grid,
+                        snake.head(),
+                        snake.direction,
+                        view.score,
+                    )
+                elif not incremental:
+                    draw_frame(game_surface, view.get_render_data())
+            if not logic:
+                game_state.clear_changes()
 
             # 게임 오버/승리 오버레이는 게임 화면 크기에 맞게 game_surface에 그립니다.
-            if game_state.is_over():
-                draw_overlay(game_surface, "game_over", game_state.score)
+            if view.is_over() or view.is_win():
+                save_replay()
+
+            if view.is_over():
+                draw_overlay(game_surface, "game_over", view.score)
                 for event in events:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_RETURN:
                             reset_game()  # 재시작
                         elif event.key == pygame.K_ESCAPE:
                             back_to_main_menu() # 메인 메뉴로
-            elif game_state.is_win():
-                draw_overlay(game_surface, "game_win", game_state.score)
+            elif view.is_win():
+                draw_overlay(game_surface, "game_win", view.score)
                 for event in events:
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                         back_to_main_menu()
@@ -192,7 +475,12 @@ def main():
             # 2단계: 완성된 game_surface를 메인 screen의 중앙에 그립니다.
             pos_x = (screen.get_width() - game_surface.get_width()) // 2
             pos_y = (screen.get_height() - game_surface.get_height()) // 2
-            screen.blit(game_surface, (pos_x, pos_y))
+            if incremental:
+                # 다시 그린 영역만 화면으로 옮깁니다.
+                dirty_rects = [screen.blit(game_surface, rect.move(pos_x, pos_y), rect) for rect in dirty_rects]
+            else:
+                screen.fill(config.BG_COLOR)
+                screen.blit(game_surface, (pos_x, pos_y))
 
             # 3단계: 추가적인 오버레이를 screen 위에 직접 그립니다.
             if game_mode == "paused":
@@ -202,26 +490,62 @@ def main():
                 for event in events:
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                         reset_game()
-                        game_mode = "gameplay"
+                        game_mode = play_mode
             elif game_mode == "ready":
                 draw_ready_overlay(screen)
                 # 준비 상태에서 방향키 입력 시 게임 시작
                 for event in events:
                     if event.type == pygame.KEYDOWN and event.key in dir_map:
-                        game_state.handle_input(dir_map[event.key])
+                        send_input(dir_map[event.key])
                         game_mode = "gameplay"
                         last_time = time.perf_counter() # 타이머 리셋
+                        tick_jitter.restart()
 
         # --- 3. 화면 업데이트 ---
-        # 현재 프레임에 그려진 모든 것을 실제 화면에 표시합니다.
-        pygame.display.flip()
-        # FPS를 60으로 제한합니다.
-        clock.tick(60)
+        # 현재 프레임에 그려진 모든 것을 실제 화면에 표시합니다. 증분 렌더링 중에는 바뀐 영역만 갱신합니다.
+        if incremental:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
+        last_drawn_mode = drawn_mode
+        loop_stats["drawn_frames"] += 1
+        loop_stats["frame_cpu_seconds"] += time.process_time() - frame_cpu_start
+        # 프레임 페이싱: vsync는 flip이, 틱 단위 렌더링은 입력 대기가 속도를 맞추므로 FPS를 제한하지 않습니다.
+        if frame_pacing == "vsync" or (frame_pacing == "tick" and game_mode in ("gameplay", "autopilot")):
+            clock.tick()
+        else:
+            clock.tick(config.FPS_CAP)
+
+    config.remove_settings_listener(on_settings_changed)
+    if logic:
+        logic.stop()
+    if remote:
+        remote.close()
+    if config.PRINT_LOOP_STATS:
+        print_loop_stats(loop_stats, tick_jitter.stats(), threaded)
 
     # 루프가 끝나면 Pygame을 종료합니다.
     pygame.quit()
     sys.exit()
 
 
+def print_loop_stats(loop_stats: dict, jitter_stats: dict, threaded: bool) -> None:
+    """
+    대기 모드로 쉰 시간과, 그 시간 동안 60 FPS로 다시 그렸다면 들었을 CPU 시간의 추정치를 출력합니다.
+    틱 간격이 목표 간격에서 벗어난 정도(틱 지터)도 함께 출력합니다.
+    """
+    frames = max(1, loop_stats["drawn_frames"])
+    cpu_per_frame = loop_stats["frame_cpu_seconds"] / frames
+    saved = loop_stats["idle_seconds"] * 60 * cpu_per_frame
+    print(
+        f"대기 시간: {loop_stats['idle_seconds']:.1f}s, 그린 프레임: {loop_stats['drawn_frames']}, "
+        f"프레임당 CPU: {cpu_per_frame * 1000:.2f}ms, 절약된 CPU 시간(추정): {saved:.1f}s"
+    )
+    print(
+        f"틱 지터({'로직 스레드' if threaded else '인라인'}): 틱 {jitter_stats['ticks']}개, "
+        f"평균 {jitter_stats['mean_ms']:.2f}ms, p99 {jitter_stats['p99_ms']:.2f}ms, 최대 {jitter_stats['max_ms']:.2f}ms"
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,234 @@
+"""
+네트워크 서버(server.py)와 클라이언트(client.py)가 주고받는 메시지 형식입니다.
+
+모든 메시지는 "본문 길이(varint) + 본문"으로 전송되며, 본문의 첫 바이트가 메시지 종류입니다.
+정수는 replay.py와 같은 부호 없는 LEB128 varint이고, 칸 위치는 평탄화된 칸 인덱스(row * cols + col)입니다.
+
+클라이언트 -> 서버
+    JOIN      방 번호(0이면 새 방), rows, cols, max_apples
+    INPUT     방향 인덱스 (1바이트, game_logic.snake.DIRECTION_VECTORS 순서)
+    RESTART   (본문 없음) 방의 게임을 새로 시작합니다.
+서버 -> 클라이언트
+    KEYFRAME  방 번호, tick, rows, cols, max_apples, score, 상태 비트(game_over | game_win << 1),
+              방향, 다음 방향, 몸통 칸 수 + 칸들(머리부터), 사과 수 + 칸들
+    DELTA     tick, 이벤트 수, 이벤트들 (종류 1바이트 + 값)
+              HEAD_ADDED: 칸 + 방향 1바이트 / TAIL_REMOVED, APPLE_SPAWNED, APPLE_EATEN: 칸 / SCORE_CHANGED: 점수
+
+DELTA는 GameState 변경 피드를 그대로 옮긴 것이므로 한 틱에 보통 10바이트 안팎입니다.
+리셋이나 게임 종료처럼 상태가 통째로 바뀌는 틱과, 주기적인 동기화 시점에는 KEYFRAME을 보냅니다.
+"""
+import asyncio
+from typing import Dict, List, Tuple
+
+from game_logic.game_state import (
+    GameState,
+    HEAD_ADDED,
+    TAIL_REMOVED,
+    APPLE_SPAWNED,
+    APPLE_EATEN,
+    SCORE_CHANGED,
+)
+from game_logic.snake import DIRECTION_VECTORS, DIRECTION_INDEX
+from replay import write_varint, read_varint
+
+# --- 메시지 종류 ---
+MSG_JOIN = 1
+MSG_INPUT = 2
+MSG_RESTART = 3
+MSG_KEYFRAME = 10
+MSG_DELTA = 11
+
+# DELTA 이벤트 종류 <-> 1바이트 코드
+EVENT_CODES = {HEAD_ADDED: 0, TAIL_REMOVED: 1, APPLE_SPAWNED: 2, APPLE_EATEN: 3, SCORE_CHANGED: 4}
+EVENT_KINDS = {code: kind for kind, code in EVENT_CODES.items()}
+
+# 메시지 본문의 최대 크기. (500x500 맵을 가득 채운 뱀의 KEYFRAME도 1MB 남짓입니다)
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class ProtocolError(ValueError):
+    """메시지 형식이 잘못되었을 때 발생합니다."""
+
+
+def frame(payload: bytes) -> bytes:
+    """본문 앞에 길이를 붙여 전송할 바이트열을 만듭니다."""
+    out = bytearray()
+    write_varint(out, len(payload))
+    out += payload
+    return bytes(out)
+
+
+def encode_join(room: int, rows: int, cols: int, max_apples: int) -> bytes:
+    out = bytearray((MSG_JOIN,))
+    for value in (room, rows, cols, max_apples):
+        write_varint(out, value)
+    return frame(out)
+
+
+def encode_input(direction: Tuple[int, int]) -> bytes:
+    return frame(bytes((MSG_INPUT, DIRECTION_INDEX[direction])))
+
+
+def encode_restart() -> bytes:
+    return frame(bytes((MSG_RESTART,)))
+
+
+def encode_keyframe(room: int, game_state: GameState) -> bytes:
+    """게임 상태 전체를 KEYFRAME 메시지로 인코딩합니다. (몸통 길이에 비례하므로 가끔만 보냅니다)"""
+    snake = game_state.snake
+    out = bytearray((MSG_KEYFRAME,))
+    for value in (
+        room,
+        game_state.tick,
+        game_state.rows,
+        game_state.cols,
+        game_state.max_apples,
+        game_state.score,
+        int(game_state.game_over) | int(game_state.game_win) << 1,
+        DIRECTION_INDEX[snake.direction],
+        DIRECTION_INDEX[snake._next_direction],
+        snake.length,
+    ):
+        write_varint(out, value)
+    for idx in snake.iter_indices():
+        write_varint(out, idx)
+    cols = game_state.cols
+    write_varint(out, len(game_state.apples))
+    for r, c in game_state.apples:
+        write_varint(out, r * cols + c)
+    return frame(out)
+
+
+def encode_delta(tick: int, changes: List[Tuple[str, object]], cols: int) -> bytes:
+    """
+    한 틱의 변경 피드를 DELTA 메시지로 인코딩합니다.
+    STATE_CHANGED 이벤트는 담지 않습니다. (상태가 바뀐 틱에는 서버가 KEYFRAME을 보냅니다)
+    """
+    out = bytearray((MSG_DELTA,))
+    write_varint(out, tick)
+    events = [(kind, value) for kind, value in changes if kind in EVENT_CODES]
+    write_varint(out, len(events))
+    for kind, value in events:
+        out.append(EVENT_CODES[kind])
+        if kind == HEAD_ADDED:
+            (r, c), direction = value
+            write_varint(out, r * cols + c)
+            out.append(DIRECTION_INDEX[direction])
+        elif kind == SCORE_CHANGED:
+            write_varint(out, value)
+        else:
+            r, c = value
+            write_varint(out, r * cols + c)
+    return frame(out)
+
+
+def decode_keyframe(payload: bytes) -> Dict:
+    """KEYFRAME 본문을 딕셔너리로 디코딩합니다. (body와 apples는 (row, col) 목록, body는 머리부터)"""
+    pos = 1
+    values = []
+    for _ in range(10):
+        value, pos = read_varint(payload, pos)
+        values.append(value)
+    room, tick, rows, cols, max_apples, score, flags, direction, next_direction, length = values
+    body = []
+    for _ in range(length):
+        idx, pos = read_varint(payload, pos)
+        body.append(divmod(idx, cols))
+    count, pos = read_varint(payload, pos)
+    apples = []
+    for _ in range(count):
+        idx, pos = read_varint(payload, pos)
+        apples.append(divmod(idx, cols))
+    return {
+        "room": room,
+        "tick": tick,
+        "rows": rows,
+        "cols": cols,
+        "max_apples": max_apples,
+        "score": score,
+        "game_over": bool(flags & 1),
+        "game_win": bool(flags & 2),
+        "direction": DIRECTION_VECTORS[direction],
+        "next_direction": DIRECTION_VECTORS[next_direction],
+        "body": body,
+        "apples": apples,
+    }
+
+
+def decode_delta(payload: bytes, cols: int) -> Tuple[int, List[Tuple[str, object]]]:
+    """DELTA 본문을 (tick, GameState.changes와 같은 형식의 이벤트 목록)으로 디코딩합니다."""
+    tick, pos = read_varint(payload, 1)
+    count, pos = read_varint(payload, pos)
+    events = []
+    for _ in range(count):
+        kind = EVENT_KINDS.get(payload[pos])
+        if kind is None:
+            raise ProtocolError(f"알 수 없는 이벤트 코드: {payload[pos]}")
+        pos += 1
+        value, pos = read_varint(payload, pos)
+        if kind == HEAD_ADDED:
+            events.append((kind, (divmod(value, cols), DIRECTION_VECTORS[payload[pos]])))
+            pos += 1
+        elif kind == SCORE_CHANGED:
+            events.append((kind, value))
+        else:
+            events.append((kind, divmod(value, cols)))
+    return tick, events
+
+
+def decode_join(payload: bytes) -> Tuple[int, int, int, int]:
+    """JOIN 본문을 (방 번호, rows, cols, max_apples)로 디코딩합니다."""
+    pos = 1
+    values = []
+    for _ in range(4):
+        value, pos = read_varint(payload, pos)
+        values.append(value)
+    return tuple(values)
+
+
+class FrameReader:
+    """
+    논블로킹 소켓에서 받은 바이트를 모아 완성된 메시지 본문을 꺼내는 버퍼입니다. (클라이언트에서 사용)
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """받은 데이터를 추가하고, 그로써 완성된 메시지 본문들을 반환합니다."""
+        self._buffer += data
+        payloads = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            # 길이 varint가 아직 다 오지 않았을 수 있으므로 끝까지 읽을 수 있는지 먼저 확인합니다.
+            end = pos
+            while end < len(buffer) and buffer[end] & 0x80:
+                end += 1
+            if end >= len(buffer):
+                break
+            size, start = read_varint(buffer, pos)
+            if size > MAX_FRAME_SIZE:
+                raise ProtocolError(f"메시지가 너무 큽니다: {size} bytes")
+            if start + size > len(buffer):
+                break
+            payloads.append(bytes(buffer[start:start + size]))
+            pos = start + size
+        del buffer[:pos]
+        return payloads
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """asyncio 스트림에서 메시지 본문 하나를 읽습니다. (연결이 끊기면 asyncio.IncompleteReadError)"""
+    size = 0
+    shift = 0
+    while True:
+        byte = (await reader.readexactly(1))[0]
+        size |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+        if shift > 28:
+            raise ProtocolError("메시지 길이가 잘못되었습니다.")
+    if size == 0 or size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"잘못된 메시지 길이: {size}")
+    return await reader.readexactly(size)
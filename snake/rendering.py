@@ -1,9 +1,22 @@
 import pygame
-from typing import Dict, Tuple, List, Literal, Callable
+from itertools import islice, repeat
+from typing import Dict, Tuple, List, Literal, Callable, Optional
 import config
+from game_logic.game_state import (
+    HEAD_ADDED,
+    TAIL_REMOVED,
+    APPLE_SPAWNED,
+    SCORE_CHANGED,
+    STATE_CHANGED,
+    RESYNC_STATES,
+)
+from game_logic.arena import ArenaState
+from game_logic.grid import OccupancyGrid, BODY, APPLE
 from ui import Button
-import os
-import sys
+from surface_cache import SurfaceCache, render_text, text_cache
+import assets
+import fonts
+from viewport import Camera, Minimap
 
 # --- 모듈 수준 변수 ---
 # 렌더링에 필요한 폰트, 오프셋, UI 요소들을 전역적으로 관리합니다.
@@ -11,6 +24,38 @@ _font = None
 _title_font = None
 _offset_x = 0
 _offset_y = 0
+_grid_cols = 0
+_grid_rows = 0
+_tile_size = config.TILE_SIZE
+
+# --- 배경 캐시 및 증분 렌더링 상태 ---
+# 타일 배경과 경계선은 그리드 크기마다 한 번만 그려 두고 재사용합니다. ((화면 크기, 열, 행) -> Surface)
+_background_cache = {}
+_background = None
+# 마지막으로 그린 프레임의 정보 (draw_frame_incremental이 이전 프레임과 비교하는 데 사용)
+_last_frame = None
+# 그리드 좌표 -> 칸 왼쪽 위 픽셀 좌표 (init_renderer에서 한 번 계산, 카메라 모드에서는 카메라가 움직일 때마다 계산)
+_cell_origin = {}
+# 뷰포트 안의 상대 좌표 -> 픽셀 좌표 (카메라가 없으면 _cell_origin과 같습니다)
+_view_origin = {}
+_view_cols = 0
+_view_rows = 0
+_screen_size = (0, 0)
+# --- 카메라 모드 (창보다 큰 맵) ---
+_camera = None
+_minimap = None
+_minimap_pos = (0, 0)
+# True이면 다음 draw_frame_viewport에서 미니맵을 점유 그리드로부터 다시 만듭니다.
+_minimap_stale = False
+# 칸 하나에 그릴 스프라이트: "apple", "body", 방향 벡터(머리). 텍스처가 없으면 단색 타일을 사용합니다.
+_sprites = {}
+# 오버레이/메뉴 캐시: (종류, 화면 크기, 텍스트/점수, 호버 상태) -> 완성된 Surface
+OVERLAY_CACHE_SIZE = 16
+OVERLAY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_overlay_cache = SurfaceCache(OVERLAY_CACHE_SIZE, OVERLAY_CACHE_MAX_BYTES)
+# 보간 렌더링 상태: 마지막으로 본 머리 위치와, 그 틱에 비워진 꼬리 위치
+_interp_head = None
+_interp_prev_tail = None
 
 # --- 이미지 텍스처 로드 ---
 _textures = {}
@@ -18,51 +63,15 @@ _textures = {}
 
 def _load_textures():
     """
-    게임에 사용될 이미지 텍스처들을 로드하고 크기를 조절합니다.
+    게임에 사용될 이미지 텍스처들을 아틀라스 한 장에서 읽어 옵니다. (assets.py 참고)
     """
     global _textures
     if _textures:
         return
 
-    # PyInstaller로 빌드된 .exe에서 리소스 경로를 올바르게 찾기 위한 경로 설정
-    if hasattr(sys, "_MEIPASS"):
-        # PyInstaller는 임시 폴더에 데이터를 압축 해제하고 그 경로를 _MEIPASS에 저장합니다.
-        base_path = os.path.join(sys._MEIPASS, "res")
-    else:
-        # 일반적인 .py 실행 환경
-        base_path = os.path.join(os.path.dirname(__file__), "..", "res")
-
     try:
-        # 텍스처들을 딕셔너리에 로드합니다.
-        _textures = {
-            "tile": pygame.image.load(os.path.join(base_path, "tile.png")).convert(),
-            "apple": pygame.image.load(
-                os.path.join(base_path, "apple.png")
-            ).convert_alpha(),
-            "body": pygame.image.load(
-                os.path.join(base_path, "body.png")
-            ).convert_alpha(),
-            # 방향 벡터: (row, col)
-            (0, 1): pygame.image.load(
-                os.path.join(base_path, "head_right.png")
-            ).convert_alpha(),  # 오른쪽
-            (0, -1): pygame.image.load(
-                os.path.join(base_path, "head_left.png")
-            ).convert_alpha(),  # 왼쪽
-            (-1, 0): pygame.image.load(
-                os.path.join(base_path, "head_up.png")
-            ).convert_alpha(),  # 위
-            (1, 0): pygame.image.load(
-                os.path.join(base_path, "head_down.png")
-            ).convert_alpha(),  # 아래
-        }
-
-        # 로드된 모든 이미지의 크기를 TILE_SIZE에 맞게 조절합니다.
-        tile_dim = (config.TILE_SIZE, config.TILE_SIZE)
-        for key, img in _textures.items():
-            _textures[key] = pygame.transform.scale(img, tile_dim)
-
-    except pygame.error as e:
+        _textures = assets.load_textures(config.TILE_SIZE)
+    except (pygame.error, FileNotFoundError) as e:
         print(f"텍스처 파일 로딩 중 오류 발생: {e}")
         # 오류 발생 시 _textures를 비워 텍스처 렌더링을 시도하지 않도록 합니다.
         _textures = {}
@@ -76,37 +85,150 @@ _pause_menu_buttons = []
 
 def _initialize_fonts():
     """
-    게임에 필요한 폰트들을 초기화합니다. (최초 한 번만 실행)
+    게임에 필요한 폰트들을 준비합니다. 글자를 그리는 화면이 처음 표시될 때 한 번만 실행되며,
+    폰트 파일 검색과 디스크 캐시는 fonts.py가 담당합니다.
     """
     global _font, _title_font
     if _font and _title_font:
         return
-    try:
-        _font = pygame.font.SysFont("malgungothic", config.FONT_SIZE)
-        _title_font = pygame.font.SysFont("malgungothic", config.TITLE_FONT_SIZE)
-    except pygame.error:
-        print("'맑은 고딕' 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
-        _font = pygame.font.Font(None, config.FONT_SIZE)
-        _title_font = pygame.font.Font(None, config.TITLE_FONT_SIZE)
+    _font = fonts.get_font(config.FONT_SIZE)
+    _title_font = fonts.get_font(config.TITLE_FONT_SIZE)
 
 
-def init_renderer(screen: pygame.Surface, grid_cols: int, grid_rows: int) -> None:
+def init_renderer(screen: pygame.Surface, runtime_config: config.RuntimeConfig) -> None:
     """
     게임 플레이 화면 렌더링을 초기화합니다.
-    게임 그리드를 화면 중앙에 맞추기 위한 오프셋을 계산합니다.
+    게임 그리드를 화면 중앙에 맞추기 위한 오프셋을 계산하고, 타일 배경을 미리 그려 둡니다.
+    :param runtime_config: 그리드 크기와 칸별 픽셀 좌표가 미리 계산된 현재 게임의 설정
     """
-    global _offset_x, _offset_y
-    _initialize_fonts()
+    global _offset_x, _offset_y, _grid_cols, _grid_rows, _tile_size, _background, _last_frame
+    global _cell_origin, _sprites, _interp_head, _interp_prev_tail
+    global _view_origin, _view_cols, _view_rows, _screen_size, _camera, _minimap, _minimap_pos, _minimap_stale
     _load_textures()  # 텍스처 로딩 함수 호출
 
-    grid_width = grid_cols * config.TILE_SIZE
-    grid_height = grid_rows * config.TILE_SIZE
-    _offset_x = (screen.get_width() - grid_width) // 2
-    _offset_y = (screen.get_height() - grid_height) // 2
+    _screen_size = screen.get_size()
+    _offset_x = (screen.get_width() - runtime_config.screen_width) // 2
+    _offset_y = (screen.get_height() - runtime_config.screen_height) // 2
+    _grid_cols = runtime_config.grid_cols
+    _grid_rows = runtime_config.grid_rows
+    _view_cols = runtime_config.view_cols
+    _view_rows = runtime_config.view_rows
+    _tile_size = runtime_config.tile_size
+    if _offset_x == 0 and _offset_y == 0:
+        _view_origin = runtime_config.cell_origin
+    else:
+        _view_origin = {
+            pos: (_offset_x + x, _offset_y + y) for pos, (x, y) in runtime_config.cell_origin.items()
+        }
+    _sprites = _build_sprites()
+
+    if runtime_config.camera:
+        _camera = Camera(_grid_rows, _grid_cols, _view_rows, _view_cols, config.CAMERA_MARGIN)
+        _minimap = Minimap(_grid_rows, _grid_cols)
+        _minimap_pos = (
+            _screen_size[0] - _minimap.cols - 10,
+            _screen_size[1] - _minimap.rows - 10,
+        )
+        _minimap_stale = True
+        # 카메라 위치는 첫 draw_frame_viewport에서 머리를 기준으로 정해집니다.
+        _cell_origin = {}
+        _background = _get_background(_edges_in_view())
+    else:
+        _camera = None
+        _minimap = None
+        _cell_origin = _view_origin
+        _background = _get_background(None)
+    _last_frame = None  # 새 게임은 항상 전체 다시 그리기로 시작합니다.
+    _interp_head = None
+    _interp_prev_tail = None
+
+
+def _build_sprites() -> Dict:
+    """뱀과 사과를 그릴 스프라이트를 준비합니다. 텍스처 로딩에 실패했다면 단색 타일 Surface를 만듭니다."""
+    if _textures:
+        sprites = {"apple": _textures["apple"], "body": _textures["body"]}
+        for direction in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            sprites[direction] = _textures[direction]
+        return sprites
+
+    # Fallback: 사각형을 매번 그리는 대신 단색 타일을 만들어 두고 텍스처와 똑같이 blit합니다.
+    # (텍스처와 같은 픽셀 형식(convert_alpha)을 쓰면 SDL의 같은 빠른 blit 경로를 탑니다.)
+    def solid(color):
+        tile = pygame.Surface((_tile_size, _tile_size)).convert_alpha()
+        tile.fill(color)
+        return tile
+
+    head = solid(config.SNAKE_HEAD_COLOR)
+    sprites = {"apple": solid(config.APPLE_COLOR), "body": solid(config.SNAKE_BODY_COLOR)}
+    for direction in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        sprites[direction] = head
+    return sprites
+
+
+def _get_background(edges: Optional[Tuple[bool, bool, bool, bool]]) -> pygame.Surface:
+    """현재 화면/그리드 크기와 보이는 맵 경계에 맞는 배경을 캐시에서 가져오거나 만듭니다."""
+    key = (_screen_size, _view_cols, _view_rows, bool(_textures), edges)
+    if key not in _background_cache:
+        _background_cache[key] = _build_background(_screen_size, edges)
+    return _background_cache[key]
+
+
+def _build_background(
+    size: Tuple[int, int], edges: Optional[Tuple[bool, bool, bool, bool]] = None
+) -> pygame.Surface:
+    """
+    단색 배경, 타일, 맵 경계선을 한 번 그려 둔 배경 Surface를 만듭니다.
+    :param edges: 카메라 모드에서 뷰포트에 보이는 맵 경계 (위, 왼쪽, 아래, 오른쪽). None이면 맵 전체의 테두리를 그립니다.
+    """
+    background = pygame.Surface(size).convert()
+    background.fill(config.BG_COLOR)
+    if _textures.get("tile"):
+        # 타일은 뷰포트 칸 위치에만 깔아 두면 되므로, 맵이 아무리 커도 배경 크기는 뷰포트 크기입니다.
+        background.blits(zip(repeat(_textures["tile"]), _view_origin.values()), doreturn=False)
+    border_rect = pygame.Rect(
+        _offset_x,
+        _offset_y,
+        _view_cols * _tile_size,
+        _view_rows * _tile_size,
+    )
+    if edges is None:
+        pygame.draw.rect(background, config.GRID_COLOR, border_rect, 1)
+        return background
+
+    top, left, bottom, right = edges
+    color = config.GRID_COLOR
+    if top:
+        pygame.draw.line(background, color, border_rect.topleft, (border_rect.right - 1, border_rect.top))
+    if left:
+        pygame.draw.line(background, color, border_rect.topleft, (border_rect.left, border_rect.bottom - 1))
+    if bottom:
+        pygame.draw.line(
+            background, color, (border_rect.left, border_rect.bottom - 1), (border_rect.right - 1, border_rect.bottom - 1)
+        )
+    if right:
+        pygame.draw.line(
+            background, color, (border_rect.right - 1, border_rect.top), (border_rect.right - 1, border_rect.bottom - 1)
+        )
+    return background
+
+
+def _edges_in_view() -> Tuple[bool, bool, bool, bool]:
+    """뷰포트에 보이는 맵 경계 (위, 왼쪽, 아래, 오른쪽)"""
+    row, col = _camera.row, _camera.col
+    return row == 0, col == 0, row + _view_rows == _grid_rows, col + _view_cols == _grid_cols
+
+
+def _sync_camera():
+    """카메라가 움직인 뒤 칸 좌표 -> 픽셀 좌표 표와 배경(보이는 맵 경계)을 뷰포트 위치에 맞춥니다."""
+    global _cell_origin, _background
+    row, col = _camera.row, _camera.col
+    _cell_origin = {(r + row, c + col): xy for (r, c), xy in _view_origin.items()}
+    _background = _get_background(_edges_in_view())
 
 
 def _init_ui_elements(
     start_game_cb: Callable,
+    start_autopilot_cb: Callable,
     open_settings_cb: Callable,
     exit_game_cb: Callable,
     back_from_settings_cb: Callable,
@@ -122,8 +244,9 @@ def _init_ui_elements(
 
     if _main_menu_buttons:  # 이미 생성된 경우 콜백만 업데이트
         _main_menu_buttons[0].callback = start_game_cb
-        _main_menu_buttons[1].callback = open_settings_cb
-        _main_menu_buttons[2].callback = exit_game_cb
+        _main_menu_buttons[1].callback = start_autopilot_cb
+        _main_menu_buttons[2].callback = open_settings_cb
+        _main_menu_buttons[3].callback = exit_game_cb
         _settings_elements[-1]["button"].callback = back_from_settings_cb
         _pause_menu_buttons[0].callback = resume_game_cb
         _pause_menu_buttons[1].callback = open_settings_cb
@@ -135,7 +258,7 @@ def _init_ui_elements(
     btn_w, btn_h = 200, 50
 
     # 1. 메인 메뉴 버튼
-    start_y = config.UI_SCREEN_HEIGHT // 2 - 50
+    start_y = config.UI_SCREEN_HEIGHT // 2 - 80
     _main_menu_buttons = [
         Button(
             pygame.Rect(center_x - btn_w // 2, start_y, btn_w, btn_h),
@@ -145,12 +268,18 @@ def _init_ui_elements(
         ),
         Button(
             pygame.Rect(center_x - btn_w // 2, start_y + 60, btn_w, btn_h),
+            "자동 플레이",
+            _font,
+            start_autopilot_cb,
+        ),
+        Button(
+            pygame.Rect(center_x - btn_w // 2, start_y + 120, btn_w, btn_h),
             "설정",
             _font,
             open_settings_cb,
         ),
         Button(
-            pygame.Rect(center_x - btn_w // 2, start_y + 120, btn_w, btn_h),
+            pygame.Rect(center_x - btn_w // 2, start_y + 180, btn_w, btn_h),
             "게임 종료",
             _font,
             exit_game_cb,
@@ -164,20 +293,17 @@ def _init_ui_elements(
         "speed": ("속도", config.SPEED_OPTIONS),
         "map_size": ("맵 크기", config.MAP_SIZE_OPTIONS),
         "apple_count": ("사과 개수", config.APPLE_COUNT_OPTIONS),
+        "arena_snakes": ("AI 뱀", config.ARENA_SNAKE_OPTIONS),
     }
     for key, (label, options) in setting_items.items():
 
         def create_callback(setting_key, option_list):
             def on_click():
-                # 현재 설정 값과 다른 값으로 변경될 때만 플래그를 설정합니다.
+                # 다음 옵션으로 바꿉니다. 값이 실제로 바뀌면 config가 등록된 함수들에게 알립니다.
                 current_value = config.current_settings[setting_key]
                 current_idx = option_list.index(current_value)
                 next_idx = (current_idx + 1) % len(option_list)
-                new_value = option_list[next_idx]
-
-                if current_value != new_value:
-                    config.current_settings[setting_key] = new_value
-                    config.settings_have_changed = True
+                config.set_setting(setting_key, option_list[next_idx])
 
             return on_click
 
@@ -209,6 +335,7 @@ def _init_ui_elements(
 def draw_main_menu(
     screen: pygame.Surface,
     start_game_cb: Callable,
+    start_autopilot_cb: Callable,
     open_settings_cb: Callable,
     exit_game_cb: Callable,
     events: List[pygame.event.Event],
@@ -216,19 +343,17 @@ def draw_main_menu(
     """메인 메뉴 화면을 그립니다."""
     _init_ui_elements(
         start_game_cb,
+        start_autopilot_cb,
         open_settings_cb,
         exit_game_cb,
         lambda: None,
         lambda: None,
         lambda: None,
     )
-    title_surf = _title_font.render("Hebi", True, config.UI_TITLE_COLOR)
-    title_rect = title_surf.get_rect(center=(screen.get_width() // 2, 100))
-    screen.blit(title_surf, title_rect)
     for button in _main_menu_buttons:
         for event in events:
             button.handle_event(event)
-        button.draw(screen)
+    _blit_menu(screen, "main_menu", "Hebi", 100, _main_menu_buttons)
 
 
 def draw_settings_screen(
@@ -241,13 +366,12 @@ def draw_settings_screen(
         lambda: None,
         lambda: None,
         lambda: None,
+        lambda: None,
         back_from_settings_cb,
         lambda: None,
         lambda: None,
     )
-    title_surf = _title_font.render("설정", True, config.UI_TITLE_COLOR)
-    title_rect = title_surf.get_rect(center=(screen.get_width() // 2, 80))
-    screen.blit(title_surf, title_rect)
+    buttons = []
     for element in _settings_elements:
         button = element["button"]
         if "key" in element:  # 설정 값 변경 시 버튼 텍스트 업데이트
@@ -256,106 +380,364 @@ def draw_settings_screen(
             )
         for event in events:
             button.handle_event(event)
-        button.draw(screen)
+        buttons.append(button)
+    _blit_menu(screen, "settings", "설정", 80, buttons)
 
 
-def draw_frame(screen: pygame.Surface, render_data: Dict) -> None:
-    """한 프레임의 게임 화면(뱀, 사과, 점수)을 그립니다."""
-    screen.fill(config.BG_COLOR)
-    if not _font:
-        return
+def _blit_menu(
+    screen: pygame.Surface, kind: str, title: str, title_y: int, buttons: List[Button]
+) -> None:
+    """
+    제목과 버튼들로 이루어진 메뉴 화면을 그립니다.
+    버튼의 텍스트나 호버 상태가 바뀔 때만 새로 그리고, 그 외에는 캐시된 Surface를 사용합니다.
+    """
+    size = screen.get_size()
+    key = (kind, size, tuple((button.text, button.is_hovered) for button in buttons))
 
-    game_config = config.get_current_config()
+    def build():
+        menu_surface = pygame.Surface(size).convert()
+        menu_surface.fill(config.BG_COLOR)
+        title_surf = render_text(_title_font, title, config.UI_TITLE_COLOR)
+        menu_surface.blit(title_surf, title_surf.get_rect(center=(size[0] // 2, title_y)))
+        for button in buttons:
+            button.draw(menu_surface)
+        return menu_surface
 
-    # --- 타일 배경 그리기 ---
-    if _textures.get("tile"):
-        for r in range(game_config["GRID_ROWS"]):
-            for c in range(game_config["GRID_COLS"]):
-                _draw_tile(screen, (r, c), _textures["tile"])
+    screen.blit(_overlay_cache.get(key, build), (0, 0))
 
-    # --- 맵 경계선 그리기 ---
-    border_rect = pygame.Rect(
-        _offset_x,
-        _offset_y,
-        game_config["GRID_COLS"] * config.TILE_SIZE,
-        game_config["GRID_ROWS"] * config.TILE_SIZE,
-    )
-    pygame.draw.rect(screen, config.GRID_COLOR, border_rect, 1)
+
+def draw_frame(screen: pygame.Surface, render_data: Dict) -> None:
+    """한 프레임의 게임 화면(뱀, 사과, 점수)을 처음부터 다시 그립니다."""
+    global _last_frame
+    _initialize_fonts()
+
+    # --- 미리 그려 둔 타일 배경과 맵 경계선 ---
+    screen.blit(_background, (0, 0))
 
     # --- 게임 요소 그리기 ---
-    # 텍스처가 성공적으로 로드되었는지 확인합니다.
-    if not _textures:
-        # 텍스처 로딩 실패 시 기존의 사각형 방식으로 그립니다 (Fallback)
-        for apple_pos in render_data.get("apples", []):
-            _draw_tile_fallback(screen, apple_pos, config.APPLE_COLOR)
-        snake_parts = render_data.get("snake_body", [])
-        if snake_parts:
-            _draw_tile_fallback(screen, snake_parts[0], config.SNAKE_HEAD_COLOR)
-            for part in snake_parts[1:]:
-                _draw_tile_fallback(screen, part, config.SNAKE_BODY_COLOR)
-    else:
-        # 텍스처를 사용하여 그립니다.
-        for apple_pos in render_data.get("apples", []):
-            _draw_tile(screen, apple_pos, _textures["apple"])
-
-        snake_parts = render_data.get("snake_body", [])
-        snake_direction = render_data.get("snake_direction")
-
-        if snake_parts:
-            # 머리 그리기: 방향에 맞는 텍스처를 선택합니다.
-            head_texture = _textures.get(
-                snake_direction, _textures.get((0, 1))
-            )  # 방향 키가 없으면 오른쪽(기본)
-            if head_texture:
-                _draw_tile(screen, snake_parts[0], head_texture)
-
-            # 몸통 그리기
-            if _textures.get("body"):
-                for part in snake_parts[1:]:
-                    _draw_tile(screen, part, _textures["body"])
-
-    score_surf = _font.render(
-        f"점수: {render_data.get('score', 0)}", True, (50, 50, 50)
-    )
-    screen.blit(score_surf, (10, 10))
+    # 레이어마다 (스프라이트, 위치) 시퀀스를 만들어 한 번의 blits() 호출로 그립니다.
+    origin = _cell_origin.__getitem__
+    apples = render_data.get("apples", [])
+    screen.blits(zip(repeat(_sprites["apple"]), map(origin, apples)), doreturn=False)
+
+    snake_parts = render_data.get("snake_body", [])
+    if snake_parts:
+        screen.blits(
+            zip(repeat(_sprites["body"]), map(origin, islice(snake_parts, 1, None))),
+            doreturn=False,
+        )
+        _draw_cell(screen, snake_parts[0], "head", render_data.get("snake_direction"))
+
+    score = render_data.get("score", 0)
+    _last_frame = {
+        "body": snake_parts,
+        "head": snake_parts[0] if snake_parts else None,
+        "direction": render_data.get("snake_direction"),
+        "score": score,
+        "score_rect": _draw_score(screen, score),
+    }
 
 
-def _draw_tile(
-    screen: pygame.Surface, pos: Tuple[int, int], texture: pygame.Surface
-) -> None:
-    """그리드 좌표에 맞는 위치에 텍스처를 그리는 헬퍼 함수입니다."""
-    r, c = pos
-    rect = pygame.Rect(
-        _offset_x + c * config.TILE_SIZE,
-        _offset_y + r * config.TILE_SIZE,
-        config.TILE_SIZE,
-        config.TILE_SIZE,
-    )
-    screen.blit(texture, rect)
+def draw_frame_interpolated(screen: pygame.Surface, render_data: Dict, alpha: float) -> None:
+    """
+    틱 사이의 진행도 alpha(0~1)에 따라 머리와 꼬리를 칸 사이의 위치에 그립니다.
+    화면은 한 틱 늦게 따라가며, alpha=0이면 이전 틱의 모습, alpha=1이면 현재 틱의 모습이 됩니다.
+    """
+    global _interp_head, _interp_prev_tail, _last_frame
+    _initialize_fonts()
+    body = render_data.get("snake_body", [])
+    if len(body) < 2:
+        draw_frame(screen, render_data)
+        return
+
+    # 머리가 바뀌었다면 새 틱이 진행된 것이므로, 이전 프레임의 꼬리를 비워진 꼬리로 기억합니다.
+    if body[0] != _interp_head:
+        prev_body = _last_frame["body"] if _last_frame else None  # 증분 렌더링 후에는 None
+        grew = not prev_body or len(body) > len(prev_body)
+        _interp_prev_tail = None if grew else prev_body[-1]
+        _interp_head = body[0]
+
+    screen.blit(_background, (0, 0))
+    origin = _cell_origin.__getitem__
+    screen.blits(zip(repeat(_sprites["apple"]), map(origin, render_data.get("apples", []))), doreturn=False)
+    screen.blits(zip(repeat(_sprites["body"]), map(origin, islice(body, 1, None))), doreturn=False)
+    if _interp_prev_tail is not None:
+        screen.blit(_sprites["body"], _lerp_origin(_interp_prev_tail, body[-1], alpha))
+    head_sprite = _sprites.get(render_data.get("snake_direction"), _sprites[(0, 1)])
+    screen.blit(head_sprite, _lerp_origin(body[1], body[0], alpha))
+
+    score = render_data.get("score", 0)
+    _last_frame = {
+        "body": body,
+        "head": body[0],
+        "direction": render_data.get("snake_direction"),
+        "score": score,
+        "score_rect": _draw_score(screen, score),
+    }
+
+
+def _lerp_origin(start: Tuple[int, int], end: Tuple[int, int], alpha: float) -> Tuple[int, int]:
+    """두 칸 사이를 alpha 비율로 보간한 픽셀 좌표를 반환합니다."""
+    (x0, y0), (x1, y1) = _cell_origin[start], _cell_origin[end]
+    return round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha)
 
 
-def _draw_tile_fallback(
-    screen: pygame.Surface, pos: Tuple[int, int], color: Tuple[int, int, int]
+def draw_frame_viewport(
+    screen: pygame.Surface,
+    changes: List[Tuple[str, object]],
+    grid: OccupancyGrid,
+    head: Tuple[int, int],
+    direction: Tuple[int, int],
+    score: int,
 ) -> None:
-    """[Fallback] 그리드 좌표에 맞는 사각형 타일 하나를 그리는 헬퍼 함수입니다."""
-    r, c = pos
-    rect = pygame.Rect(
-        _offset_x + c * config.TILE_SIZE,
-        _offset_y + r * config.TILE_SIZE,
-        config.TILE_SIZE,
-        config.TILE_SIZE,
-    )
-    pygame.draw.rect(screen, color, rect)
+    """
+    카메라 모드(창보다 큰 맵)에서 뷰포트 전체를 다시 그립니다.
+    뱀 몸통 목록 대신 점유 그리드에서 뷰포트 안의 칸만 확인하므로, 비용은 맵 크기나 뱀 길이가 아니라 뷰포트 크기에 비례합니다.
+    :param changes: 지난 프레임 이후의 변경 피드 (미니맵 갱신에 사용합니다)
+    :param grid: 칸의 점유 상태를 확인할 점유 그리드
+    :param head: 뱀 머리 위치 (카메라가 따라갑니다)
+    """
+    global _last_frame
+    _initialize_fonts()
+
+    _sync_viewport(changes, grid, head)
+    _blit_viewport_cells(screen, grid, {head: direction})
+    _draw_minimap(screen, head)
+
+    _last_frame = {
+        "body": None,
+        "head": head,
+        "direction": direction,
+        "score": score,
+        "score_rect": _draw_score(screen, score),
+    }
+
+
+def draw_arena_frame(screen: pygame.Surface, changes: List[Tuple[str, object]], arena: ArenaState) -> None:
+    """
+    아레나 모드의 화면 전체를 다시 그립니다. 카메라는 플레이어(0번) 뱀을 따라가며,
+    몸통과 사과는 점유 그리드에서, 머리는 살아있는 뱀 중 뷰포트 안에 있는 것만 그립니다.
+    비용은 뷰포트 크기 + 뱀의 수에 비례하고, 뱀들의 길이와는 무관합니다.
+    :param changes: 지난 프레임 이후의 변경 피드 (미니맵 갱신에 사용합니다)
+    """
+    global _last_frame
+    _initialize_fonts()
+
+    focus = arena.snake.head()
+    _sync_viewport(changes, arena.grid, focus)
+    heads = {}
+    row0, col0 = (_camera.row, _camera.col) if _camera else (0, 0)
+    for snake, alive in zip(arena.snakes, arena.alive):
+        if alive:
+            pos = snake.head()
+            if 0 <= pos[0] - row0 < _view_rows and 0 <= pos[1] - col0 < _view_cols:
+                heads[pos] = snake.direction
+    _blit_viewport_cells(screen, arena.grid, heads)
+    if _minimap:
+        _draw_minimap(screen, focus)
+    _draw_score(screen, arena.score)
+    _last_frame = None  # 여러 뱀이 동시에 움직이므로 증분 렌더링은 사용하지 않습니다.
+
+
+def _sync_viewport(changes: List[Tuple[str, object]], grid: OccupancyGrid, focus: Tuple[int, int]):
+    """
+    카메라 모드에서 변경 피드로 미니맵을 갱신하고 카메라가 focus를 따라가게 합니다.
+    리셋/복원되었다면 미니맵을 다시 만들고 카메라를 focus 중심으로 옮깁니다. (창에 맞는 맵에서는 아무것도 하지 않습니다)
+    """
+    global _minimap_stale
+    if _camera is None:
+        return
+    if _minimap_stale or any(kind == STATE_CHANGED and value in RESYNC_STATES for kind, value in changes):
+        _minimap.rebuild(grid)
+        _minimap_stale = False
+        _camera.center_on(focus)
+        _sync_camera()
+    else:
+        _minimap.apply(changes)
+        if _camera.follow(focus) or not _cell_origin:
+            _sync_camera()
+
+
+def _blit_viewport_cells(screen: pygame.Surface, grid: OccupancyGrid, heads: Dict[Tuple[int, int], Tuple[int, int]]):
+    """
+    배경을 깔고, 점유 그리드에서 뷰포트 안의 사과와 몸통 칸을 찾아 그린 뒤 머리들을 그립니다.
+    :param heads: 머리 위치 -> 방향 (뷰포트 안에 있는 머리만)
+    """
+    screen.blit(_background, (0, 0))
+    origin = _cell_origin
+    cells, cols = grid.cells, grid.cols
+    row0, col0 = (_camera.row, _camera.col) if _camera else (0, 0)
+    view_cols = _view_cols
+    apples, body = [], []
+    for r in range(row0, row0 + _view_rows):
+        start = r * cols + col0
+        row = cells[start:start + view_cols]
+        if row.count(0) == view_cols:
+            continue
+        for c, tag in enumerate(row, col0):
+            if tag == BODY:
+                if (r, c) not in heads:
+                    body.append(origin[(r, c)])
+            elif tag == APPLE:
+                apples.append(origin[(r, c)])
+    screen.blits(zip(repeat(_sprites["apple"]), apples), doreturn=False)
+    screen.blits(zip(repeat(_sprites["body"]), body), doreturn=False)
+    for pos, direction in heads.items():
+        _draw_cell(screen, pos, "head", direction)
+
+
+def _draw_minimap(screen: pygame.Surface, head: Tuple[int, int]) -> pygame.Rect:
+    """오른쪽 아래에 미니맵, 현재 뷰포트 영역, 머리 위치를 그리고, 그린 영역을 반환합니다."""
+    rect = screen.blit(_minimap.surface, _minimap_pos)
+    view_rect = _minimap.view_rect(_camera).move(_minimap_pos).clip(rect)
+    if view_rect.width and view_rect.height:
+        pygame.draw.rect(screen, config.MINIMAP_VIEW_COLOR, view_rect, 1)
+    x, y = _minimap.cell_pos(head)
+    screen.fill(config.SNAKE_HEAD_COLOR, pygame.Rect(rect.x + x - 1, rect.y + y - 1, 3, 3).clip(rect))
+    frame = rect.inflate(2, 2)
+    pygame.draw.rect(screen, config.GRID_COLOR, frame, 1)
+    return frame
+
+
+def draw_frame_incremental(
+    screen: pygame.Surface, changes: List[Tuple[str, object]], grid: OccupancyGrid
+) -> Optional[List[pygame.Rect]]:
+    """
+    GameState의 변경 피드에 담긴 칸(새 머리, 몸통이 된 이전 머리, 비워진 꼬리, 새 사과, 점수)만 다시 그립니다.
+    틱마다 처리할 이벤트가 몇 개뿐이므로 뱀의 길이와 상관없이 비용이 일정합니다.
+    :param changes: 지난 프레임 이후 GameState.changes에 쌓인 (종류, 값) 이벤트
+    :param grid: 점수 영역을 다시 그릴 때 칸의 점유 상태를 O(1)로 확인하기 위한 점유 그리드
+    :return: 다시 그린 영역(screen 좌표)의 목록. 이전 프레임 정보가 없거나 리셋/복원되어
+             전체를 다시 그려야 한다면 None을 반환합니다. (호출자가 draw_frame을 사용합니다)
+    """
+    global _last_frame
+    last = _last_frame
+    if last is None or last["head"] is None:
+        return None
+
+    head, direction, score = last["head"], last["direction"], last["score"]
+    if _camera is not None:
+        # 카메라 모드: 카메라가 움직여야 하거나 뷰포트 밖으로 나간 머리가 있다면 뷰포트 전체를 다시 그립니다.
+        final_head = head
+        for kind, value in changes:
+            if kind == HEAD_ADDED:
+                final_head = value[0]
+                if not _camera.contains(final_head):
+                    return None
+            elif kind == STATE_CHANGED and value in RESYNC_STATES:
+                return None
+        if _camera.target(final_head) != (_camera.row, _camera.col):
+            return None
+        _minimap.apply(changes)
+
+    origin = _cell_origin
+    dirty = []
+    # 텍스처에 투명한 부분이 있으므로 이전 그림(예: 이전 머리) 위에 바로 그리지 않고 배경부터 되돌립니다.
+    for kind, value in changes:
+        if kind == TAIL_REMOVED:
+            if value in origin:  # 카메라 모드에서는 뷰포트 밖의 칸일 수 있습니다.
+                dirty.append(_erase_cell(screen, value))
+        elif kind == HEAD_ADDED:
+            pos, direction_after = value
+            _erase_cell(screen, head)
+            dirty.append(_draw_cell(screen, head, "body"))
+            _erase_cell(screen, pos)
+            dirty.append(_draw_cell(screen, pos, "head", direction_after))
+            head, direction = pos, direction_after
+        elif kind == APPLE_SPAWNED:
+            if value in origin:
+                _erase_cell(screen, value)
+                dirty.append(_draw_cell(screen, value, "apple"))
+        elif kind == SCORE_CHANGED:
+            score = value
+        elif kind == STATE_CHANGED and value in RESYNC_STATES:
+            return None
+        # APPLE_EATEN: 먹힌 사과 칸은 같은 틱의 새 머리가 덮습니다.
+
+    # 점수가 바뀌었거나 점수 글자 위에 무언가를 그렸다면 점수 영역을 다시 그립니다.
+    score_rect = last["score_rect"]
+    if score != last["score"] or score_rect.collidelist(dirty) != -1:
+        screen.blit(_background, score_rect, score_rect)
+        for pos in _cells_in_rect(score_rect):
+            tag = grid.get(pos)
+            if tag == APPLE:
+                dirty.append(_draw_cell(screen, pos, "apple"))
+            elif tag == BODY:
+                if pos == head:
+                    dirty.append(_draw_cell(screen, pos, "head", direction))
+                else:
+                    dirty.append(_draw_cell(screen, pos, "body"))
+        new_score_rect = _draw_score(screen, score)
+        dirty.append(score_rect.union(new_score_rect))
+        score_rect = new_score_rect
+
+    if _camera is not None and changes:
+        # 미니맵 위에 그려진 칸이 있을 수 있고 머리 위치도 바뀌었으므로 미니맵을 다시 올립니다.
+        dirty.append(_draw_minimap(screen, head))
+
+    _last_frame = {"body": None, "head": head, "direction": direction, "score": score, "score_rect": score_rect}
+    return dirty
+
+
+def _cells_in_rect(rect: pygame.Rect):
+    """화면 좌표의 rect와 겹치는 그리드 칸 좌표들을 반환합니다."""
+    tile = _tile_size
+    first_c = max(0, (rect.left - _offset_x) // tile)
+    last_c = min(_view_cols - 1, (rect.right - 1 - _offset_x) // tile)
+    first_r = max(0, (rect.top - _offset_y) // tile)
+    last_r = min(_view_rows - 1, (rect.bottom - 1 - _offset_y) // tile)
+    row0, col0 = (_camera.row, _camera.col) if _camera is not None else (0, 0)
+    return [(r + row0, c + col0) for r in range(first_r, last_r + 1) for c in range(first_c, last_c + 1)]
+
+
+def _draw_score(screen: pygame.Surface, score: int) -> pygame.Rect:
+    """왼쪽 위에 점수를 그리고, 그린 영역을 반환합니다."""
+    score_surf = render_text(_font, f"점수: {score}", (50, 50, 50))
+    return screen.blit(score_surf, (10, 10))
+
+
+def _cell_rect(pos: Tuple[int, int]) -> pygame.Rect:
+    """그리드 좌표에 해당하는 화면 영역을 반환합니다."""
+    return pygame.Rect(_cell_origin[pos], (_tile_size, _tile_size))
+
+
+def _erase_cell(screen: pygame.Surface, pos: Tuple[int, int]) -> pygame.Rect:
+    """칸을 미리 그려 둔 배경으로 되돌립니다."""
+    rect = _cell_rect(pos)
+    screen.blit(_background, rect, rect)
+    return rect
+
+
+def _draw_cell(
+    screen: pygame.Surface,
+    pos: Tuple[int, int],
+    kind: Literal["head", "body", "apple"],
+    direction: Tuple[int, int] = None,
+) -> pygame.Rect:
+    """칸 하나에 머리/몸통/사과를 그리고, 그린 영역을 반환합니다."""
+    if kind == "head":
+        # 머리 그리기: 방향에 맞는 스프라이트를 선택합니다. 방향 키가 없으면 오른쪽(기본)
+        sprite = _sprites.get(direction, _sprites[(0, 1)])
+    else:
+        sprite = _sprites[kind]
+    return screen.blit(sprite, _cell_origin[pos])
 
 
 def draw_overlay(
     screen: pygame.Surface, state: Literal["game_over", "game_win"], score: int
 ) -> None:
     """게임 오버 또는 승리 시 나타나는 반투명 오버레이를 그립니다."""
-    overlay_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    _initialize_fonts()
+    size = screen.get_size()
+    overlay_surface = _overlay_cache.get(
+        ("result", size, state, score), lambda: _build_result_overlay(size, state, score)
+    )
+    screen.blit(overlay_surface, (0, 0))
+
+
+def _build_result_overlay(size: Tuple[int, int], state: str, score: int) -> pygame.Surface:
+    overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
     overlay_surface.fill((0, 0, 0, 128))
-    if not _font:
-        return
     if state == "game_over":
         title_text = "게임 오버"
         prompt_text = "재시작: Enter / 메뉴로: ESC"
@@ -365,15 +747,15 @@ def draw_overlay(
 
     subtitle_text = f"최종 점수: {score}"
     texts = [
-        (_title_font.render(title_text, True, (255, 255, 255)), -50),
-        (_font.render(subtitle_text, True, (255, 255, 255)), 10),
-        (_font.render(prompt_text, True, (200, 200, 200)), 60),
+        (render_text(_title_font, title_text, (255, 255, 255)), -50),
+        (render_text(_font, subtitle_text, (255, 255, 255)), 10),
+        (render_text(_font, prompt_text, (200, 200, 200)), 60),
     ]
-    center_x, center_y = screen.get_width() / 2, screen.get_height() / 2
+    center_x, center_y = size[0] / 2, size[1] / 2
     for surf, offset_y in texts:
         rect = surf.get_rect(center=(center_x, center_y + offset_y))
         overlay_surface.blit(surf, rect)
-    screen.blit(overlay_surface, (0, 0))
+    return overlay_surface.convert_alpha()
 
 
 def draw_pause_overlay(
@@ -383,13 +765,11 @@ def draw_pause_overlay(
     go_to_main_menu_cb: Callable,
     events: List[pygame.event.Event],
 ) -> None:
-    """일시정지 메뉴 오버레이를 그립니다."""
-    overlay_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-    overlay_surface.fill((0, 0, 0, 128))
-    if not _font:
-        return
+    """일시정지 메뉴 오버레이를 그립니다. 버튼의 호버 상태가 바뀔 때만 새로 그립니다."""
+    _initialize_fonts()
 
     _init_ui_elements(
+        lambda: None,
         lambda: None,
         open_settings_cb,
         lambda: None,
@@ -398,51 +778,69 @@ def draw_pause_overlay(
         go_to_main_menu_cb,
     )
 
-    title_surf = _title_font.render("일시정지", True, (255, 255, 255))
-    center_x, center_y = screen.get_width() / 2, screen.get_height() / 2
-    title_rect = title_surf.get_rect(center=(center_x, center_y - 100))
-    overlay_surface.blit(title_surf, title_rect)
-
-    # 버튼들의 위치를 중앙에 맞추고 그립니다.
+    # 버튼들의 위치를 중앙에 맞추고 이벤트를 처리합니다. (그리기는 캐시된 오버레이를 사용)
+    size = screen.get_size()
+    center_x, center_y = size[0] / 2, size[1] / 2
     for i, button in enumerate(_pause_menu_buttons):
         button.rect.center = (center_x, center_y + (i * 60) - 20)
         for event in events:
             button.handle_event(event)
-        button.draw(overlay_surface)
 
+    hover_state = tuple(button.is_hovered for button in _pause_menu_buttons)
+    overlay_surface = _overlay_cache.get(
+        ("pause", size, hover_state), lambda: _build_pause_overlay(size)
+    )
     screen.blit(overlay_surface, (0, 0))
 
 
+def _build_pause_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+    overlay_surface.fill((0, 0, 0, 128))
+    title_surf = render_text(_title_font, "일시정지", (255, 255, 255))
+    title_rect = title_surf.get_rect(center=(size[0] / 2, size[1] / 2 - 100))
+    overlay_surface.blit(title_surf, title_rect)
+    for button in _pause_menu_buttons:
+        button.draw(overlay_surface)
+    return overlay_surface.convert_alpha()
+
+
 def draw_restart_prompt_overlay(screen: pygame.Surface) -> None:
     """설정 변경 후 재시작이 필요하다는 안내 오버레이를 그립니다."""
-    overlay_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    _initialize_fonts()
+    size = screen.get_size()
+    overlay_surface = _overlay_cache.get(("restart_prompt", size), lambda: _build_restart_prompt_overlay(size))
+    screen.blit(overlay_surface, (0, 0))
+
+
+def _build_restart_prompt_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
     overlay_surface.fill((0, 0, 0, 170))  # 좀 더 진한 배경
-    if not _font:
-        return
 
     prompt_text = "설정이 변경되었습니다. Enter를 눌러 재시작하세요."
 
-    prompt_surf = _font.render(prompt_text, True, (255, 255, 255))
-    prompt_rect = prompt_surf.get_rect(
-        center=(screen.get_width() / 2, screen.get_height() / 2)
-    )
+    prompt_surf = render_text(_font, prompt_text, (255, 255, 255))
+    prompt_rect = prompt_surf.get_rect(center=(size[0] / 2, size[1] / 2))
     overlay_surface.blit(prompt_surf, prompt_rect)
-
-    screen.blit(overlay_surface, (0, 0))
+    return overlay_surface.convert_alpha()
 
 
 def draw_ready_overlay(screen: pygame.Surface) -> None:
     """게임 시작 전 조작법을 안내하는 오버레이를 그립니다."""
-    overlay_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    _initialize_fonts()
+    size = screen.get_size()
+    overlay_surface = _overlay_cache.get(("ready", size), lambda: _build_ready_overlay(size))
+    screen.blit(overlay_surface, (0, 0))
+
+
+def _build_ready_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
     overlay_surface.fill((0, 0, 0, 128))
-    if not _font:
-        return
 
-    center_x, center_y = screen.get_width() / 2, screen.get_height() / 2
+    center_x, center_y = size[0] / 2, size[1] / 2
 
     # --- 요소들 정의 ---
     prompt_text = "방향키로 시작"
-    prompt_surf = _title_font.render(prompt_text, True, (255, 255, 255))
+    prompt_surf = render_text(_title_font, prompt_text, (255, 255, 255))
 
     arrow_color = (200, 200, 200)
     key_bg_color = (80, 80, 80)
@@ -532,4 +930,9 @@ def draw_ready_overlay(screen: pygame.Surface) -> None:
         ],
     )
 
-    screen.blit(overlay_surface, (0, 0))
+    return overlay_surface.convert_alpha()
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """렌더링 캐시들의 통계(항목 수, 적중/실패 횟수)를 반환합니다."""
+    return {"overlay": _overlay_cache.stats(), "text": text_cache.stats()}
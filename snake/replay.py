@@ -0,0 +1,256 @@
+"""
+게임 입력을 기록하고, 기록된 리플레이를 헤드리스로 재생/검증하는 모듈입니다.
+
+GameState는 시드와 입력만 같으면 항상 같은 결과를 내므로, 리플레이에는
+시드, 게임 설정(get_current_config() 결과), (틱, 방향) 입력 목록만 저장합니다.
+
+파일 형식 (모든 정수는 부호 없는 LEB128 varint):
+    b"HEBI" + 버전(1바이트)
+    헤더 길이 + 헤더(JSON, UTF-8): seed, config, ticks, score, outcome, state_hash
+    입력 개수 N
+    N개의 틱 차이값 (이전 입력과의 틱 간격)
+    방향 스트림: 입력당 2비트 (UP/DOWN/LEFT/RIGHT), 1바이트에 4개씩
+
+사용 예:
+    python replay.py verify replays/*.hebi
+    python replay.py info replays/20260101-120000.hebi
+"""
+import argparse
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+from game_logic.game_state import GameState
+from game_logic.snake import DIRECTION_VECTORS, DIRECTION_INDEX
+
+MAGIC = b"HEBI"
+VERSION = 1
+
+
+class Replay:
+    """한 판의 게임을 재현하는 데 필요한 모든 정보를 담는 클래스입니다."""
+    def __init__(
+        self,
+        seed: int,
+        game_config: Dict,
+        inputs: List[Tuple[int, Tuple[int, int]]],
+        ticks: int,
+        score: int,
+        outcome: str,
+        state_hash: str,
+    ):
+        """
+        :param seed: GameState에 전달된 시드
+        :param game_config: 게임 시작 시점의 get_current_config() 결과
+        :param inputs: (틱, 방향) 입력 목록. 틱은 입력이 적용된 시점의 GameState.tick입니다.
+        :param ticks: 게임이 끝날 때까지 실행된 총 틱 수
+        :param score: 최종 점수
+        :param outcome: "game_over" / "game_win" / "abandoned"
+        :param state_hash: 마지막 상태의 GameState.state_hash()
+        """
+        self.seed = seed
+        self.config = game_config
+        self.inputs = inputs
+        self.ticks = ticks
+        self.score = score
+        self.outcome = outcome
+        self.state_hash = state_hash
+
+
+class ReplayRecorder:
+    """게임 진행 중 입력을 기록하고, 게임이 끝나면 Replay를 만들어 주는 클래스입니다."""
+    def __init__(self, seed: int, game_config: Dict):
+        self.seed = seed
+        self.config = dict(game_config)
+        self.inputs = []
+
+    def record(self, tick: int, direction: Tuple[int, int]):
+        """handle_input에 전달된 방향을 현재 틱과 함께 기록합니다."""
+        if direction:
+            self.inputs.append((tick, direction))
+
+    def finish(self, game_state: GameState) -> Replay:
+        """현재 게임 상태를 최종 결과로 하는 Replay를 만듭니다."""
+        if game_state.is_win():
+            outcome = "game_win"
+        elif game_state.is_over():
+            outcome = "game_over"
+        else:
+            outcome = "abandoned"
+        return Replay(
+            self.seed,
+            self.config,
+            list(self.inputs),
+            game_state.tick,
+            game_state.score,
+            outcome,
+            game_state.state_hash(),
+        )
+
+
+# --- 인코딩 / 디코딩 ---
+def write_varint(out: bytearray, value: int):
+    """부호 없는 정수를 LEB128 varint로 out 뒤에 붙입니다. (protocol.py의 네트워크 메시지에서도 사용합니다)"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """data[pos]부터 varint 하나를 읽어 (값, 다음 위치)를 반환합니다."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode(replay: Replay) -> bytes:
+    """Replay를 바이너리 형식으로 인코딩합니다."""
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    header = json.dumps(
+        {
+            "seed": replay.seed,
+            "config": replay.config,
+            "ticks": replay.ticks,
+            "score": replay.score,
+            "outcome": replay.outcome,
+            "state_hash": replay.state_hash,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    write_varint(out, len(header))
+    out += header
+
+    write_varint(out, len(replay.inputs))
+    last_tick = 0
+    for tick, _ in replay.inputs:
+        write_varint(out, tick - last_tick)
+        last_tick = tick
+
+    packed = bytearray((len(replay.inputs) + 3) // 4)
+    for i, (_, direction) in enumerate(replay.inputs):
+        packed[i >> 2] |= DIRECTION_INDEX[direction] << ((i & 3) * 2)
+    out += packed
+    return bytes(out)
+
+
+def decode(data: bytes) -> Replay:
+    """바이너리 데이터를 Replay로 디코딩합니다."""
+    if data[:4] != MAGIC:
+        raise ValueError("Hebi 리플레이 파일이 아닙니다.")
+    if data[4] != VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전입니다: {data[4]}")
+    pos = 5
+    header_len, pos = read_varint(data, pos)
+    header = json.loads(data[pos:pos + header_len].decode("utf-8"))
+    pos += header_len
+
+    count, pos = read_varint(data, pos)
+    ticks = []
+    tick = 0
+    for _ in range(count):
+        delta, pos = read_varint(data, pos)
+        tick += delta
+        ticks.append(tick)
+
+    inputs = []
+    for i, tick in enumerate(ticks):
+        code = (data[pos + (i >> 2)] >> ((i & 3) * 2)) & 3
+        inputs.append((tick, DIRECTION_VECTORS[code]))
+
+    return Replay(
+        header["seed"],
+        header["config"],
+        inputs,
+        header["ticks"],
+        header["score"],
+        header["outcome"],
+        header["state_hash"],
+    )
+
+
+def save(replay: Replay, path: str):
+    with open(path, "wb") as f:
+        f.write(encode(replay))
+
+
+def load(path: str) -> Replay:
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+# --- 재생 / 검증 ---
+def play(replay: Replay) -> GameState:
+    """리플레이를 헤드리스로 최대 속도로 재시뮬레이션하고 마지막 GameState를 반환합니다."""
+    game_state = GameState(
+        rows=replay.config["GRID_ROWS"],
+        cols=replay.config["GRID_COLS"],
+        max_apples=replay.config["MAX_APPLES"],
+        seed=replay.seed,
+    )
+    for tick, direction in replay.inputs:
+        _run_until(game_state, tick)
+        game_state.handle_input(direction)
+    _run_until(game_state, replay.ticks)
+    return game_state
+
+
+def _run_until(game_state: GameState, tick: int):
+    """게임이 끝나지 않았다면 GameState.tick이 tick에 도달할 때까지 update()를 호출합니다."""
+    while game_state.tick < tick and not game_state.is_over() and not game_state.is_win():
+        game_state.update()
+
+
+def verify(replay: Replay) -> Optional[str]:
+    """리플레이를 재생하여 기록된 결과와 비교합니다. 일치하면 None, 아니면 불일치 사유를 반환합니다."""
+    game_state = play(replay)
+    if game_state.tick != replay.ticks:
+        return f"틱 수 불일치: {game_state.tick} != {replay.ticks}"
+    if game_state.score != replay.score:
+        return f"점수 불일치: {game_state.score} != {replay.score}"
+    if game_state.state_hash() != replay.state_hash:
+        return "상태 해시 불일치"
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """리플레이 도구의 CLI 진입점입니다."""
+    parser = argparse.ArgumentParser(description="Hebi 리플레이 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    verify_parser = sub.add_parser("verify", help="리플레이를 재생하여 결과를 검증합니다.")
+    verify_parser.add_argument("paths", nargs="+")
+    info_parser = sub.add_parser("info", help="리플레이 정보를 출력합니다.")
+    info_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        replay = load(args.path)
+        print(
+            f"seed={replay.seed} config={replay.config} inputs={len(replay.inputs)} "
+            f"ticks={replay.ticks} score={replay.score} outcome={replay.outcome}"
+        )
+        return
+
+    failures = 0
+    start = time.perf_counter()
+    for path in args.paths:
+        error = verify(load(path))
+        if error:
+            failures += 1
+            print(f"FAIL {path}: {error}")
+    elapsed = time.perf_counter() - start
+    print(f"{len(args.paths) - failures}/{len(args.paths)} ok ({len(args.paths) / elapsed:.0f} replays/sec)")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Hebi를 네트워크 서비스로 실행하는 asyncio 서버입니다. 서버가 모든 GameState를 가지고(authoritative),
+클라이언트는 방향 입력만 보내고 서버가 보내는 상태 변화를 그립니다. 메시지 형식은 protocol.py를 참고하세요.
+
+- 방(Room)마다 GameState 하나를 가지며, 한 방에 여러 클라이언트가 들어갈 수 있습니다. (모두 입력 가능)
+- 모든 방은 하나의 틱 스케줄러 태스크가 고정 간격으로 진행합니다. 방마다 태스크/타이머를 만들지 않으므로
+  방이 수천 개여도 틱당 비용은 "진행 중인 방 수 x (update + 인코딩)"입니다.
+- 방의 변경 피드를 틱마다 한 번만 DELTA로 인코딩하고, 같은 바이트열을 방의 모든 클라이언트에게 보냅니다.
+- KEYFRAME은 방에 들어올 때, 리셋/게임 종료처럼 상태가 통째로 바뀔 때, 그리고 keyframe_interval 틱마다 보냅니다.
+  (모든 방의 KEYFRAME이 같은 틱에 몰리지 않도록 방 번호만큼 시점을 어긋나게 합니다)
+- 송신 버퍼가 가득 찬(느린) 클라이언트에게는 DELTA를 버리고, 버퍼가 비면 KEYFRAME으로 다시 맞춥니다.
+- 방은 첫 방향 입력을 받은 뒤부터 진행됩니다. (로컬 게임의 "준비" 상태와 같습니다)
+
+사용 예:
+    python server.py --port 7777
+    python main.py --connect 127.0.0.1:7777
+    python loadtest.py --rooms 2000 --duration 30
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, Optional, Set
+
+import config
+import protocol
+from game_logic.game_state import GameState, STATE_CHANGED
+from game_logic.rng import derive_seed
+from game_logic.snake import DIRECTION_VECTORS
+
+# 클라이언트가 요청할 수 있는 방 크기의 범위
+MIN_GRID_SIZE = 5
+MAX_GRID_SIZE = 500
+MAX_APPLES = 100
+
+
+class Client:
+    """접속한 클라이언트 하나의 연결 상태입니다."""
+    __slots__ = ("writer", "room", "needs_keyframe")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.room: Optional["Room"] = None
+        self.needs_keyframe = False  # 느려서 DELTA를 버렸다면 다음에 KEYFRAME을 보내야 합니다.
+
+
+class Room:
+    """GameState 하나와 그 게임을 보는 클라이언트들입니다."""
+    __slots__ = ("id", "seed", "games", "game_state", "clients", "started")
+
+    def __init__(self, room_id: int, rows: int, cols: int, max_apples: int, seed: int):
+        self.id = room_id
+        self.seed = seed
+        self.games = 0  # 이 방에서 시작한 게임 수 (판마다 다른 시드를 파생합니다)
+        self.game_state = GameState(rows=rows, cols=cols, max_apples=max_apples, seed=seed)
+        self.game_state.enable_changes()
+        self.clients: Set[Client] = set()
+        self.started = False
+
+    def restart(self):
+        """새 판을 시작합니다. 첫 입력을 받을 때까지 진행하지 않습니다."""
+        self.games += 1
+        self.game_state.reset(derive_seed(self.seed, self.games))
+        self.started = False
+
+
+class GameServer:
+    """
+    방들을 관리하고 틱마다 진행시키는 서버입니다.
+    start()로 접속을 받고, run()을 태스크로 실행하면 틱 스케줄러가 돌아갑니다.
+    """
+    def __init__(
+        self,
+        tick_ms: int = config.SPEED_OPTIONS["보통"],
+        keyframe_interval: int = config.NET_KEYFRAME_INTERVAL,
+        max_client_buffer: int = config.NET_MAX_CLIENT_BUFFER,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param tick_ms: 모든 방의 틱 간격 (ms)
+        :param keyframe_interval: 진행 중인 방에 KEYFRAME을 보내는 간격 (틱)
+        :param max_client_buffer: 클라이언트 송신 버퍼가 이보다 크면 DELTA를 버립니다. (바이트)
+        :param seed: 방 시드를 만들 마스터 시드 (None이면 무작위)
+        """
+        self.tick_dt = tick_ms / 1000.0
+        self.keyframe_interval = keyframe_interval
+        self.max_client_buffer = max_client_buffer
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rooms: Dict[int, Room] = {}
+        self._next_room_id = 1
+        self._server = None
+        # 통계
+        self.ticks = 0
+        self.late_ticks = 0  # 예정 시각보다 늦게 시작된 틱 수
+        self.step_seconds = 0.0
+        self.max_step_seconds = 0.0
+        self.bytes_sent = 0
+        self.dropped_deltas = 0
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        """접속을 받기 시작합니다. port가 0이면 빈 포트를 사용합니다. (server.sockets[0].getsockname()으로 확인)"""
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    async def run(self):
+        """
+        고정 간격으로 step()을 호출하는 틱 스케줄러입니다.
+        step()이 간격보다 오래 걸려 밀리면 따라잡지 않고 다음 틱부터 새로 맞춥니다.
+        """
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while True:
+            next_time += self.tick_dt
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                self.late_ticks += 1
+                if -delay > self.tick_dt * config.MAX_CATCH_UP_TICKS:
+                    next_time = loop.time()
+                await asyncio.sleep(0)  # 밀렸더라도 입력을 받을 기회를 줍니다.
+            start = time.perf_counter()
+            self.step()
+            elapsed = time.perf_counter() - start
+            self.ticks += 1
+            self.step_seconds += elapsed
+            self.max_step_seconds = max(self.max_step_seconds, elapsed)
+
+    def step(self):
+        """진행 중인 모든 방을 한 틱 진행하고, 변화를 방의 클라이언트들에게 보냅니다."""
+        interval = self.keyframe_interval
+        for room in self.rooms.values():
+            game_state = room.game_state
+            if not room.started or game_state.game_over or game_state.game_win:
+                # 진행하지 않는 방(끝난 판 포함)에서도 KEYFRAME을 놓친 클라이언트는 버퍼가 비는 대로 따라잡게 합니다.
+                self._resync(room)
+                continue
+            game_state.update()
+            changes = game_state.changes
+            keyframe = (game_state.tick + room.id) % interval == 0 or any(
+                kind == STATE_CHANGED for kind, _ in changes
+            )
+            if keyframe:
+                data = protocol.encode_keyframe(room.id, game_state)
+            else:
+                data = protocol.encode_delta(game_state.tick, changes, game_state.cols)
+            game_state.clear_changes()
+            self._broadcast(room, data, keyframe)
+
+    def _broadcast(self, room: Room, data: bytes, keyframe: bool):
+        resync = None  # 뒤처진 클라이언트에게 보낼 KEYFRAME (필요할 때 한 번만 만듭니다)
+        for client in room.clients:
+            transport = client.writer.transport
+            if transport.get_write_buffer_size() > self.max_client_buffer:
+                client.needs_keyframe = True
+                self.dropped_deltas += 1
+                continue
+            if client.needs_keyframe and not keyframe:
+                if resync is None:
+                    resync = protocol.encode_keyframe(room.id, room.game_state)
+                client.writer.write(resync)
+                self.bytes_sent += len(resync)
+            else:
+                client.writer.write(data)
+                self.bytes_sent += len(data)
+            client.needs_keyframe = False
+
+    def _resync(self, room: Room):
+        """KEYFRAME을 놓친 클라이언트 중 송신 버퍼가 빠진 클라이언트에게 방의 현재 상태를 보냅니다."""
+        data = None
+        for client in room.clients:
+            if not client.needs_keyframe:
+                continue
+            if client.writer.transport.get_write_buffer_size() > self.max_client_buffer:
+                continue
+            if data is None:
+                data = protocol.encode_keyframe(room.id, room.game_state)
+            client.writer.write(data)
+            client.needs_keyframe = False
+            self.bytes_sent += len(data)
+
+    def _send_keyframe(self, room: Room):
+        """방의 현재 상태를 모든 클라이언트에게 바로 보냅니다."""
+        room.game_state.clear_changes()
+        data = protocol.encode_keyframe(room.id, room.game_state)
+        for client in room.clients:
+            client.writer.write(data)
+            client.needs_keyframe = False
+            self.bytes_sent += len(data)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = Client(writer)
+        try:
+            while True:
+                payload = await protocol.read_frame(reader)
+                self._handle_message(client, payload)
+        except (asyncio.IncompleteReadError, ConnectionError, protocol.ProtocolError, IndexError):
+            # 연결이 끊겼거나 형식이 잘못된 메시지(잘린 varint 포함)를 보낸 클라이언트는 내보냅니다.
+            pass
+        finally:
+            self._leave(client)
+            writer.close()
+
+    def _handle_message(self, client: Client, payload: bytes):
+        kind = payload[0]
+        room = client.room
+        if kind == protocol.MSG_JOIN:
+            if room is not None:
+                raise protocol.ProtocolError("이미 방에 들어와 있습니다.")
+            self._join(client, *protocol.decode_join(payload))
+        elif room is None:
+            raise protocol.ProtocolError("방에 들어오기 전에는 입력을 보낼 수 없습니다.")
+        elif kind == protocol.MSG_INPUT:
+            if len(payload) != 2 or payload[1] >= len(DIRECTION_VECTORS):
+                raise protocol.ProtocolError("잘못된 방향 입력입니다.")
+            room.game_state.handle_input(DIRECTION_VECTORS[payload[1]])
+            room.started = True
+        elif kind == protocol.MSG_RESTART:
+            room.restart()
+            self._send_keyframe(room)
+        else:
+            raise protocol.ProtocolError(f"알 수 없는 메시지 종류: {kind}")
+
+    def _join(self, client: Client, room_id: int, rows: int, cols: int, max_apples: int):
+        """room_id의 방에 들어가거나, room_id가 0이면 새 방을 만듭니다."""
+        if room_id == 0:
+            if not (MIN_GRID_SIZE <= rows <= MAX_GRID_SIZE and MIN_GRID_SIZE <= cols <= MAX_GRID_SIZE):
+                raise protocol.ProtocolError(f"지원하지 않는 맵 크기: {cols}x{rows}")
+            room_id = self._next_room_id
+            self._next_room_id += 1
+            seed = derive_seed(self.seed, room_id)
+            self.rooms[room_id] = Room(room_id, rows, cols, max(1, min(max_apples, MAX_APPLES)), seed)
+        room = self.rooms.get(room_id)
+        if room is None:
+            raise protocol.ProtocolError(f"없는 방입니다: {room_id}")
+        room.clients.add(client)
+        client.room = room
+        data = protocol.encode_keyframe(room.id, room.game_state)
+        client.writer.write(data)
+        self.bytes_sent += len(data)
+
+    def _leave(self, client: Client):
+        """클라이언트를 방에서 내보냅니다. 아무도 없는 방은 닫습니다."""
+        room = client.room
+        if room is None:
+            return
+        room.clients.discard(client)
+        client.room = None
+        if not room.clients:
+            del self.rooms[room.id]
+
+    def stats(self) -> Dict:
+        """지금까지의 서버 통계를 반환합니다."""
+        return {
+            "rooms": len(self.rooms),
+            "clients": sum(len(room.clients) for room in self.rooms.values()),
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "mean_step_ms": self.step_seconds / self.ticks * 1000 if self.ticks else 0.0,
+            "max_step_ms": self.max_step_seconds * 1000,
+            "bytes_sent": self.bytes_sent,
+            "dropped_deltas": self.dropped_deltas,
+        }
+
+
+async def _print_stats(server: GameServer, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        stats = server.stats()
+        print(
+            f"rooms={stats['rooms']} clients={stats['clients']} ticks={stats['ticks']} "
+            f"late={stats['late_ticks']} step={stats['mean_step_ms']:.2f}ms (max {stats['max_step_ms']:.2f}ms) "
+            f"sent={stats['bytes_sent'] / 1024:.0f}KiB dropped={stats['dropped_deltas']}"
+        )
+
+
+async def serve(host: str, port: int, tick_ms: int, stats_interval: float = 0.0, seed: Optional[int] = None):
+    """서버를 시작하고 종료될 때까지 실행합니다."""
+    server = GameServer(tick_ms=tick_ms, seed=seed)
+    listener = await server.start(host, port)
+    print(f"Hebi 서버 시작: {', '.join(str(sock.getsockname()) for sock in listener.sockets)} (틱 {tick_ms}ms)")
+    tasks = [asyncio.create_task(server.run())]
+    if stats_interval > 0:
+        tasks.append(asyncio.create_task(_print_stats(server, stats_interval)))
+    async with listener:
+        await asyncio.gather(listener.serve_forever(), *tasks)
+
+
+def main(argv=None) -> None:
+    """서버 CLI 진입점입니다."""
+    parser = argparse.ArgumentParser(description="Hebi 게임 서버")
+    parser.add_argument("--host", default=config.NET_HOST)
+    parser.add_argument("--port", type=int, default=config.NET_PORT)
+    parser.add_argument("--tick-ms", type=int, default=config.SPEED_OPTIONS["보통"], help="틱 간격 (ms)")
+    parser.add_argument("--stats", type=float, default=0.0, help="N초마다 서버 통계를 출력합니다.")
+    parser.add_argument("--seed", type=int, default=config.SEED, help="방 시드를 만들 마스터 시드")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.tick_ms, args.stats, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+한 번 그린 Surface를 키로 저장해 두고 재사용하는 LRU 캐시입니다.
+
+오버레이나 메뉴처럼 내용이 거의 바뀌지 않는 화면을 매 프레임 새로 만들지 않기 위해 사용합니다.
+키에는 그림의 내용을 결정하는 모든 입력(종류, 화면 크기, 텍스트/점수, 호버 상태 등)을 넣어야 합니다.
+
+render_text()는 (폰트, 텍스트, 색상, 안티앨리어싱) 조합으로 렌더링된 글자 Surface를 공유 캐시에 보관하여
+버튼, 점수, 메뉴 제목처럼 매 프레임 같은 글자를 그릴 때 폰트 래스터화를 반복하지 않도록 합니다.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    최대 max_entries개(그리고 max_bytes 바이트)의 Surface를 보관하며, 한도를 넘으면
+    가장 오래 사용하지 않은 항목부터 버립니다.
+    hits/misses 카운터로 캐시가 실제로 재사용되고 있는지 확인할 수 있습니다.
+    """
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        """
+        :param max_entries: 보관할 최대 Surface 개수
+        :param max_bytes: 보관할 Surface 픽셀 데이터의 최대 크기 (None이면 개수만 제한)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        key에 해당하는 Surface를 반환합니다. 없으면 build()로 만들어 저장합니다.
+        :param build: 캐시에 없을 때 Surface를 새로 만드는 함수
+        """
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self._entries[key] = surface
+        self.bytes += _surface_bytes(surface)
+        # 방금 넣은 항목은 남겨 두고, 한도를 넘는 동안 오래된 항목부터 버립니다.
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= _surface_bytes(evicted)
+        return surface
+
+    def clear(self):
+        """저장된 모든 Surface를 버립니다. (카운터는 유지합니다)"""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _surface_bytes(surface) -> int:
+    """Surface 픽셀 데이터가 차지하는 바이트 수입니다. (Surface가 아니면 0)"""
+    if isinstance(surface, pygame.Surface):
+        return surface.get_pitch() * surface.get_height()
+    return 0
+
+
+# --- 공유 텍스트 캐시 ---
+TEXT_CACHE_SIZE = 256
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+text_cache = SurfaceCache(TEXT_CACHE_SIZE, TEXT_CACHE_MAX_BYTES)
+
+
+def render_text(
+    font: pygame.font.Font, text: str, color: Tuple[int, int, int], antialias: bool = True
+) -> pygame.Surface:
+    """
+    font.render(text, antialias, color)와 같지만, 같은 조합은 캐시된 Surface를 반환합니다.
+    반환된 Surface는 여러 곳에서 공유되므로 수정하지 말고 blit에만 사용해야 합니다.
+    """
+    return text_cache.get(
+        (font, text, tuple(color), antialias), lambda: font.render(text, antialias, color)
+    )
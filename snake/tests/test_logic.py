@@ -0,0 +1,769 @@
+import os
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import config
+from game_logic.game_state import GameState
+from game_logic.grid import OccupancyGrid, EMPTY, BODY, APPLE
+from game_logic.snake import Snake
+
+
+def _grid_matches_state(game_state: GameState) -> bool:
+    """점유 그리드가 뱀 몸통/사과 목록과 정확히 일치하는지 확인합니다."""
+    expected = bytearray(game_state.rows * game_state.cols)
+    for r, c in game_state.snake.body:
+        expected[r * game_state.cols + c] = BODY
+    for r, c in game_state.apples:
+        expected[r * game_state.cols + c] = APPLE
+    return expected == game_state.grid.cells
+
+
+def test_grid_tracks_snake_and_apples():
+    game_state = GameState(rows=10, cols=10, max_apples=3)
+    assert _grid_matches_state(game_state)
+    directions = [(0, 1), (1, 0), (0, -1), (1, 0)] * 10
+    for direction in directions:
+        game_state.handle_input(direction)
+        game_state.update()
+        assert _grid_matches_state(game_state)
+        if game_state.is_over():
+            break
+
+
+def test_moving_into_vacated_tail_is_not_collision():
+    grid = OccupancyGrid(5, 5)
+    # 2x2 고리 모양의 뱀: 머리 (1,1), 꼬리 (1,2)
+    snake = Snake(deque([(1, 1), (2, 1), (2, 2), (1, 2)]), (-1, 0), grid)
+    assert not snake.is_self_collision((1, 2), is_growing=False)
+    assert snake.is_self_collision((1, 2), is_growing=True)
+    assert snake.is_self_collision((2, 1), is_growing=False)
+    snake.set_direction((0, 1))
+    snake.move(grow=False)
+    assert snake.head() == (1, 2)
+    assert grid.get((1, 2)) == BODY
+    assert sum(1 for cell in grid.cells if cell == BODY) == 4
+
+
+def test_wall_collision_ends_game():
+    game_state = GameState(rows=5, cols=5, max_apples=0)
+    for _ in range(5):
+        game_state.update()
+    assert game_state.is_over()
+    assert game_state.grid.cells.count(EMPTY) == 25 - len(game_state.snake.body)
+
+
+def test_free_cell_index_matches_empty_cells():
+    game_state = GameState(rows=6, cols=6, max_apples=4)
+    grid = game_state.grid
+    for direction in [(0, 1), (1, 0), (0, -1), (0, -1), (-1, 0)] * 4:
+        game_state.handle_input(direction)
+        game_state.update()
+        empty_cells = {i for i, cell in enumerate(grid.cells) if cell == EMPTY}
+        assert sorted(grid.free) == sorted(empty_cells)
+        for i, idx in enumerate(grid.free):
+            assert grid.free_pos[idx] == i
+
+
+def test_seeded_spawn_is_deterministic():
+    first = GameState(rows=40, cols=30, max_apples=10, seed=1234).apples
+    second = GameState(rows=40, cols=30, max_apples=10, seed=1234).apples
+    assert first == second
+
+
+def test_spawn_fills_last_free_cell():
+    game_state = GameState(rows=2, cols=2, max_apples=0)
+    # 뱀 3칸 + 빈 칸 1개인 상태에서 사과는 반드시 마지막 빈 칸에 생성되어야 합니다.
+    game_state.grid = OccupancyGrid(2, 2)
+    game_state.snake = Snake(deque([(0, 0), (1, 0), (1, 1)]), (-1, 0), game_state.grid)
+    game_state._spawn_apple()
+    assert game_state.apples == [(0, 1)]
+    game_state._spawn_apple()
+    assert game_state.apples == [(0, 1)]
+
+
+def test_headless_run_game_follows_input_script():
+    import headless
+
+    # 오른쪽으로 2칸, 아래로 2칸 이동한 뒤 왼쪽 벽까지 직진합니다.
+    script = [(2, headless.DIRECTIONS["D"]), (4, headless.DIRECTIONS["L"])]
+    result = headless.run_game(rows=10, cols=10, max_apples=0, inputs=script, seed=1)
+    assert result["outcome"] == "game_over"
+    assert result["ticks"] == 4 + 7 + 1
+    assert result["score"] == 0
+
+    result = headless.run_game(rows=10, cols=10, max_apples=0, max_ticks=2)
+    assert result["outcome"] == "timeout"
+    assert result["ticks"] == 2
+
+
+def test_batch_matches_scalar_game_state():
+    import numpy as np
+    from game_logic.batch import BatchGameState, DIRECTION_VECTORS, NO_INPUT
+    from game_logic.rng import derive_seed
+
+    num_games, rows, cols, max_apples, seed = 8, 6, 7, 3, 99
+    batch = BatchGameState(num_games, rows, cols, max_apples, seed=seed)
+    action_rng = np.random.default_rng(0)
+    actions = action_rng.integers(NO_INPUT, 4, size=(400, num_games))
+
+    # 각 게임을 스칼라 GameState로 따로 재현하여 첫 번째 종료까지 매 틱 비교합니다.
+    scalars = [
+        GameState(rows=rows, cols=cols, max_apples=max_apples, seed=derive_seed(seed, g))
+        for g in range(num_games)
+    ]
+    for g in range(num_games):
+        assert bytes(batch.grid[g]) == bytes(scalars[g].grid.cells)
+
+    finished = [False] * num_games
+    for tick_actions in actions:
+        rewards, dones = batch.step(tick_actions)
+        for g in range(num_games):
+            if finished[g]:
+                continue
+            scalar = scalars[g]
+            action = int(tick_actions[g])
+            scalar.handle_input(DIRECTION_VECTORS[action] if action != NO_INPUT else None)
+            scalar.update()
+            if dones[g]:
+                finished[g] = True
+                assert scalar.is_over() or scalar.is_win()
+                assert batch.final_scores[g] == scalar.score
+                assert rewards[g] == -1.0 or scalar.is_win()
+            else:
+                assert not scalar.is_over()
+                assert bytes(batch.grid[g]) == bytes(scalar.grid.cells)
+                assert batch.snake_body(g) == list(scalar.snake.body)
+                assert batch.scores[g] == scalar.score
+    assert all(finished)
+
+
+def test_env_reuses_observation_buffers():
+    import numpy as np
+    from env import SnakeEnv, HEAD_CHANNEL, BODY_CHANNEL, APPLE_CHANNEL
+    from game_logic.batch import DIRECTION_VECTORS, RIGHT, DOWN
+
+    env = SnakeEnv(rows=8, cols=8, max_apples=2, seed=5)
+    grid, features = env.reset()
+    for action in [RIGHT, DOWN, -1, -1]:
+        (step_grid, step_features), reward, done, info = env.step(action)
+        assert step_grid is grid and step_features is features
+        state = env.game_state
+        assert grid[HEAD_CHANNEL].sum() == 1
+        assert grid[HEAD_CHANNEL][state.snake.head()] == 1
+        assert grid[BODY_CHANNEL].sum() == len(state.snake.body)
+        assert sorted(zip(*np.nonzero(grid[APPLE_CHANNEL]))) == sorted(state.apples)
+        assert features[DIRECTION_VECTORS.index(state.snake.direction)] == 1.0
+
+
+def test_replay_roundtrip_and_verification():
+    import random
+    import replay
+    from game_logic.snake import DIRECTION_VECTORS
+
+    game_config = {"GRID_ROWS": 12, "GRID_COLS": 16, "MAX_APPLES": 5}
+    game_state = GameState(rows=12, cols=16, max_apples=5, seed=42)
+    recorder = replay.ReplayRecorder(42, game_config)
+    input_rng = random.Random(7)
+    while not game_state.is_over() and game_state.tick < 500:
+        if input_rng.random() < 0.3:
+            direction = input_rng.choice(DIRECTION_VECTORS)
+            game_state.handle_input(direction)
+            recorder.record(game_state.tick, direction)
+        game_state.update()
+
+    recorded = recorder.finish(game_state)
+    data = replay.encode(recorded)
+    decoded = replay.decode(data)
+    assert decoded.inputs == recorded.inputs
+    assert decoded.config == game_config
+    assert replay.verify(decoded) is None
+
+    # 입력 하나만 바뀌어도 검증에 실패해야 합니다.
+    tick, direction = decoded.inputs[0]
+    decoded.inputs[0] = (tick, DIRECTION_VECTORS[(DIRECTION_VECTORS.index(direction) + 2) % 4])
+    decoded.inputs[1:] = []
+    assert replay.verify(decoded) is not None
+
+
+def test_spawn_rng_streams_and_batch_block_refill():
+    from game_logic.batch import BatchGameState
+    from game_logic.rng import BLOCK_SIZE, SpawnRng, derive_seed
+
+    # 같은 시드는 같은 스트림, 다른 하위 스트림은 서로 다른 스트림이어야 합니다.
+    a, b, c = SpawnRng(derive_seed(1, 0)), SpawnRng(derive_seed(1, 0)), SpawnRng(derive_seed(1, 1))
+    draws_a = [a.index(1000) for _ in range(BLOCK_SIZE * 2)]
+    assert draws_a == [b.index(1000) for _ in range(BLOCK_SIZE * 2)]
+    assert draws_a != [c.index(1000) for _ in range(BLOCK_SIZE * 2)]
+    assert all(0 <= x < 1000 for x in draws_a)
+
+    # 리셋 시 BLOCK_SIZE보다 많은 사과를 생성하여 배치의 블록 재충전 경로도 스칼라와 비교합니다.
+    rows, cols, max_apples = 20, 20, BLOCK_SIZE + 50
+    batch = BatchGameState(2, rows, cols, max_apples, seed=3)
+    for g in range(2):
+        scalar = GameState(rows=rows, cols=cols, max_apples=max_apples, seed=derive_seed(3, g))
+        assert bytes(batch.grid[g]) == bytes(scalar.grid.cells)
+
+
+def test_snapshot_restore_and_clone_are_independent():
+    game_state = GameState(rows=10, cols=12, max_apples=4, seed=8)
+    moves = [(0, 1), (1, 0), (1, 0), (0, -1), (0, -1), (-1, 0)] * 2
+
+    snapshot = game_state.snapshot()
+    clone = game_state.clone()
+    start_hash = game_state.state_hash()
+
+    for direction in moves:
+        game_state.handle_input(direction)
+        game_state.update()
+    end_hash = game_state.state_hash()
+    assert clone.state_hash() == start_hash  # 원본 진행이 복사본에 영향을 주지 않습니다.
+
+    game_state.restore(snapshot)
+    assert game_state.state_hash() == start_hash
+    assert _grid_matches_state(game_state)
+
+    # 복원된 원본과 복사본 모두 같은 입력으로 같은 결과(사과 생성 포함)에 도달해야 합니다.
+    for target in (game_state, clone):
+        for direction in moves:
+            target.handle_input(direction)
+            target.update()
+        assert target.state_hash() == end_hash
+        assert target.apples == game_state.apples
+
+
+def test_autopilot_eats_apples_and_survives():
+    import headless
+    from autopilot import Autopilot
+
+    autopilot = Autopilot(10, 12)
+    result = headless.run_game(10, 12, 3, policy=autopilot, seed=4, max_ticks=3000)
+    assert result["outcome"] == "game_win"
+    assert result["score"] == 10 * 12 - 3
+    # 목표는 사과를 먹었을 때만 다시 고릅니다. (첫 목표 + 먹은 사과 수)
+    assert autopilot.replans <= result["score"] + 1
+
+
+def test_autopilot_wins_small_board_and_bfs_fallback_terminates():
+    import headless
+    from autopilot import Autopilot, max_game_ticks
+
+    for seed in range(5):
+        autopilot = Autopilot(6, 6)
+        result = headless.run_game(6, 6, 3, policy=autopilot, seed=seed, max_ticks=300)
+        assert result["outcome"] == "game_win"
+        assert autopilot.replans <= result["score"] + 1
+
+    # 홀수 × 홀수 보드는 해밀턴 순환이 없으므로 BFS로 계획합니다.
+    # 경로가 막히거나 사과를 먹었을 때만 다시 계획하며, 정체하면 도박 경로로 끊어 내므로 항상 끝납니다.
+    for seed in range(3):
+        autopilot = Autopilot(7, 7)
+        result = headless.run_game(7, 7, 3, policy=autopilot, seed=seed, max_ticks=max_game_ticks(7, 7))
+        assert result["outcome"] in ("game_over", "game_win")
+        assert result["score"] >= 40
+        assert autopilot.replans * 2 < result["ticks"]
+
+
+def test_benchmark_cycle_and_baseline_compare():
+    import benchmarks
+
+    for rows, cols in ((15, 20), (20, 30), (4, 3)):
+        cycle = benchmarks.hamiltonian_cycle(rows, cols)
+        assert len(set(cycle)) == rows * cols
+        for (r1, c1), (r2, c2) in zip(cycle, cycle[1:] + cycle[:1]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+    baseline = {"results": {
+        "a": {"value": 100.0, "unit": "ticks/s", "better": "higher"},
+        "b": {"value": 1.0, "unit": "us", "better": "lower"},
+    }}
+    current = {"results": {
+        "a": {"value": 70.0, "unit": "ticks/s", "better": "higher"},
+        "b": {"value": 1.1, "unit": "us", "better": "lower"},
+    }}
+    regressions = benchmarks.compare(current, baseline, tolerance=0.2)
+    assert len(regressions) == 1 and regressions[0].startswith("a:")
+
+
+def test_incremental_render_matches_full_redraw():
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    import rendering
+    from autopilot import Autopilot
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rows, cols = 8, 10
+    incremental = pygame.Surface((cols * 20, rows * 20))
+    full = incremental.copy()
+    rendering.init_renderer(incremental, config.RuntimeConfig(150, 3, cols, rows))
+
+    game_state = GameState(rows=rows, cols=cols, max_apples=3, seed=11)
+    game_state.enable_changes()
+    autopilot = Autopilot(rows, cols)
+    assert rendering.draw_frame_incremental(incremental, game_state.changes, game_state.grid) is None
+    rendering.draw_frame(incremental, game_state.get_render_data())
+    game_state.clear_changes()
+    for step in range(150):
+        # 프레임 사이에 여러 틱이 지나가는 경우도 확인합니다.
+        for _ in range(1 + step % 3):
+            game_state.handle_input(autopilot(game_state))
+            game_state.update()
+        if game_state.is_over() or game_state.is_win():
+            break
+        dirty = rendering.draw_frame_incremental(incremental, game_state.changes, game_state.grid)
+        game_state.clear_changes()
+        assert dirty is not None and len(dirty) < rows * cols
+        rendering.draw_frame(full, game_state.get_render_data())
+        assert pygame.image.tobytes(incremental, "RGB") == pygame.image.tobytes(full, "RGB")
+    assert game_state.score > 0
+
+
+def test_surface_cache_lru_and_counters():
+    from surface_cache import SurfaceCache
+
+    cache = SurfaceCache(max_entries=2)
+    builds = []
+
+    def builder(name):
+        return lambda: builds.append(name) or name
+
+    assert cache.get("a", builder("a")) == "a"
+    assert cache.get("b", builder("b")) == "b"
+    assert cache.get("a", builder("a")) == "a"  # 적중: 다시 만들지 않습니다.
+    cache.get("c", builder("c"))  # 가장 오래 사용하지 않은 "b"를 버립니다.
+    cache.get("b", builder("b"))
+    assert builds == ["a", "b", "c", "b"]
+    assert cache.stats() == {"entries": 2, "bytes": 0, "hits": 1, "misses": 4}
+
+    # 메모리 한도: 10x10 32비트 Surface(400바이트) 두 개까지만 보관합니다.
+    import pygame
+    sized = SurfaceCache(max_entries=10, max_bytes=800)
+    for key in range(3):
+        sized.get(key, lambda: pygame.Surface((10, 10), 0, 32))
+    assert len(sized) == 2 and sized.bytes == 800
+
+
+def test_interpolated_frame_ends_on_current_state():
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    import rendering
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    interpolated = pygame.Surface((200, 160))
+    full = interpolated.copy()
+    rendering.init_renderer(interpolated, config.RuntimeConfig(150, 0, 10, 8))
+
+    game_state = GameState(rows=8, cols=10, max_apples=0, seed=2)
+    rendering.draw_frame(interpolated, game_state.get_render_data())
+    game_state.update()
+    render_data = game_state.get_render_data()
+
+    # alpha=1이면 현재 틱의 모습과 같아야 합니다.
+    rendering.draw_frame_interpolated(interpolated, render_data, 1.0)
+    rendering.draw_frame(full, render_data)
+    assert pygame.image.tobytes(interpolated, "RGB") == pygame.image.tobytes(full, "RGB")
+
+    # alpha=0이면 머리가 아직 이전 칸에 있습니다.
+    rendering.draw_frame_interpolated(interpolated, render_data, 0.0)
+    assert pygame.image.tobytes(interpolated, "RGB") != pygame.image.tobytes(full, "RGB")
+
+
+def test_runtime_config_is_frozen_and_settings_notify():
+    runtime = config.RuntimeConfig(game_tick_ms=150, max_apples=5, grid_cols=30, grid_rows=20)
+    assert runtime.tick_dt == 0.15
+    assert runtime.cell_origin[(2, 3)] == (3 * config.TILE_SIZE, 2 * config.TILE_SIZE)
+    for mutate in (lambda: setattr(runtime, "grid_cols", 10), lambda: setattr(runtime, "extra", 1)):
+        try:
+            mutate()
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("RuntimeConfig가 변경되었습니다.")
+    game_state = GameState.from_config(runtime, seed=1)
+    assert (game_state.rows, game_state.cols, game_state.max_apples) == (20, 30, 5)
+
+    changes = []
+    listener = lambda key, value: changes.append((key, value))  # noqa: E731
+    config.add_settings_listener(listener)
+    original = config.current_settings["speed"]
+    try:
+        config.set_setting("speed", original)  # 같은 값이면 알리지 않습니다.
+        config.set_setting("speed", "빠름" if original != "빠름" else "느림")
+    finally:
+        config.remove_settings_listener(listener)
+        config.current_settings["speed"] = original
+    assert len(changes) == 1
+
+
+def test_change_feed_reports_tick_deltas():
+    from game_logic import game_state as gs
+
+    game_state = GameState(rows=5, cols=6, max_apples=0, seed=1)
+    game_state.enable_changes()
+    game_state.reset()
+    assert game_state.changes == [(gs.STATE_CHANGED, "reset")]
+    game_state.clear_changes()
+
+    # 머리 바로 앞에 사과를 놓고 한 틱 진행합니다.
+    game_state.apples.append((2, 4))
+    game_state.grid.set((2, 4), APPLE)
+    game_state.update()
+    kinds = [kind for kind, _ in game_state.changes]
+    assert kinds == [gs.HEAD_ADDED, gs.APPLE_EATEN, gs.SCORE_CHANGED, gs.APPLE_SPAWNED]
+    assert game_state.changes[0] == (gs.HEAD_ADDED, ((2, 4), (0, 1)))
+    game_state.clear_changes()
+
+    game_state.update()  # 사과 없이 이동하면 꼬리가 비워집니다.
+    assert game_state.changes[:2] == [(gs.TAIL_REMOVED, (2, 1)), (gs.HEAD_ADDED, ((2, 5), (0, 1)))]
+    game_state.clear_changes()
+    game_state.update()  # 벽 충돌
+    assert game_state.changes == [(gs.STATE_CHANGED, "game_over")]
+
+
+def test_atlas_matches_source_images():
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    import assets
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    base_path = assets.resource_dir()
+    # 미리 만든 아틀라스 파일과 원본에서 새로 만든 아틀라스가 같아야 합니다. (res/를 고친 뒤 다시 빌드했는지 확인)
+    built = assets.build_atlas(config.TILE_SIZE)
+    assert pygame.image.tobytes(pygame.image.load(assets.atlas_path(config.TILE_SIZE)), "RGBA") == (
+        pygame.image.tobytes(built, "RGBA")
+    )
+
+    textures = assets.load_textures(config.TILE_SIZE)
+    atlas = assets.load_atlas(config.TILE_SIZE)
+    for direction, filename in (((0, 1), "head_right"), ((-1, 0), "head_up"), ((0, -1), "head_left"), ((1, 0), "head_down")):
+        sprite = textures[direction]
+        assert sprite.get_parent() is atlas  # 픽셀을 복사하지 않는 subsurface 뷰
+        original = pygame.transform.scale(
+            pygame.image.load(os.path.join(base_path, filename + ".png")), sprite.get_size()
+        )
+        assert pygame.image.tobytes(sprite, "RGBA") == pygame.image.tobytes(original, "RGBA")
+
+
+def test_font_resolution_uses_disk_cache(tmp_path, monkeypatch):
+    import pygame
+    import fonts
+
+    font_file = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+    cache_file = str(tmp_path / "font_path.json")
+    lookups = []
+
+    def fake_match_font(names):
+        lookups.append(names)
+        return font_file
+
+    monkeypatch.setattr(pygame.font, "match_font", fake_match_font)
+    monkeypatch.setattr(fonts, "_bundled_font", lambda: None)
+    try:
+        # 1. 직접 지정한 경로가 가장 우선입니다.
+        monkeypatch.setattr(config, "FONT_PATH", font_file)
+        fonts.clear_cache()
+        assert fonts.resolve_font_path(cache_file) == font_file
+        assert lookups == []
+
+        # 2. 캐시가 없으면 시스템 폰트를 한 번 나열하고 결과를 저장합니다.
+        monkeypatch.setattr(config, "FONT_PATH", None)
+        fonts.clear_cache()
+        assert fonts.resolve_font_path(cache_file) == font_file
+        assert len(lookups) == 1 and os.path.exists(cache_file)
+
+        # 3. 다음 실행(메모리 캐시 없음)에서는 디스크 캐시를 사용해 나열을 건너뜁니다.
+        fonts.clear_cache()
+        assert fonts.resolve_font_path(cache_file) == font_file
+        assert len(lookups) == 1
+    finally:
+        fonts.clear_cache()
+
+
+def test_camera_viewport_incremental_matches_full_redraw():
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    import rendering
+    from autopilot import Autopilot
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rows, cols = 60, 90
+    runtime = config.RuntimeConfig(150, 20, cols, rows)
+    assert runtime.camera and len(runtime.cell_origin) == runtime.view_cols * runtime.view_rows
+    incremental = pygame.Surface((runtime.screen_width, runtime.screen_height))
+    full = incremental.copy()
+    rendering.init_renderer(incremental, runtime)
+
+    game_state = GameState(rows=rows, cols=cols, max_apples=20, seed=5)
+    game_state.enable_changes()
+    autopilot = Autopilot(rows, cols)
+
+    def draw_full(surface):
+        snake = game_state.snake
+        rendering.draw_frame_viewport(
+            surface, game_state.changes, game_state.grid, snake.body[0], snake.direction, game_state.score
+        )
+
+    draw_full(incremental)
+    game_state.clear_changes()
+    camera_moves = 0
+    for _ in range(300):
+        game_state.handle_input(autopilot(game_state))
+        game_state.update()
+        if game_state.is_over() or game_state.is_win():
+            break
+        if rendering.draw_frame_incremental(incremental, game_state.changes, game_state.grid) is None:
+            camera_moves += 1
+            draw_full(incremental)
+        game_state.clear_changes()
+        # 같은 카메라 위치에서 변경 피드 없이 처음부터 그린 화면과 같아야 합니다.
+        draw_full(full)
+        assert pygame.image.tobytes(incremental, "RGB") == pygame.image.tobytes(full, "RGB")
+        assert rendering._camera.contains(game_state.snake.body[0])
+
+    # 미니맵의 축소된 점유 버퍼가 전체를 다시 센 결과와 같아야 합니다.
+    counts = rendering._minimap.body_counts[:], rendering._minimap.apple_counts[:]
+    rendering._minimap.rebuild(game_state.grid)
+    assert counts == (rendering._minimap.body_counts, rendering._minimap.apple_counts)
+    assert sum(counts[0]) == len(game_state.snake.body)
+    assert camera_moves > 0
+
+
+def test_ring_buffer_body_uses_less_memory_than_tuples():
+    import tracemalloc
+
+    rows, cols = 100, 100
+    # 보드의 절반을 채우는 지그재그 몸통 (머리부터 꼬리 순서)
+    parts = [(r, c if r % 2 else cols - 1 - c) for r in range(rows // 2) for c in range(cols)]
+    parts.reverse()
+    grid = OccupancyGrid(rows, cols)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # 이전 표현: 마디마다 새 (row, col) 튜플을 담은 deque
+        old_body = deque((r, c) for r, c in parts)
+        tuple_bytes = tracemalloc.get_traced_memory()[0] - before
+        del old_body
+
+        before = tracemalloc.get_traced_memory()[0]
+        snake = Snake(parts, (-1, 0), grid)
+        ring_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert ring_bytes * 4 < tuple_bytes
+    # 튜플 뷰는 이전 표현과 같은 내용을 보여줍니다.
+    assert len(snake.body) == len(parts)
+    assert snake.body[0] == parts[0] and snake.body[-1] == parts[-1]
+    assert list(snake.body) == parts
+
+    # 링 버퍼(크기 6)의 끝을 여러 번 넘어 감겨도 몸통 순서와 점유 그리드가 deque 표현과 같아야 합니다.
+    cycle = [(0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0)]
+    grid = OccupancyGrid(2, 3)
+    expected = deque([(0, 2), (0, 1), (0, 0)])
+    snake = Snake(expected, (0, 1), grid)
+    for step in range(20):
+        head = cycle.index(expected[0])
+        nxt = cycle[(head + 1) % len(cycle)]
+        snake.set_direction((nxt[0] - expected[0][0], nxt[1] - expected[0][1]))
+        grow = step == 5
+        assert snake.get_next_head_pos() == nxt
+        assert not snake.is_self_collision(nxt, grow)
+        snake.move(grow)
+        expected.appendleft(nxt)
+        if not grow:
+            expected.pop()
+        assert list(snake.body) == list(expected) and snake.head() == nxt
+        assert grid.cells.count(BODY) == len(expected)
+
+
+def _place_arena_snakes(arena, bodies):
+    """아레나의 뱀들을 주어진 (몸통, 방향)으로 다시 놓습니다. (사과와 다른 뱀은 없는 상태에서 사용)"""
+    arena.grid = OccupancyGrid(arena.rows, arena.cols)
+    for snake, (body, direction) in zip(arena.snakes, bodies):
+        snake.grid = arena.grid
+        snake.set_body(body)
+        snake.direction = snake._next_direction = direction
+        for r, c in body:
+            arena.grid.set((r, c), BODY)
+
+
+def test_arena_resolves_head_on_and_tail_following():
+    from game_logic.arena import ArenaState
+
+    arena = ArenaState(rows=5, cols=5, max_apples=0, num_snakes=3, seed=1, respawn=False)
+    # A는 B가 비우는 꼬리로 들어가고, C는 B의 (비워지지 않는) 머리 칸으로 들어갑니다.
+    _place_arena_snakes(arena, [
+        ([(1, 0)], (0, 1)),
+        ([(1, 2), (1, 1)], (0, 1)),
+        ([(0, 2)], (1, 0)),
+    ])
+    arena.update()
+    assert list(arena.alive) == [1, 1, 0]
+    assert list(arena.snakes[0].body) == [(1, 1)]
+    assert list(arena.snakes[1].body) == [(1, 3), (1, 2)]
+    assert arena.grid.cells.count(BODY) == 3
+
+    # 같은 칸으로 들어가는 두 머리는 함께 죽고, 몸통은 보드에서 지워집니다.
+    arena = ArenaState(rows=5, cols=5, max_apples=0, num_snakes=2, seed=1, respawn=False)
+    _place_arena_snakes(arena, [([(2, 0)], (0, 1)), ([(2, 2), (2, 3)], (0, -1))])
+    arena.update()
+    assert list(arena.alive) == [0, 0]
+    assert arena.grid.cells.count(BODY) == 0
+    assert arena.grid.free_count() == 25
+
+
+def test_arena_pilot_keeps_shared_grid_consistent():
+    from autopilot import ArenaPilot
+    from game_logic.arena import ArenaState
+
+    arena = ArenaState(rows=40, cols=40, max_apples=30, num_snakes=30, seed=3, policy=ArenaPilot(3))
+    for _ in range(300):
+        arena.update()
+        lengths = sum(snake.length for snake, alive in zip(arena.snakes, arena.alive) if alive)
+        assert arena.grid.cells.count(BODY) == lengths
+        assert arena.grid.cells.count(APPLE) == len(arena.apples) == 30
+    assert sum(arena.scores) > 0 and arena.deaths > 0
+
+    # 작게 시작한 링 버퍼는 가득 차면 몸통 순서를 유지한 채 늘어납니다.
+    grid = OccupancyGrid(5, 5)
+    snake = Snake([(0, 1), (0, 0)], (0, 1), grid, capacity=2)
+    for _ in range(3):
+        snake.move(grow=True)
+    snake.set_direction((1, 0))
+    snake.move(grow=False)
+    assert list(snake.body) == [(1, 4), (0, 4), (0, 3), (0, 2), (0, 1)]
+    assert snake.capacity >= 5 and grid.cells.count(BODY) == 5
+
+
+def test_server_deltas_keep_client_mirror_in_sync():
+    import asyncio
+    from client import RemoteGame
+    from server import GameServer
+
+    async def scenario():
+        server = GameServer(tick_ms=2, keyframe_interval=7, seed=1)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        ticker = asyncio.create_task(server.run())
+        remote = await asyncio.to_thread(RemoteGame.connect, "127.0.0.1", port, 12, 12, 3)
+        assert remote.tick == 0 and remote.snake.length == 3  # 첫 KEYFRAME
+        room = server.rooms[remote.room]
+
+        turns = [(1, 0), (0, -1), (-1, 0), (0, 1)]
+        remote.handle_input((0, 1))
+        while remote.tick < 40 and not remote.is_over():
+            await asyncio.sleep(0.002)
+            if remote.poll() and remote.tick % 5 == 0:
+                remote.handle_input(turns[remote.tick // 5 % 4])
+        ticker.cancel()
+        await asyncio.sleep(0.05)
+        remote.poll()
+
+        game_state = room.game_state
+        assert remote.tick == game_state.tick and remote.desyncs == 0
+        assert remote.deltas > remote.keyframes > 1
+        assert remote.grid.cells == game_state.grid.cells
+        assert list(remote.snake.body) == list(game_state.snake.body)
+        assert remote.score == game_state.score
+
+        remote.restart()
+        await asyncio.sleep(0.05)
+        remote.poll()
+        assert remote.tick == 0 and not remote.is_over()
+        remote.close()
+        await asyncio.sleep(0.05)
+        assert not server.rooms  # 마지막 클라이언트가 나가면 방을 닫습니다.
+        listener.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_resyncs_slow_client_after_game_ends():
+    import protocol
+    from server import Client, GameServer, Room
+
+    class FakeTransport:
+        buffered = 0
+
+        def get_write_buffer_size(self):
+            return self.buffered
+
+    class FakeWriter:
+        def __init__(self):
+            self.transport = FakeTransport()
+            self.frames = []
+
+        def write(self, data):
+            self.frames.append(data)
+
+    server = GameServer(keyframe_interval=1000, max_client_buffer=100, seed=1)
+    room = Room(1, 5, 5, 1, seed=1)
+    server.rooms[1] = room
+    client = Client(FakeWriter())
+    room.clients.add(client)
+    client.room = room
+    room.started = True
+
+    # 버퍼가 가득 찬 채로 벽에 부딪혀 게임 오버 KEYFRAME을 놓칩니다.
+    client.writer.transport.buffered = 1000
+    while not room.game_state.game_over:
+        server.step()
+    assert client.needs_keyframe and not client.writer.frames
+
+    # 끝난 방은 더 진행하지 않지만, 버퍼가 빠지면 마지막 상태를 보냅니다.
+    server.step()
+    assert not client.writer.frames
+    client.writer.transport.buffered = 0
+    tick = room.game_state.tick
+    server.step()
+    server.step()
+    assert room.game_state.tick == tick and not client.needs_keyframe
+    assert client.writer.frames == [protocol.encode_keyframe(1, room.game_state)]
+
+
+def test_logic_thread_publishes_immutable_snapshots():
+    import time
+    from game_logic.game_state import HEAD_ADDED, TAIL_REMOVED
+    from logic_thread import LogicThread
+    from replay import ReplayRecorder
+
+    game_state = GameState(rows=8, cols=8, max_apples=2, seed=3)
+    recorder = ReplayRecorder(3, {"rows": 8, "cols": 8})
+    published = []
+    logic = LogicThread(game_state, 0.001, recorder=recorder)
+    logic.on_publish = lambda: published.append(logic.latest())
+    first = logic.latest()
+    first_body = list(first.snake.body)
+
+    logic.push_input((1, 0))  # 아래로 내려가 벽에 부딪힐 때까지 진행합니다.
+    logic.set_active(True)
+    deadline = time.perf_counter() + 5
+    while not logic.latest().is_over() and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    logic.stop()
+
+    final = logic.latest()
+    assert final.is_over() and final is published[-1]
+    assert [s.seq for s in published] == list(range(2, len(published) + 2))
+    # 스냅샷은 복사본이므로 이후 틱이 진행되어도 바뀌지 않습니다.
+    assert list(first.snake.body) == first_body and first.grid is not game_state.grid
+    assert final.grid.cells == game_state.grid.cells
+    assert list(final.snake.body) == list(game_state.snake.body)
+
+    # 스냅샷들의 변경 피드를 이어 붙이면 모든 틱의 이동이 빠짐없이 들어 있습니다.
+    events = [event for s in published for event in s.changes]
+    heads = [value for kind, value in events if kind == HEAD_ADDED]
+    assert len(heads) == final.tick - 1 and all(d == (1, 0) for _, d in heads)
+    assert sum(kind == TAIL_REMOVED for kind, _ in events) == len(heads)
+    assert recorder.inputs == [(0, (1, 0))]
+    assert len(logic.jitter.deviations) == final.tick - 1
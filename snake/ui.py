@@ -1,6 +1,7 @@
 import pygame
 from typing import Tuple, Callable
 import config
+from surface_cache import render_text
 
 
 class Button:
@@ -34,6 +35,9 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.is_hovered = False  # 마우스가 버튼 위에 있는지 여부
+        # 마지막으로 렌더링한 텍스트와 그 Surface (텍스트가 바뀔 때만 다시 렌더링합니다)
+        self._rendered_text = None
+        self._text_surf = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
@@ -60,6 +64,8 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=8)
 
         # 2. 버튼 텍스트 그리기 (중앙 정렬)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        if self.text != self._rendered_text:
+            self._text_surf = render_text(self.font, self.text, self.text_color)
+            self._rendered_text = self.text
+        text_rect = self._text_surf.get_rect(center=self.rect.center)
+        screen.blit(self._text_surf, text_rect)
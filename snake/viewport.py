@@ -0,0 +1,166 @@
+"""
+창보다 큰 맵(카메라 모드)을 그리기 위한 카메라와 미니맵입니다.
+
+Camera는 화면에 보이는 칸 영역(뷰포트)의 위치를 관리하며, 머리가 가장자리 여백(margin) 안으로 들어오면
+필요한 만큼만 움직입니다. 렌더러는 뷰포트 안의 칸만 그리므로 프레임 비용은 맵 크기가 아니라 뷰포트 크기에 비례합니다.
+
+Minimap은 맵을 block x block 크기의 블록으로 축소한 점유 버퍼(블록별 몸통/사과 칸 수)를 가지고 있으며,
+GameState의 변경 피드로 바뀐 블록의 픽셀만 갱신합니다. 맵 전체를 훑는 것은 리셋/복원 때뿐입니다.
+"""
+from array import array
+from typing import List, Tuple
+
+import pygame
+
+import config
+from game_logic.game_state import HEAD_ADDED, TAIL_REMOVED, APPLE_SPAWNED, APPLE_EATEN
+from game_logic.grid import OccupancyGrid, BODY, APPLE
+
+
+class Camera:
+    """
+    맵 위에서 뷰포트의 왼쪽 위 칸 (row, col)을 관리합니다. 뷰포트는 항상 맵 안에 있도록 고정됩니다.
+    """
+    def __init__(self, map_rows: int, map_cols: int, view_rows: int, view_cols: int, margin: int):
+        """
+        :param map_rows: 맵의 세로 칸 수
+        :param map_cols: 맵의 가로 칸 수
+        :param view_rows: 화면에 보이는 세로 칸 수
+        :param view_cols: 화면에 보이는 가로 칸 수
+        :param margin: 머리와 화면 가장자리 사이에 유지할 최소 칸 수
+        """
+        self.map_rows = map_rows
+        self.map_cols = map_cols
+        self.view_rows = view_rows
+        self.view_cols = view_cols
+        # 여백이 뷰포트의 절반을 넘으면 머리가 있을 수 있는 영역이 사라지므로 줄입니다.
+        self.margin_rows = max(0, min(margin, (view_rows - 1) // 2))
+        self.margin_cols = max(0, min(margin, (view_cols - 1) // 2))
+        self.row = 0
+        self.col = 0
+
+    def center_on(self, pos: Tuple[int, int]):
+        """pos가 뷰포트 중앙에 오도록 카메라를 옮깁니다."""
+        self.row = self._clamp(pos[0] - self.view_rows // 2, self.map_rows - self.view_rows)
+        self.col = self._clamp(pos[1] - self.view_cols // 2, self.map_cols - self.view_cols)
+
+    def target(self, head: Tuple[int, int]) -> Tuple[int, int]:
+        """머리를 여백 안쪽에 두기 위해 카메라가 있어야 할 위치를 계산합니다. (카메라는 움직이지 않습니다)"""
+        return (
+            self._follow_axis(head[0], self.row, self.view_rows, self.margin_rows, self.map_rows),
+            self._follow_axis(head[1], self.col, self.view_cols, self.margin_cols, self.map_cols),
+        )
+
+    def follow(self, head: Tuple[int, int]) -> bool:
+        """
+        머리를 따라 카메라를 옮깁니다.
+        :return: 카메라가 움직였는지 여부 (움직였다면 뷰포트 전체를 다시 그려야 합니다)
+        """
+        row, col = self.target(head)
+        moved = row != self.row or col != self.col
+        self.row, self.col = row, col
+        return moved
+
+    def contains(self, pos: Tuple[int, int]) -> bool:
+        """pos가 현재 뷰포트 안에 있는지 확인합니다."""
+        return 0 <= pos[0] - self.row < self.view_rows and 0 <= pos[1] - self.col < self.view_cols
+
+    @staticmethod
+    def _follow_axis(head: int, start: int, view: int, margin: int, size: int) -> int:
+        if head < start + margin:
+            start = head - margin
+        elif head >= start + view - margin:
+            start = head - view + margin + 1
+        return Camera._clamp(start, size - view)
+
+    @staticmethod
+    def _clamp(start: int, limit: int) -> int:
+        return max(0, min(start, limit))
+
+
+class Minimap:
+    """
+    맵 전체를 축소해 보여주는 미니맵입니다.
+    블록마다 몸통/사과 칸 수를 세어 두고, 개수가 0이 되거나 0에서 늘어난 블록의 픽셀만 다시 칠합니다.
+    """
+    def __init__(self, map_rows: int, map_cols: int, max_size: int = config.MINIMAP_MAX_SIZE):
+        """
+        :param max_size: 미니맵 한 변의 최대 픽셀 수 (블록 하나가 1픽셀)
+        """
+        self.map_rows = map_rows
+        self.map_cols = map_cols
+        self.block = max(1, -(-max(map_rows, map_cols) // max_size))
+        self.rows = -(-map_rows // self.block)
+        self.cols = -(-map_cols // self.block)
+        # 축소된 점유 버퍼: 블록 인덱스 -> 그 블록 안의 몸통/사과 칸 수
+        self.body_counts = array("I", bytes(4 * self.rows * self.cols))
+        self.apple_counts = array("I", bytes(4 * self.rows * self.cols))
+        self.surface = pygame.Surface((self.cols, self.rows)).convert()
+        self.surface.fill(config.MINIMAP_BG_COLOR)
+
+    def rebuild(self, grid: OccupancyGrid):
+        """점유 그리드 전체를 훑어 블록별 개수와 픽셀을 다시 만듭니다. (리셋/복원 때만 사용)"""
+        body_counts, apple_counts = self.body_counts, self.apple_counts
+        for i in range(len(body_counts)):
+            body_counts[i] = 0
+            apple_counts[i] = 0
+        block, cols = self.block, grid.cols
+        cells = grid.cells
+        for r in range(grid.rows):
+            row = cells[r * cols:(r + 1) * cols]
+            if row.count(0) == cols:
+                continue  # 빈 행은 건너뜁니다. (거대 맵은 대부분의 행이 비어 있습니다)
+            base = (r // block) * self.cols
+            for c, tag in enumerate(row):
+                if tag == BODY:
+                    body_counts[base + c // block] += 1
+                elif tag == APPLE:
+                    apple_counts[base + c // block] += 1
+
+        self.surface.fill(config.MINIMAP_BG_COLOR)
+        for i in range(len(body_counts)):
+            if body_counts[i] or apple_counts[i]:
+                self._paint(i)
+
+    def apply(self, changes: List[Tuple[str, object]]):
+        """변경 피드의 이벤트만큼 블록별 개수를 갱신합니다. (리셋/복원 이벤트는 rebuild로 처리해야 합니다)"""
+        for kind, value in changes:
+            if kind == HEAD_ADDED:
+                self._add(self.body_counts, value[0], 1)
+            elif kind == TAIL_REMOVED:
+                self._add(self.body_counts, value, -1)
+            elif kind == APPLE_SPAWNED:
+                self._add(self.apple_counts, value, 1)
+            elif kind == APPLE_EATEN:
+                self._add(self.apple_counts, value, -1)
+
+    def view_rect(self, camera: Camera) -> pygame.Rect:
+        """미니맵 좌표계에서 카메라 뷰포트가 차지하는 영역입니다."""
+        block = self.block
+        return pygame.Rect(
+            camera.col // block,
+            camera.row // block,
+            max(1, -(-camera.view_cols // block)),
+            max(1, -(-camera.view_rows // block)),
+        )
+
+    def cell_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """맵 칸 좌표를 미니맵 픽셀 좌표 (x, y)로 변환합니다."""
+        return pos[1] // self.block, pos[0] // self.block
+
+    def _add(self, counts: array, pos: Tuple[int, int], delta: int):
+        i = (pos[0] // self.block) * self.cols + pos[1] // self.block
+        before = counts[i]
+        counts[i] = before + delta
+        # 블록이 비었다가 채워지거나, 채워졌다가 비었을 때만 색이 바뀔 수 있습니다.
+        if before == 0 or before + delta == 0:
+            self._paint(i)
+
+    def _paint(self, i: int):
+        if self.apple_counts[i]:
+            color = config.APPLE_COLOR
+        elif self.body_counts[i]:
+            color = config.SNAKE_BODY_COLOR
+        else:
+            color = config.MINIMAP_BG_COLOR
+        self.surface.set_at((i % self.cols, i // self.cols), color)